@@ -0,0 +1,96 @@
+"""
+Замер холодного старта пакетного планировщика.
+
+Каждый замер — новый процесс интерпретатора, который импортирует
+transport, создает компанию с небольшим набором клиентов и транспорта и
+один раз распределяет грузы. Из времени процесса вычитается время пустого
+запуска интерпретатора, поэтому результат — цена импорта пакета и первого
+планирования. Медиана замеров сравнивается с целевым значением; при
+превышении скрипт завершается с кодом 1.
+
+Запуск из корня репозитория:
+    python benchmarks/cold_start.py [--runs 7] [--target-ms 120]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Целевое время холодного старта (медиана, без запуска интерпретатора), мс
+TARGET_MS = 120.0
+
+PLANNER_SNIPPET = """
+import contextlib, io
+from transport import Client, Ship, TransportCompany, Van
+company = TransportCompany("Замер")
+for i in range(20):
+    company.add_client(Client(f"Клиент {i}", 100 + 37 * i, i % 5 == 0))
+for i in range(4):
+    company.add_vehicle(Van(1.5, i % 2 == 0))
+company.add_vehicle(Ship(5.0, "Замер"))
+with contextlib.redirect_stdout(io.StringIO()):
+    company.optimize_cargo_distribution()
+"""
+
+
+def _measure(code: str, runs: int) -> List[float]:
+    """
+    Время выполнения кода в новых процессах
+
+    Args:
+        code (str): Код для python -c
+        runs (int): Число замеров
+
+    Returns:
+        List[float]: Время каждого замера в миллисекундах
+    """
+    environment = dict(os.environ, PYTHONPATH=ROOT)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=environment,
+                       check=True, stdout=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> int:
+    """
+    Замер и сравнение с целевым значением
+
+    Returns:
+        int: Код завершения (0 — в пределах цели, 1 — превышение)
+    """
+    parser = argparse.ArgumentParser(description="Холодный старт пакетного планировщика")
+    parser.add_argument("--runs", type=int, default=7, help="число замеров (по умолчанию 7)")
+    parser.add_argument("--target-ms", type=float, default=TARGET_MS,
+                        help=f"целевая медиана, мс (по умолчанию {TARGET_MS:.0f})")
+    arguments = parser.parse_args()
+    if arguments.runs < 1:
+        parser.error("число замеров должно быть положительным")
+
+    # Первый запуск компилирует модули в __pycache__ и в замеры не входит
+    _measure(PLANNER_SNIPPET, 1)
+
+    interpreter = statistics.median(_measure("pass", arguments.runs))
+    package = statistics.median(_measure("import transport", arguments.runs)) - interpreter
+    planner = statistics.median(_measure(PLANNER_SNIPPET, arguments.runs)) - interpreter
+
+    print(f"Запуск интерпретатора: {interpreter:.1f} мс")
+    print(f"import transport: {package:.1f} мс")
+    print(f"Импорт и первое планирование: {planner:.1f} мс (цель: {arguments.target_ms:.0f} мс)")
+    if planner > arguments.target_ms:
+        print("Превышено целевое время холодного старта")
+        return 1
+    print("В пределах цели")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
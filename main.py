@@ -3,6 +3,11 @@ from transport.vehicle import Vehicle
 from transport.van import Van
 from transport.ship import Ship
 from transport.transport_company import TransportCompany
+from transport.planning import FleetView, evaluate_scenarios, plan
+from transport.bounds import analyze
+from transport.compatibility import ROAD
+from transport.reports import pages
+from transport.units import grams_to_kg, grams_to_tons, tons_to_grams
 
 
 def display_header(title: str):
@@ -12,6 +17,46 @@ def display_header(title: str):
     print("="*60)
 
 
+def print_paged(lines, page_size: int = 40):
+    """
+    Постраничный вывод строк отчета (строки формируются по мере показа)
+    
+    Args:
+        lines: Итератор строк
+        page_size (int, optional): Строк на странице. По умолчанию 40.
+    """
+    for number, page in enumerate(pages(lines, page_size)):
+        if number and input("\nEnter - следующая страница, q - закончить: ").strip().lower() == "q":
+            return
+        print("\n".join(page))
+
+
+def input_optional_number(prompt: str, number_type=float):
+    """
+    Запрос необязательного положительного числа (пустой ввод — значение не задано)
+    
+    Args:
+        prompt (str): Текст запроса
+        number_type: Тип числа (float или int)
+        
+    Returns:
+        Число или None
+    """
+    while True:
+        value = input(prompt).strip()
+        if not value:
+            return None
+        try:
+            number = number_type(value)
+        except ValueError:
+            print("Ошибка: введите число или оставьте поле пустым.")
+            continue
+        if number <= 0:
+            print("Ошибка: значение должно быть положительным.")
+            continue
+        return number
+
+
 def create_client_interactive():
     """
     Интерактивное создание клиента с запросом данных у пользователя
@@ -53,8 +98,37 @@ def create_client_interactive():
         else:
             print("Пожалуйста, ответьте 'да' или 'нет'.")
     
+    # Запрос требований к перевозке
+    while True:
+        refrigeration_input = input("Груз требует холодильника? (да/нет): ").strip().lower()
+        if refrigeration_input in ['да', 'д', 'yes', 'y']:
+            needs_refrigeration = True
+            break
+        elif refrigeration_input in ['нет', 'н', 'no', 'n']:
+            needs_refrigeration = False
+            break
+        else:
+            print("Пожалуйста, ответьте 'да' или 'нет'.")
+    
+    modes = {"1": "any", "2": "road", "3": "sea"}
+    while True:
+        mode_input = input("Вид перевозки (1 - любой, 2 - только наземный, 3 - только морской): ").strip()
+        if mode_input in modes:
+            transport_mode = modes[mode_input]
+            break
+        print("Пожалуйста, выберите 1, 2 или 3.")
+    
+    # Необязательные габариты груза
+    volume = input_optional_number("Объем груза в м³ (Enter - не задан): ")
+    pallets = input_optional_number("Число паллет (Enter - не задано): ", int)
+    
+    # Необязательное окно времени (часы от начала дня)
+    ready_time = input_optional_number("Час готовности груза (Enter - готов сразу): ")
+    deadline = input_optional_number("Срок доставки, час (Enter - без срока): ")
+    
     try:
-        client = Client(name, cargo_weight, is_vip)
+        client = Client(name, cargo_weight, is_vip, needs_refrigeration, transport_mode, volume, pallets,
+                        ready_time, deadline)
         display_header("КЛИЕНТ УСПЕШНО СОЗДАН!")
         print(f"Имя: {client.name}")
         print(f"Вес груза: {client.cargo_weight:.2f} кг")
@@ -86,8 +160,10 @@ def create_vehicle_interactive():
         except ValueError:
             print("Ошибка: грузоподъемность должна быть числом.")
     
+    dispatch_cost = input_optional_number("Стоимость рейса (Enter - не задана): ")
+    
     try:
-        vehicle = Vehicle(capacity)
+        vehicle = Vehicle(capacity, dispatch_cost=dispatch_cost)
         display_header("ТРАНСПОРТ УСПЕШНО СОЗДАН!")
         print(f"ID транспорта: {vehicle.vehicle_id}")
         print(f"Грузоподъемность: {vehicle.capacity:.2f} тонн")
@@ -128,8 +204,13 @@ def create_van_interactive():
         else:
             print("Пожалуйста, ответьте 'да' или 'нет'.")
     
+    # Необязательные ограничения по объему и паллетоместам
+    volume_capacity = input_optional_number("Вместимость по объему в м³ (Enter - не ограничена): ")
+    pallet_slots = input_optional_number("Число паллетомест (Enter - не ограничено): ", int)
+    dispatch_cost = input_optional_number("Стоимость рейса (Enter - не задана): ")
+    
     try:
-        van = Van(capacity, is_refrigerated)
+        van = Van(capacity, is_refrigerated, volume_capacity, pallet_slots, dispatch_cost)
         display_header("ФУРГОН УСПЕШНО СОЗДАН!")
         print(f"ID фургона: {van.vehicle_id}")
         print(f"Грузоподъемность: {van.capacity:.2f} тонн")
@@ -166,8 +247,10 @@ def create_ship_interactive():
             continue
         break
     
+    dispatch_cost = input_optional_number("Стоимость рейса (Enter - не задана): ")
+    
     try:
-        ship = Ship(capacity, name)
+        ship = Ship(capacity, name, dispatch_cost=dispatch_cost)
         display_header("СУДНО УСПЕШНО СОЗДАН!")
         print(f"ID судна: {ship.vehicle_id}")
         print(f"Название: {ship.name}")
@@ -203,8 +286,15 @@ def create_company_interactive():
         return None
 
 
-def manage_clients_menu(clients):
-    """Меню управления клиентами"""
+def manage_clients_menu(clients, company=None):
+    """
+    Меню управления клиентами
+    
+    Args:
+        clients: Список клиентов
+        company (TransportCompany, optional): Компания-владелец списка; если задана,
+            новые клиенты добавляются через нее, чтобы обновлялись ее снимки
+    """
     while True:
         display_header(f"УПРАВЛЕНИЕ КЛИЕНТАМИ ({len(clients)} клиентов)")
         
@@ -220,7 +310,10 @@ def manage_clients_menu(clients):
         if choice == "1":
             client = create_client_interactive()
             if client:
-                clients.append(client)
+                if company is not None:
+                    company.add_client(client)
+                else:
+                    clients.append(client)
                 print(f"\nКлиент '{client.name}' добавлен. Всего клиентов: {len(clients)}")
         
         elif choice == "2":
@@ -228,6 +321,12 @@ def manage_clients_menu(clients):
                 print("\nСписок клиентов пуст.")
                 continue
             
+            if company is not None:
+                # Отчет компании строится по строкам и выводится по страницам
+                print()
+                print_paged(company.iter_clients_report())
+                continue
+            
             display_header(f"СПИСОК КЛИЕНТОВ ({len(clients)})")
             
             vip_clients = [c for c in clients if c.is_vip]
@@ -259,6 +358,21 @@ def manage_clients_menu(clients):
                     client = clients[idx]
                     display_header(f"ИЗМЕНЕНИЕ КЛИЕНТА: {client.name}")
                     
+                    # Изменение имени
+                    change_name = input("Изменить имя? (да/нет): ").strip().lower()
+                    if change_name in ['да', 'д', 'yes', 'y']:
+                        new_name = input("Новое имя: ").strip()
+                        if company is not None:
+                            company.rename_client(client.name, new_name)
+                        elif any(c is not client and c.name.lower() == new_name.lower() for c in clients):
+                            print(f"Клиент с именем '{new_name}' уже существует.")
+                        else:
+                            try:
+                                client.rename(new_name)
+                                print(f"Имя изменено на '{client.name}'")
+                            except (TypeError, ValueError) as e:
+                                print(f"Ошибка: {e}")
+                    
                     # Изменение веса груза
                     change_weight = input("Изменить вес груза? (да/нет): ").strip().lower()
                     if change_weight in ['да', 'д', 'yes', 'y']:
@@ -298,24 +412,43 @@ def manage_clients_menu(clients):
                 continue
             
             search_name = input("Введите имя клиента для поиска: ").strip().lower()
-            found_clients = [c for c in clients if search_name in c.name.lower()]
+            if company is not None:
+                # Поиск по индексу имен; при опечатке находятся похожие имена
+                found_clients = company.search_clients(search_name)
+            else:
+                found_clients = [c for c in clients if search_name in c.name.lower()]
             
             if not found_clients:
                 print(f"\nКлиенты с именем '{search_name}' не найдены.")
             else:
-                display_header(f"НАЙДЕНО КЛИЕНТОВ: {len(found_clients)}")
+                if search_name in found_clients[0].name.lower():
+                    display_header(f"НАЙДЕНО КЛИЕНТОВ: {len(found_clients)}")
+                else:
+                    display_header(f"ТОЧНЫХ СОВПАДЕНИЙ НЕТ, ПОХОЖИЕ КЛИЕНТЫ: {len(found_clients)}")
                 for i, client in enumerate(found_clients, 1):
                     print(f"\n{i}. {client.get_info()}")
+                    if company is not None:
+                        placements = company.locate(client.name)
+                        if placements:
+                            print("   Загружен в: " + ", ".join(
+                                f"{vehicle.vehicle_id} ({weight:.2f} кг)" for vehicle, weight in placements))
         
         elif choice == "5":
             if not clients:
                 print("\nНет данных для статистики.")
                 continue
             
-            total_clients = len(clients)
-            vip_count = sum(1 for c in clients if c.is_vip)
+            if company is not None:
+                # Сводные показатели компании поддерживаются при каждом изменении
+                totals = company.totals()
+                total_clients = totals.clients_count
+                vip_count = totals.vip_count
+                total_weight = grams_to_kg(totals.clients_weight_g)
+            else:
+                total_clients = len(clients)
+                vip_count = sum(1 for c in clients if c.is_vip)
+                total_weight = sum(c.cargo_weight for c in clients)
             regular_count = total_clients - vip_count
-            total_weight = sum(c.cargo_weight for c in clients)
             avg_weight = total_weight / total_clients if total_clients > 0 else 0
             
             display_header("СТАТИСТИКА КЛИЕНТОВ")
@@ -338,8 +471,16 @@ def manage_clients_menu(clients):
             print("\nНеверный выбор. Пожалуйста, выберите действие от 1 до 6.")
 
 
-def manage_vehicles_menu(vehicles, clients=None):
-    """Меню управления транспортными средствами"""
+def manage_vehicles_menu(vehicles, clients=None, company=None):
+    """
+    Меню управления транспортными средствами
+    
+    Args:
+        vehicles: Список транспортных средств
+        clients: Список клиентов для загрузки
+        company (TransportCompany, optional): Компания-владелец списка; если задана,
+            новый транспорт добавляется через нее, чтобы обновлялись ее снимки
+    """
     while True:
         display_header(f"УПРАВЛЕНИЕ ТРАНСПОРТОМ ({len(vehicles)} единиц)")
         
@@ -354,20 +495,19 @@ def manage_vehicles_menu(vehicles, clients=None):
         
         choice = input("\nВыберите действие (1-8): ").strip()
         
-        if choice == "1":
-            vehicle = create_vehicle_interactive()
+        if choice in ("1", "2", "3"):
+            if choice == "1":
+                vehicle = create_vehicle_interactive()
+            elif choice == "2":
+                vehicle = create_van_interactive()
+            else:
+                vehicle = create_ship_interactive()
+            
             if vehicle:
-                vehicles.append(vehicle)
-        
-        elif choice == "2":
-            van = create_van_interactive()
-            if van:
-                vehicles.append(van)
-        
-        elif choice == "3":
-            ship = create_ship_interactive()
-            if ship:
-                vehicles.append(ship)
+                if company is not None:
+                    company.add_vehicle(vehicle)
+                else:
+                    vehicles.append(vehicle)
         
         elif choice == "4":
             if not vehicles:
@@ -435,6 +575,13 @@ def manage_vehicles_menu(vehicles, clients=None):
                 print("\nНет транспортных средств.")
                 continue
             
+            if company is not None:
+                # Компания знает, где лежит груз клиента: транспорт выбирать не нужно
+                client_name = input("\nИмя клиента (Enter - выбрать транспорт): ").strip()
+                if client_name:
+                    company.unload(client_name)
+                    continue
+            
             # Выбор транспорта с загруженными клиентами
             vehicles_with_load = [v for v in vehicles if v.clients_list]
             if not vehicles_with_load:
@@ -474,19 +621,26 @@ def manage_vehicles_menu(vehicles, clients=None):
                 print("\nНет данных для статистики.")
                 continue
             
-            total_vehicles = len(vehicles)
-            vans = [v for v in vehicles if isinstance(v, Van)]
-            ships = [v for v in vehicles if isinstance(v, Ship)]
-            others = total_vehicles - len(vans) - len(ships)
-            
-            total_capacity = sum(v.capacity for v in vehicles)
-            total_load = sum(v.current_load for v in vehicles)
-            total_available = sum(v.get_available_capacity() for v in vehicles)
+            if company is not None:
+                # Сводные показатели компании поддерживаются при каждом изменении
+                totals = company.totals()
+                total_vehicles = totals.vehicles_count
+                vans_count, ships_count, others = totals.vans_count, totals.ships_count, totals.others_count
+                total_capacity = grams_to_tons(totals.capacity_g)
+                total_load = grams_to_tons(totals.load_g)
+            else:
+                total_vehicles = len(vehicles)
+                vans_count = sum(1 for v in vehicles if isinstance(v, Van))
+                ships_count = sum(1 for v in vehicles if isinstance(v, Ship))
+                others = total_vehicles - vans_count - ships_count
+                total_capacity = sum(v.capacity for v in vehicles)
+                total_load = sum(v.current_load for v in vehicles)
+            total_available = total_capacity - total_load
             
             display_header("СТАТИСТИКА ТРАНСПОРТА")
             print(f"Всего единиц транспорта: {total_vehicles}")
-            print(f"Фургонов: {len(vans)}")
-            print(f"Судов: {len(ships)}")
+            print(f"Фургонов: {vans_count}")
+            print(f"Судов: {ships_count}")
             print(f"Других транспортных средств: {others}")
             print(f"\nОбщая грузоподъемность: {total_capacity:.2f} тонн")
             print(f"Общая загрузка: {total_load:.2f} тонн")
@@ -528,10 +682,10 @@ def manage_company_operations(company):
         choice = input("\nВыберите действие (1-6): ").strip()
         
         if choice == "1":
-            manage_clients_menu(company.clients)
+            manage_clients_menu(company.clients, company)
         
         elif choice == "2":
-            manage_vehicles_menu(company.vehicles, company.clients)
+            manage_vehicles_menu(company.vehicles, company.clients, company)
         
         elif choice == "3":
             if not company.clients:
@@ -547,20 +701,40 @@ def manage_company_operations(company):
             print("1. Стандартная (VIP в первую очередь)")
             print("2. Минимизация транспорта")
             print("3. Сбалансированная загрузка")
+            print("4. Стандартная с разделением крупных грузов")
+            print("5. Минимизация стоимости рейсов")
+            print("6. Расписание нескольких рейсов на день")
             
-            strategy = input("\nСтратегия (1-3): ").strip()
+            strategy = input("\nСтратегия (1-6): ").strip()
             
             if strategy == "1":
                 print("\nИспользуется стандартная стратегия...")
                 company.optimize_cargo_distribution()
+            elif strategy == "4":
+                print("\nГрузы, не помещающиеся целиком, будут разделены между транспортом...")
+                company.optimize_cargo_distribution(split=True)
             elif strategy == "2":
-                print("\nМинимизация количества транспорта...")
-                # Здесь можно добавить специальную логику
-                company.optimize_cargo_distribution()
+                print("\nМинимизация количества транспорта (гонка стратегий)...")
+                # Гонка стратегий (процессы) загружается только при выборе
+                from transport.portfolio import solve_portfolio
+                result = solve_portfolio(company, time_budget=2.0)
+                company.apply_plan(result.assignment, result.clients, result.vehicles)
+                
+                _, unloaded_weight, vehicles_used, spread = result.score
+                print(f"\nЛучшая стратегия: {result.strategy}")
+                print(f"Использовано транспорта: {vehicles_used} из {len(company.vehicles)}")
+                print(f"Разброс загрузки: {spread:.1f}%")
+                if unloaded_weight > 0:
+                    print(f"Не распределено груза: {grams_to_kg(unloaded_weight):.2f} кг")
             elif strategy == "3":
                 print("\nСбалансированная загрузка транспорта...")
-                # Здесь можно добавить специальную логику
-                company.optimize_cargo_distribution()
+                company.optimize_cargo_distribution(balanced=True)
+            elif strategy == "5":
+                print("\nМинимизация суммарной стоимости рейсов...")
+                company.optimize_cargo_distribution(minimize_cost=True)
+            elif strategy == "6":
+                trip_duration = input_optional_number("Длительность рейса в часах (Enter - 2): ") or 2.0
+                company.schedule_day(trip_duration)
             else:
                 print("Используется стандартная стратегия...")
                 company.optimize_cargo_distribution()
@@ -570,9 +744,10 @@ def manage_company_operations(company):
             print(company.get_statistics())
             
             # Дополнительная статистика
-            if company.clients and company.vehicles:
-                total_cargo = sum(c.cargo_weight for c in company.clients) / 1000  # в тоннах
-                total_capacity = sum(v.capacity for v in company.vehicles)
+            totals = company.totals()
+            if totals.clients_count and totals.vehicles_count:
+                total_cargo = grams_to_tons(totals.clients_weight_g)
+                total_capacity = grams_to_tons(totals.capacity_g)
                 
                 print(f"\n{'='*50}")
                 print("АНАЛИЗ ЗАГРУЗКИ:")
@@ -609,14 +784,14 @@ def manage_company_operations(company):
                     
                     if vehicle.clients_list:
                         print("   Загруженные клиенты:")
-                        for client in vehicle.clients_list:
+                        for client, weight in vehicle.get_loaded_cargo():
                             vip = "★" if client.is_vip else "○"
-                            print(f"     {vip} {client.name}: {client.cargo_weight:.2f} кг")
+                            print(f"     {vip} {client.name}: {weight:.2f} кг")
             
             # Общая статистика распределения
             total_vehicles_used = len(vehicles_with_load)
             total_clients_loaded = sum(len(v.clients_list) for v in vehicles_with_load)
-            total_weight_loaded = sum(sum(c.cargo_weight for c in v.clients_list) for v in vehicles_with_load) / 1000
+            total_weight_loaded = sum(v.current_load for v in vehicles_with_load)
             
             print(f"\n{'='*50}")
             print("ИТОГИ РАСПРЕДЕЛЕНИЯ:")
@@ -667,9 +842,10 @@ def main():
             print("3. Просмотреть все компании")
             print("4. Импортировать клиентов в компанию")
             print("5. Импортировать транспорт в компанию")
-            print("6. Вернуться в главное меню")
+            print("6. Распределить грузы во всех компаниях (параллельно)")
+            print("7. Вернуться в главное меню")
             
-            sub_choice = input("\nВыберите действие (1-6): ").strip()
+            sub_choice = input("\nВыберите действие (1-7): ").strip()
             
             if sub_choice == "1":
                 company = create_company_interactive()
@@ -768,6 +944,21 @@ def main():
                     
                 except ValueError:
                     print("Ошибка: введите номер.")
+            
+            elif sub_choice == "6":
+                if not companies:
+                    print("\nНет созданных компаний.")
+                    continue
+                
+                display_header("ПАРАЛЛЕЛЬНОЕ РАСПРЕДЕЛЕНИЕ ГРУЗОВ")
+                from transport.parallel_planner import plan_companies
+                distributions = plan_companies(companies)
+                
+                for company, distribution in zip(companies, distributions):
+                    loaded_clients = sum(len(items) for items in distribution.values())
+                    print(f"\n{company.name}:")
+                    print(f"   Использовано транспорта: {len(distribution)} из {len(company.vehicles)}")
+                    print(f"   Загружено клиентов: {loaded_clients} из {len(company.clients)}")
         
         elif choice == "4":
             display_header("БЫСТРАЯ ОПТИМИЗАЦИЯ РАСПРЕДЕЛЕНИЯ")
@@ -780,27 +971,55 @@ def main():
                 print("❌ Нет транспортных средств.")
                 continue
             
-            # Создаем временную компанию для распределения
-            temp_company = TransportCompany("Временная оптимизация")
+            # План строится по легковесному представлению: загрузка транспорта не меняется
+            view = FleetView.from_objects(global_clients, global_vehicles)
             
-            # Добавляем всех клиентов и транспорт
-            for client in global_clients:
-                temp_company.add_client(client)
+            print(f"\n📊 Для распределения:")
+            print(f"   Клиентов: {len(view.weights)}")
+            print(f"   Транспорта: {len(view.capacities)}")
+            print(f"   Общий вес грузов: {grams_to_kg(sum(view.weights))/1000:.2f} тонн")
+            print(f"   Общая грузоподъемность: {grams_to_kg(sum(view.capacities))/1000:.2f} тонн")
             
-            for vehicle in global_vehicles:
-                temp_company.add_vehicle(vehicle)
+            report = analyze(view.weights, view.vip_flags, view.requirements,
+                             view.capacities, view.capabilities)
+            print(f"   Нужно транспорта не менее: {report.min_vehicles}")
+            if report.shortfall:
+                print(f"   ⚠️  Нехватка грузоподъемности: не менее {grams_to_kg(report.shortfall):.2f} кг")
+            if report.impossible:
+                print(f"   ⚠️  Не поместятся ни в один подходящий транспорт: {len(report.impossible)} клиент(ов)")
+                for i in report.impossible[:10]:
+                    print(f"      - {view.client_names[i]}: {grams_to_kg(view.weights[i]):.2f} кг")
+            if len(report.impossible) == len(view.weights):
+                print("\n❌ Ни один груз не помещается в доступный транспорт — план не строится.")
+                continue
             
-            print(f"\n📊 Для распределения:")
-            print(f"   Клиентов: {len(temp_company.clients)}")
-            print(f"   Транспорта: {len(temp_company.vehicles)}")
-            print(f"   Общий вес грузов: {sum(c.cargo_weight for c in temp_company.clients)/1000:.2f} тонн")
-            print(f"   Общая грузоподъемность: {sum(v.capacity for v in temp_company.vehicles):.2f} тонн")
-            
-            confirm = input("\nНачать распределение? (да/нет): ").strip().lower()
-            if confirm in ['да', 'д', 'yes', 'y']:
-                temp_company.optimize_cargo_distribution()
-            else:
+            confirm = input("\nПостроить план распределения? (да/нет): ").strip().lower()
+            if confirm not in ['да', 'д', 'yes', 'y']:
                 print("Распределение отменено.")
+                continue
+            
+            result = plan(view)
+            for vehicle_id, load in zip(view.vehicle_ids, result.loads):
+                if load:
+                    print(f"   🚚 {vehicle_id}: {grams_to_kg(load):.2f} кг")
+            unloaded = result.unloaded()
+            print(f"\nИспользовано транспорта: {result.vehicles_used()} из {len(view.capacities)}")
+            if unloaded:
+                print(f"Не загружено клиентов: {len(unloaded)} "
+                      f"({grams_to_kg(sum(view.weights[i] for i in unloaded)):.2f} кг)")
+            print("ℹ️  Это план: загрузка транспорта не изменена.")
+            
+            # Сценарий «что если»: дополнительные фургоны
+            extra = input_optional_number("\nСколько фургонов добавить для сравнения (Enter - пропустить): ", int)
+            if extra:
+                extra_capacity = input_optional_number("Грузоподъемность фургона в тоннах (Enter - 5): ") or 5.0
+                scenario = evaluate_scenarios(view, {"extra": ([(tons_to_grams(extra_capacity), ROAD)] * extra, [])})
+                extended = scenario["extra"]
+                extended_unloaded = extended.unloaded()
+                print(f"\nС {extra} доп. фургонами: использовано транспорта "
+                      f"{extended.vehicles_used()} из {len(view.capacities) + extra}, "
+                      f"не загружено клиентов: {len(extended_unloaded)} "
+                      f"({grams_to_kg(sum(view.weights[i] for i in extended_unloaded)):.2f} кг)")
         
         elif choice == "5":
             display_header("ЭКСПОРТ ДАННЫХ")
@@ -840,12 +1059,19 @@ def main():
                 else:
                     print("\nРАСПРЕДЕЛЕНИЕ ГРУЗОВ:")
                     for company in companies:
-                        print(f"\nКомпания: {company.name}")
-                        for vehicle in company.vehicles:
-                            if vehicle.clients_list:
+                        # Экспортируем согласованный снимок, а не живые списки
+                        snapshot = company.snapshot()
+                        loads = {}
+                        for client, placements in snapshot.assignments():
+                            for vehicle_id, weight in placements:
+                                loads.setdefault(vehicle_id, []).append((client, weight))
+                        
+                        print(f"\nКомпания: {snapshot.name}")
+                        for vehicle in snapshot.vehicles():
+                            if vehicle.vehicle_id in loads:
                                 print(f"  Транспорт {vehicle.vehicle_id}:")
-                                for client in vehicle.clients_list:
-                                    print(f"    - {client.name}: {client.cargo_weight:.2f} кг")
+                                for client, weight in loads[vehicle.vehicle_id]:
+                                    print(f"    - {client.name}: {weight:.2f} кг")
             
             elif export_choice == "4":
                 continue
@@ -1,113 +1,28 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import json
 import os
 import sys
+import threading
 
 # Добавляем текущую директорию в путь для импорта
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, current_dir)
 
 # Импортируем наши классы
-try:
-    from transport.client import Client
-    from transport.vehicle import Vehicle
-    from transport.van import Van
-    from transport.ship import Ship
-    from transport.transport_company import TransportCompany
-    IMPORT_SUCCESS = True
-except ImportError as e:
-    print(f"Внимание: {e}")
-    print("Используются заглушки для классов")
-    IMPORT_SUCCESS = False
-    
-    # Создаем заглушки для классов
-    class Client:
-        def __init__(self, name, cargo_weight, is_vip=False):
-            self.name = name
-            self.cargo_weight = cargo_weight
-            self.is_vip = is_vip
-        
-        def update_cargo_weight(self, weight):
-            self.cargo_weight = weight
-    
-    class Vehicle:
-        def __init__(self, capacity):
-            self.vehicle_id = f"V{hash(str(capacity)) % 10000:04d}"
-            self.capacity = capacity
-            self.current_load = 0.0
-            self.clients_list = []
-        
-        def get_current_load_percentage(self):
-            return (self.current_load / self.capacity * 100) if self.capacity > 0 else 0
-        
-        def load_cargo(self, client):
-            weight_tons = client.cargo_weight / 1000
-            if self.current_load + weight_tons <= self.capacity:
-                self.current_load += weight_tons
-                self.clients_list.append(client)
-                return True
-            return False
-    
-    class Van(Vehicle):
-        def __init__(self, capacity, is_refrigerated=False):
-            super().__init__(capacity)
-            self.is_refrigerated = is_refrigerated
-            self.vehicle_type = "Фургон"
-    
-    class Ship(Vehicle):
-        def __init__(self, capacity, name):
-            super().__init__(capacity)
-            self.name = name
-            self.vehicle_type = "Судно"
-    
-    class TransportCompany:
-        def __init__(self, name):
-            self.name = name
-            self.vehicles = []
-            self.clients = []
-        
-        def add_vehicle(self, vehicle):
-            self.vehicles.append(vehicle)
-            return True
-        
-        def add_client(self, client):
-            self.clients.append(client)
-            return True
-        
-        def remove_vehicle(self, vehicle_id):
-            for i, v in enumerate(self.vehicles):
-                if v.vehicle_id == vehicle_id:
-                    self.vehicles.pop(i)
-                    return True
-            return False
-        
-        def remove_client(self, client_name):
-            for i, c in enumerate(self.clients):
-                if c.name == client_name:
-                    self.clients.pop(i)
-                    return True
-            return False
-        
-        def optimize_cargo_distribution(self):
-            # Простая логика распределения
-            for vehicle in self.vehicles:
-                vehicle.current_load = 0.0
-                vehicle.clients_list = []
-            
-            # Сортируем клиентов: VIP в первую очередь
-            sorted_clients = sorted(self.clients, key=lambda c: (not c.is_vip, -c.cargo_weight))
-            
-            distribution = {}
-            for client in sorted_clients:
-                for vehicle in self.vehicles:
-                    if vehicle.load_cargo(client):
-                        if vehicle.vehicle_id not in distribution:
-                            distribution[vehicle.vehicle_id] = []
-                        distribution[vehicle.vehicle_id].append(client)
-                        break
-            
-            return distribution
+from transport.client import Client
+from transport.vehicle import Vehicle
+from transport.van import Van
+from transport.ship import Ship
+from transport.transport_company import TransportCompany
+from transport.validation import build_clients, build_vehicles
+from transport.events import (CargoLoaded, CargoUnloaded, ClientAdded, ClientChanged,
+                              ClientRemoved, CompanyCleared, VehicleAdded, VehicleChanged,
+                              VehicleRemoved)
+from transport.history import History
+
+
+# Глубина истории отмены (число шагов)
+HISTORY_DEPTH = 100
 
 
 class TransportCompanyGUI:
@@ -119,18 +34,33 @@ class TransportCompanyGUI:
         self.root.geometry("1100x700")
         
         # Инициализация данных
-        self.company = TransportCompany("Моя транспортная компания")
+        # Потокобезопасный режим: оптимизация идет в фоновом потоке,
+        # пока пользователь продолжает работать с данными
+        self.company = TransportCompany("Моя транспортная компания", thread_safe=True)
         self.current_data_file = None
         self.selected_client = None
         self.selected_vehicle = None
+        self._found_clients = {}   # строка таблицы -> клиент (в режиме поиска)
+        self.optimization_thread = None
+        self.optimization_result = None
+        
+        # Таблицы обновляются по событиям компании: события копятся (в том
+        # числе из потока оптимизации) и применяются одним обновлением
+        self._pending_events = []
+        self._events_lock = threading.Lock()
+        self._refresh_scheduled = False
         
         # Создание интерфейса
         self.create_menu()
         self.create_main_frame()
         self.create_status_bar()
         
-        # Загрузка тестовых данных (для демонстрации)
-        self.load_sample_data()
+        # История отмены хранит разности изменений, а не копии компании
+        self.company.events.subscribe(self.on_company_events)
+        self.history = History(self.company, depth=HISTORY_DEPTH)
+        
+        # Загрузка тестовых данных (для демонстрации) — после первой отрисовки окна
+        self.root.after_idle(self.load_sample_data)
     
     def create_menu(self):
         """Создание меню"""
@@ -145,6 +75,14 @@ class TransportCompanyGUI:
         file_menu.add_separator()
         file_menu.add_command(label="Выход", command=self.root.quit)
         
+        # Меню "Правка"
+        edit_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Правка", menu=edit_menu)
+        edit_menu.add_command(label="Отменить", command=self.undo, accelerator="Ctrl+Z")
+        edit_menu.add_command(label="Повторить", command=self.redo, accelerator="Ctrl+Y")
+        self.root.bind("<Control-z>", lambda e: self.undo())
+        self.root.bind("<Control-y>", lambda e: self.redo())
+        
         # Меню "Экспорт"
         export_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Экспорт", menu=export_menu)
@@ -197,6 +135,14 @@ class TransportCompanyGUI:
     
     def create_clients_table(self, parent):
         """Создание таблицы клиентов"""
+        # Строка поиска: таблица фильтруется по индексу имен при каждом вводе
+        search_frame = ttk.Frame(parent)
+        search_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(5, 5))
+        ttk.Label(search_frame, text="Поиск:").pack(side=tk.LEFT, padx=(0, 5))
+        self.client_search_var = tk.StringVar()
+        self.client_search_var.trace_add("write", lambda *args: self.update_clients_table())
+        ttk.Entry(search_frame, textvariable=self.client_search_var, width=40).pack(side=tk.LEFT)
+        
         # Заголовки таблицы
         columns = ("№", "Имя", "Вес груза (кг)", "VIP статус")
         
@@ -215,8 +161,8 @@ class TransportCompanyGUI:
         self.clients_tree.configure(yscrollcommand=scrollbar.set)
         
         # Размещение элементов
-        self.clients_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.clients_tree.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
         
         # Привязка событий
         self.clients_tree.bind("<Double-1>", self.on_client_double_click)
@@ -224,7 +170,7 @@ class TransportCompanyGUI:
         
         # Настройка весов
         parent.columnconfigure(0, weight=1)
-        parent.rowconfigure(0, weight=1)
+        parent.rowconfigure(1, weight=1)
     
     def create_vehicles_table(self, parent):
         """Создание таблицы транспорта"""
@@ -296,24 +242,77 @@ class TransportCompanyGUI:
         except:
             pass
         
-        # Обновление таблиц
-        self.update_clients_table()
-        self.update_vehicles_table()
+        # Таблицы обновятся по событиям добавления; демонстрационные данные
+        # в историю отмены не попадают
+        self.history.clear()
+    
+    def on_company_events(self, events):
+        """Получение пакета событий компании (в потоке, изменившем компанию)"""
+        with self._events_lock:
+            self._pending_events.extend(events)
+            # Из потока оптимизации окно не трогаем: события применит check_optimization
+            if self._refresh_scheduled or threading.current_thread() is not threading.main_thread():
+                return
+            self._refresh_scheduled = True
+        self.root.after_idle(self.refresh_views)
+    
+    def refresh_views(self):
+        """Обновление таблиц по накопленным событиям компании"""
+        with self._events_lock:
+            events, self._pending_events = self._pending_events, []
+            self._refresh_scheduled = False
+        if not events:
+            return
+        
+        if any(isinstance(event, (ClientAdded, ClientRemoved, ClientChanged, CompanyCleared))
+               for event in events):
+            self.update_clients_table()
+        
+        # Добавление, удаление и изменение транспорта перестраивает таблицу, а
+        # загрузка и выгрузка меняют только строки затронутого транспорта
+        if any(isinstance(event, (VehicleAdded, VehicleRemoved, VehicleChanged, CompanyCleared))
+               for event in events):
+            self.update_vehicles_table()
+            return
+        changed = {event.vehicle.vehicle_id: event.vehicle for event in events
+                   if isinstance(event, (CargoLoaded, CargoUnloaded))}
+        for vehicle_id, vehicle in changed.items():
+            if self.vehicles_tree.exists(vehicle_id):
+                self.vehicles_tree.set(vehicle_id, "Текущая загрузка (т)", f"{vehicle.current_load:.3f}")
+                self.vehicles_tree.set(vehicle_id, "Загрузка %",
+                                       f"{vehicle.get_current_load_percentage():.1f}%")
     
     def update_clients_table(self):
         """Обновление таблицы клиентов"""
         # Очистка таблицы
         for item in self.clients_tree.get_children():
             self.clients_tree.delete(item)
+        self._found_clients = {}
+        
+        # При заданном запросе показываются только найденные клиенты;
+        # в колонке "№" — номер в результатах поиска, а сам клиент
+        # запоминается за строкой (номер в полном списке ищется только при выборе)
+        query = self.client_search_var.get().strip()
+        if query:
+            found = self.company.search_clients(query, limit=200)
+            for position, client in enumerate(found, 1):
+                vip_text = "★ VIP" if client.is_vip else "○ Обычный"
+                item = self.clients_tree.insert("", tk.END, values=(
+                    position, client.name, f"{client.cargo_weight:.2f}", vip_text
+                ))
+                self._found_clients[item] = client
+            self.status_var.set(f"Найдено клиентов: {len(found)}")
+            return
         
-        # Заполнение данными
-        for i, client in enumerate(self.company.clients, 1):
+        # Заполнение данными из снимка (оптимизация в фоне его не изменит)
+        snapshot = self.company.snapshot()
+        for i, client in enumerate(snapshot.clients(), 1):
             vip_text = "★ VIP" if client.is_vip else "○ Обычный"
             self.clients_tree.insert("", tk.END, values=(
                 i, client.name, f"{client.cargo_weight:.2f}", vip_text
             ))
         
-        self.status_var.set(f"Клиентов: {len(self.company.clients)}")
+        self.status_var.set(f"Клиентов: {snapshot.clients_count}")
     
     def update_vehicles_table(self):
         """Обновление таблицы транспорта"""
@@ -321,23 +320,20 @@ class TransportCompanyGUI:
         for item in self.vehicles_tree.get_children():
             self.vehicles_tree.delete(item)
         
-        # Заполнение данными
-        for i, vehicle in enumerate(self.company.vehicles, 1):
+        # Заполнение данными из снимка (оптимизация в фоне его не изменит)
+        snapshot = self.company.snapshot()
+        for i, vehicle in enumerate(snapshot.vehicles(), 1):
             # Определение типа транспорта и деталей
-            if hasattr(vehicle, 'vehicle_type'):
-                vehicle_type = vehicle.vehicle_type
-                if vehicle_type == "Фургон":
-                    details = f"Холодильник: {'Да' if vehicle.is_refrigerated else 'Нет'}"
-                elif vehicle_type == "Судно":
-                    details = f"Название: {vehicle.name}"
-                else:
-                    details = "Базовый транспорт"
+            vehicle_type = vehicle.vehicle_type
+            if vehicle.kind == "van":
+                details = f"Холодильник: {'Да' if vehicle.is_refrigerated else 'Нет'}"
+            elif vehicle.kind == "ship":
+                details = f"Название: {vehicle.name}"
             else:
-                vehicle_type = "Транспорт"
-                details = ""
+                details = "Базовый транспорт"
             
-            # Вставка строки
-            self.vehicles_tree.insert("", tk.END, values=(
+            # Вставка строки (ID строки — ID транспорта, для обновления по событиям)
+            self.vehicles_tree.insert("", tk.END, iid=vehicle.vehicle_id, values=(
                 i,
                 vehicle.vehicle_id,
                 vehicle_type,
@@ -347,7 +343,7 @@ class TransportCompanyGUI:
                 details
             ))
         
-        self.status_var.set(f"Транспортных средств: {len(self.company.vehicles)}")
+        self.status_var.set(f"Транспортных средств: {snapshot.vehicles_count}")
     
     def add_client_dialog(self, client_index=None):
         """Диалог добавления/редактирования клиента"""
@@ -416,9 +412,15 @@ class TransportCompanyGUI:
                 if client_index is not None:
                     # Редактирование существующего клиента
                     client = self.company.clients[client_index]
-                    client.name = name
+                    if name != client.name and not self.company.rename_client(client.name, name):
+                        messagebox.showerror("Ошибка", f"Не удалось переименовать клиента в '{name}'")
+                        name_entry.focus()
+                        return
                     client.update_cargo_weight(weight)
-                    client.is_vip = vip_var.get()
+                    if vip_var.get():
+                        client.upgrade_to_vip()
+                    else:
+                        client.downgrade_from_vip()
                     message = f"Клиент '{name}' обновлен"
                 else:
                     # Добавление нового клиента
@@ -426,7 +428,6 @@ class TransportCompanyGUI:
                     self.company.add_client(client)
                     message = f"Клиент '{name}' добавлен"
                 
-                self.update_clients_table()
                 dialog.destroy()
                 messagebox.showinfo("Успех", message)
                 
@@ -564,7 +565,6 @@ class TransportCompanyGUI:
                     self.company.remove_vehicle(old_id)
                 
                 self.company.add_vehicle(vehicle)
-                self.update_vehicles_table()
                 
                 dialog.destroy()
                 message = "Транспорт обновлен" if vehicle_index is not None else "Транспорт добавлен"
@@ -596,18 +596,41 @@ class TransportCompanyGUI:
             messagebox.showwarning("Внимание", "Нет транспортных средств")
             return
         
+        if self.optimization_thread is not None and self.optimization_thread.is_alive():
+            messagebox.showinfo("Информация", "Распределение грузов уже выполняется")
+            return
+        
+        # Выполняем распределение в фоновом потоке, чтобы окно не зависало
+        self.status_var.set("Идет распределение грузов...")
+        self.optimization_result = None
+        self.optimization_thread = threading.Thread(target=self.run_optimization, daemon=True)
+        self.optimization_thread.start()
+        self.root.after(100, self.check_optimization)
+    
+    def run_optimization(self):
+        """Распределение грузов (выполняется в фоновом потоке)"""
         try:
-            # Выполняем распределение
-            distribution = self.company.optimize_cargo_distribution()
-            
-            # Обновляем таблицу транспорта
-            self.update_vehicles_table()
-            
-            # Показываем результаты
-            self.show_distribution_results(distribution)
-            
+            self.optimization_result = (True, self.company.optimize_cargo_distribution())
         except Exception as e:
-            messagebox.showerror("Ошибка", f"Ошибка при распределении грузов: {str(e)}")
+            self.optimization_result = (False, e)
+    
+    def check_optimization(self):
+        """Проверка завершения фонового распределения (в потоке интерфейса)"""
+        if self.optimization_thread.is_alive():
+            self.root.after(100, self.check_optimization)
+            return
+        
+        success, result = self.optimization_result
+        if not success:
+            self.status_var.set("Ошибка распределения")
+            messagebox.showerror("Ошибка", f"Ошибка при распределении грузов: {str(result)}")
+            return
+        
+        # Применяем события загрузки, накопленные потоком оптимизации
+        self.refresh_views()
+        
+        # Показываем результаты
+        self.show_distribution_results(result)
     
     def show_distribution_results(self, distribution):
         """Показать результаты распределения"""
@@ -643,7 +666,7 @@ class TransportCompanyGUI:
         # Заполнение данными
         for vehicle in self.company.vehicles:
             if vehicle.clients_list:
-                total_weight = sum(client.cargo_weight for client in vehicle.clients_list)
+                total_weight = vehicle.current_load * 1000
                 load_percentage = vehicle.get_current_load_percentage()
                 
                 vehicle_type = getattr(vehicle, 'vehicle_type', 'Транспорт')
@@ -674,6 +697,8 @@ class TransportCompanyGUI:
     
     def save_distribution_results(self):
         """Сохранение результатов распределения"""
+        import json
+        
         try:
             filename = filedialog.asksaveasfilename(
                 defaultextension=".json",
@@ -750,24 +775,27 @@ class TransportCompanyGUI:
     
     def export_to_json(self, filename):
         """Экспорт в JSON"""
+        import json
+        
+        snapshot = self.company.snapshot()
         data = {
-            "company": self.company.name,
+            "company": snapshot.name,
             "clients": [
                 {
                     "name": client.name,
                     "cargo_weight": client.cargo_weight,
                     "is_vip": client.is_vip
                 }
-                for client in self.company.clients
+                for client in snapshot.clients()
             ],
             "vehicles": [
                 {
                     "id": vehicle.vehicle_id,
-                    "type": getattr(vehicle, 'vehicle_type', 'Транспорт'),
+                    "type": vehicle.vehicle_type,
                     "capacity": vehicle.capacity,
                     "current_load": vehicle.current_load
                 }
-                for vehicle in self.company.vehicles
+                for vehicle in snapshot.vehicles()
             ]
         }
         
@@ -776,31 +804,33 @@ class TransportCompanyGUI:
     
     def export_to_txt(self, filename):
         """Экспорт в TXT"""
+        snapshot = self.company.snapshot()
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write(f"ТРАНСПОРТНАЯ КОМПАНИЯ: {self.company.name}\n")
+            f.write(f"ТРАНСПОРТНАЯ КОМПАНИЯ: {snapshot.name}\n")
             f.write("=" * 50 + "\n\n")
             
             f.write("КЛИЕНТЫ:\n")
             f.write("-" * 30 + "\n")
-            for client in self.company.clients:
+            for client in snapshot.clients():
                 vip = "VIP" if client.is_vip else "Обычный"
                 f.write(f"{client.name}: {client.cargo_weight:.2f} кг ({vip})\n")
             
             f.write("\n\nТРАНСПОРТ:\n")
             f.write("-" * 30 + "\n")
-            for vehicle in self.company.vehicles:
+            for vehicle in snapshot.vehicles():
                 f.write(f"{vehicle.vehicle_id}: {vehicle.capacity:.2f} т, загрузка: {vehicle.current_load:.2f} т\n")
     
     def export_to_csv(self, filename):
         """Экспорт в CSV"""
         import csv
         
+        snapshot = self.company.snapshot()
         with open(filename, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             
             # Заголовки для клиентов
             writer.writerow(["Тип данных", "Имя", "Вес (кг)", "VIP"])
-            for client in self.company.clients:
+            for client in snapshot.clients():
                 writer.writerow(["Клиент", client.name, client.cargo_weight, "Да" if client.is_vip else "Нет"])
             
             # Пустая строка
@@ -808,17 +838,19 @@ class TransportCompanyGUI:
             
             # Заголовки для транспорта
             writer.writerow(["Тип данных", "ID", "Тип", "Грузоподъемность (т)", "Текущая загрузка (т)"])
-            for vehicle in self.company.vehicles:
+            for vehicle in snapshot.vehicles():
                 writer.writerow([
                     "Транспорт",
                     vehicle.vehicle_id,
-                    getattr(vehicle, 'vehicle_type', 'Транспорт'),
+                    vehicle.vehicle_type,
                     vehicle.capacity,
                     vehicle.current_load
                 ])
     
     def save_data(self):
         """Сохранение данных в файл"""
+        import json
+        
         try:
             filename = filedialog.asksaveasfilename(
                 defaultextension=".json",
@@ -833,7 +865,13 @@ class TransportCompanyGUI:
                         {
                             "name": client.name,
                             "cargo_weight": client.cargo_weight,
-                            "is_vip": client.is_vip
+                            "is_vip": client.is_vip,
+                            "needs_refrigeration": client.needs_refrigeration,
+                            "transport_mode": client.transport_mode,
+                            "volume": client.volume,
+                            "pallets": client.pallets,
+                            "ready_time": client.ready_time,
+                            "deadline": client.deadline
                         }
                         for client in self.company.clients
                     ],
@@ -845,7 +883,10 @@ class TransportCompanyGUI:
                         "type": vehicle.__class__.__name__,
                         "capacity": vehicle.capacity,
                         "current_load": vehicle.current_load,
-                        "vehicle_id": vehicle.vehicle_id
+                        "vehicle_id": vehicle.vehicle_id,
+                        "volume_capacity": vehicle.volume_capacity,
+                        "pallet_slots": vehicle.pallet_slots,
+                        "dispatch_cost": vehicle.dispatch_cost
                     }
                     
                     if isinstance(vehicle, Van):
@@ -866,6 +907,8 @@ class TransportCompanyGUI:
     
     def load_data(self):
         """Загрузка данных из файла"""
+        import json
+        
         try:
             filename = filedialog.askopenfilename(
                 filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
@@ -876,48 +919,37 @@ class TransportCompanyGUI:
                 with open(filename, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                 
-                # Очищаем текущие данные
-                self.company.clients.clear()
-                self.company.vehicles.clear()
+                # Загрузка файла — один пакет событий и один шаг истории отмены
+                with self.company.events.batch():
+                    # Очищаем текущие данные
+                    self.company.clear()
                 
-                # Загружаем клиентов
-                for client_data in data.get("clients", []):
-                    try:
-                        client = Client(
-                            client_data["name"],
-                            client_data["cargo_weight"],
-                            client_data.get("is_vip", False)
-                        )
-                        self.company.clients.append(client)
-                    except:
-                        print(f"Ошибка при загрузке клиента: {client_data}")
+                    # Записи проверяются пакетом: все ошибки файла собираются за один
+                    # проход, а корректные объекты создаются без повторной проверки
+                    clients, client_issues = build_clients(data.get("clients", []))
+                    vehicle_rows = data.get("vehicles", [])
+                    for vehicle_data in vehicle_rows:
+                        if isinstance(vehicle_data, dict) and vehicle_data.get("type") == "Ship":
+                            vehicle_data.setdefault("name", "Судно")
+                    vehicles, vehicle_issues = build_vehicles(vehicle_rows)
                 
-                # Загружаем транспорт
-                for vehicle_data in data.get("vehicles", []):
-                    try:
-                        if vehicle_data["type"] == "Van":
-                            vehicle = Van(
-                                vehicle_data["capacity"],
-                                vehicle_data.get("is_refrigerated", False)
-                            )
-                        elif vehicle_data["type"] == "Ship":
-                            vehicle = Ship(
-                                vehicle_data["capacity"],
-                                vehicle_data.get("name", "Судно")
-                            )
-                        else:
-                            vehicle = Vehicle(vehicle_data["capacity"])
-                        
-                        vehicle.vehicle_id = vehicle_data.get("vehicle_id", vehicle.vehicle_id)
-                        vehicle.current_load = vehicle_data.get("current_load", 0.0)
-                        
-                        self.company.vehicles.append(vehicle)
-                    except:
-                        print(f"Ошибка при загрузке транспорта: {vehicle_data}")
+                    # Загружаем клиентов
+                    for issue in client_issues:
+                        print(f"Ошибка при загрузке клиента {issue.row + 1}: {issue.message}")
+                    for client in clients:
+                        self.company.add_client(client)
+                
+                    # Загружаем транспорт
+                    for issue in vehicle_issues:
+                        print(f"Ошибка при загрузке транспорта {issue.row + 1}: {issue.message}")
+                    valid_rows = sorted(set(range(len(vehicle_rows)))
+                                        - {issue.row for issue in vehicle_issues})
+                    for row, vehicle in zip(valid_rows, vehicles):
+                        vehicle.current_load = vehicle_rows[row].get("current_load", 0.0)
+                        self.company.add_vehicle(vehicle)
                 
                 self.current_data_file = filename
-                self.update_clients_table()
-                self.update_vehicles_table()
+                self.refresh_views()
                 messagebox.showinfo("Успех", f"Данные загружены из файла:\n{filename}")
                 
         except Exception as e:
@@ -943,13 +975,23 @@ class TransportCompanyGUI:
         
         messagebox.showinfo("О программе", about_text)
     
+    def _client_row_index(self, item):
+        """Индекс клиента строки таблицы в списке компании (None — клиента уже нет)"""
+        client = self._found_clients.get(item)
+        if client is None:
+            index = int(self.clients_tree.item(item, "values")[0]) - 1
+            return index if index < len(self.company.clients) else None
+        try:
+            return self.company.clients.index(client)
+        except ValueError:
+            return None
+    
     def on_client_double_click(self, event):
         """Обработка двойного клика по клиенту"""
         selection = self.clients_tree.selection()
         if selection:
-            item = selection[0]
-            index = self.clients_tree.index(item)
-            if index < len(self.company.clients):
+            index = self._client_row_index(selection[0])
+            if index is not None:
                 self.add_client_dialog(index)
     
     def on_vehicle_double_click(self, event):
@@ -965,8 +1007,7 @@ class TransportCompanyGUI:
         """Обработка выбора клиента"""
         selection = self.clients_tree.selection()
         if selection:
-            item = selection[0]
-            self.selected_client = self.clients_tree.index(item)
+            self.selected_client = self._client_row_index(selection[0])
         else:
             self.selected_client = None
     
@@ -985,27 +1026,50 @@ class TransportCompanyGUI:
             client = self.company.clients[self.selected_client]
             if messagebox.askyesno("Подтверждение", f"Удалить клиента '{client.name}'?"):
                 self.company.remove_client(client.name)
-                self.update_clients_table()
                 self.selected_client = None
         
         elif self.selected_vehicle is not None:
             vehicle = self.company.vehicles[self.selected_vehicle]
             if messagebox.askyesno("Подтверждение", f"Удалить транспорт '{vehicle.vehicle_id}'?"):
                 self.company.remove_vehicle(vehicle.vehicle_id)
-                self.update_vehicles_table()
                 self.selected_vehicle = None
         
         else:
             messagebox.showinfo("Информация", "Не выбран элемент для удаления")
     
+    def undo(self):
+        """Отмена последнего действия"""
+        self._replay_history(forward=False)
+    
+    def redo(self):
+        """Повтор отмененного действия"""
+        self._replay_history(forward=True)
+    
+    def _replay_history(self, forward):
+        """Отмена или повтор шага истории с обновлением таблиц"""
+        if self.optimization_thread is not None and self.optimization_thread.is_alive():
+            messagebox.showinfo("Информация", "Дождитесь завершения распределения грузов")
+            return
+        label = self.history.redo_label if forward else self.history.undo_label
+        if label is None:
+            self.status_var.set("Нет действий для повтора" if forward else "Нет действий для отмены")
+            return
+        done = self.history.redo() if forward else self.history.undo()
+        self.refresh_views()
+        if done:
+            self.status_var.set(f"{'Повторено' if forward else 'Отменено'}: {label}")
+        else:
+            action = "повторить" if forward else "отменить"
+            self.status_var.set(f"Не удалось {action}: {label}")
+            messagebox.showwarning("Предупреждение",
+                                   f"Не удалось {action}: {label}. Грузы не помещаются в транспорт.")
+    
     def clear_all(self):
         """Очистка всех данных"""
         if messagebox.askyesno("Подтверждение", "Очистить все данные?"):
-            self.company.clients.clear()
-            self.company.vehicles.clear()
-            self.update_clients_table()
-            self.update_vehicles_table()
-            self.status_var.set("Все данные очищены")
+            self.company.clear()
+            self.refresh_views()
+            self.status_var.set("Все данные очищены (Ctrl+Z — отменить)")
 
 
 def main():
@@ -0,0 +1,6 @@
+"""Общие настройки тестов: пакет transport импортируется из корня репозитория"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,76 @@
+"""Тесты нижних оценок и предварительной проверки выполнимости"""
+
+import itertools
+import random
+
+from transport import bounds, compatibility, packing
+from transport.compatibility import REFRIGERATED, ROAD, SEA
+
+
+def _optimal_bins(weights, capacity):
+    """Наименьшее число одинакового транспорта полным перебором"""
+    for count in range(1, len(weights) + 1):
+        for assignment in itertools.product(range(count), repeat=len(weights)):
+            loads = [0] * count
+            for weight, j in zip(weights, assignment):
+                loads[j] += weight
+            if max(loads) <= capacity:
+                return count
+    return 0
+
+
+def test_l2_bound_beats_l1_on_large_items():
+    # По сумме хватает двух, но никакие два груза вместе не помещаются
+    assert packing.vehicles_lower_bound([600, 600, 600], [1000] * 3) == 2
+    assert bounds.l2_bound([600, 600, 600], 1000) == 3
+    assert bounds.l2_bound([], 1000) == 0
+
+
+def test_l2_bound_never_exceeds_optimum():
+    rng = random.Random(11)
+    for _ in range(60):
+        weights = [rng.randint(1, 1000) for _ in range(rng.randint(1, 6))]
+        assert bounds.l2_bound(weights, 1000) <= _optimal_bins(weights, 1000)
+
+
+def test_analyze_finds_impossible_clients_and_shortfall():
+    weights = [500, 500, 700, 2000]
+    requirements = [ROAD, ROAD, REFRIGERATED, SEA]
+    report = bounds.analyze(weights, [False, True, False, True], requirements,
+                            [800, 900], [ROAD, ROAD])
+
+    # Холодильника и судна нет; 1000 г дорожного груза в 1700 г помещаются
+    assert report.impossible == [2, 3]
+    assert report.shortfall == 0
+    assert report.min_vehicles == 2
+    assert report.unloaded_bound == 2700
+    assert report.vip_unloaded_bound == 2000
+    assert not report.is_feasible()
+
+    short = bounds.analyze([900, 900], [False, False], [0, 0], [1000], [ROAD])
+    assert short.impossible == []
+    assert short.shortfall == 800
+
+
+def test_bounds_hold_for_random_plans():
+    rng = random.Random(12)
+    masks = [0, ROAD, SEA, REFRIGERATED]
+    capabilities_choices = [ROAD, REFRIGERATED | ROAD, SEA]
+    for _ in range(100):
+        n, m = rng.randint(1, 30), rng.randint(1, 6)
+        weights = [rng.randint(1, 1500) for _ in range(n)]
+        vip_flags = [rng.random() < 0.3 for _ in range(n)]
+        requirements = [rng.choice(masks) for _ in range(n)]
+        capacities = [rng.randint(500, 3000) for _ in range(m)]
+        capabilities = [rng.choice(capabilities_choices) for _ in range(m)]
+
+        report = bounds.analyze(weights, vip_flags, requirements, capacities, capabilities)
+        assignment = compatibility.pack_by_class(weights, vip_flags, requirements,
+                                                 capacities, capabilities)
+        score = packing.plan_score(assignment, weights, vip_flags, capacities)
+        assert score[0] >= report.vip_unloaded_bound
+        assert score[1] >= report.unloaded_bound
+        if score[1] == 0:
+            assert score[2] >= report.min_vehicles
+        for i in report.impossible:
+            assert assignment[i] == -1
@@ -0,0 +1,46 @@
+"""Тесты клиента: проверка веса груза"""
+
+import pytest
+
+from transport.client import Client
+from transport.validation import build_clients
+
+
+@pytest.mark.parametrize("weight", [-5.0, 0, 0.0004, 0.0005, 100001, float("inf"), float("nan")])
+def test_cargo_weight_setter_validates(weight):
+    client = Client("Иванов", 100.0)
+    with pytest.raises(ValueError):
+        client.cargo_weight = weight
+    with pytest.raises(ValueError):
+        client.update_cargo_weight(weight)
+    assert client.cargo_weight_g == 100000
+
+
+def test_cargo_weight_setter_rejects_non_numbers():
+    client = Client("Иванов", 100.0)
+    with pytest.raises(TypeError):
+        client.cargo_weight = "500"
+
+
+def test_cargo_weight_setter_stores_grams():
+    client = Client("Иванов", 100.0)
+    client.cargo_weight = 0.0015
+    assert client.cargo_weight_g == 2
+    client.update_cargo_weight(250.5)
+    assert client.cargo_weight_g == 250500
+
+
+def test_weight_below_one_gram_rejected_everywhere():
+    with pytest.raises(ValueError):
+        Client("Иванов", 0.0004)
+    clients, issues = build_clients([{"name": "Иванов", "cargo_weight": 0.0004},
+                                     {"name": "Петров", "cargo_weight": 0.001}])
+    assert [c.name for c in clients] == ["Петров"]
+    assert [(issue.row, issue.field) for issue in issues] == [(0, "cargo_weight")]
+
+
+def test_non_finite_weight_reported_by_batch():
+    clients, issues = build_clients([{"name": "Иванов", "cargo_weight": float("inf")},
+                                     {"name": "Петров", "cargo_weight": float("nan")}])
+    assert clients == []
+    assert [(issue.row, issue.field) for issue in issues] == [(0, "cargo_weight"), (1, "cargo_weight")]
@@ -0,0 +1,90 @@
+"""Тесты индекса клиентов (точный, префиксный, подстрочный и нечеткий поиск)"""
+
+import random
+
+from transport.client import Client
+from transport.client_index import ClientIndex
+from transport.transport_company import TransportCompany
+
+NAMES = ["Иванов", "Иванова", "Петров", "Сидоров", "Ивантеевка", "Смирнов", "Петренко"]
+
+
+def _index():
+    index = ClientIndex()
+    clients = {name: Client(name, 100.0) for name in NAMES}
+    for client in clients.values():
+        index.add(client)
+    return index, clients
+
+
+def _names(found):
+    return [client.name for client in found]
+
+
+def test_get_ignores_case():
+    index, clients = _index()
+    assert index.get(" иВАНОВ ") == [clients["Иванов"]]
+    assert index.get("Нет такого") == []
+
+
+def test_prefix_is_alphabetical_and_limited():
+    index, _ = _index()
+    assert _names(index.prefix("иван")) == ["Иванов", "Иванова", "Ивантеевка"]
+    assert _names(index.prefix("Иван", limit=2)) == ["Иванов", "Иванова"]
+    assert index.prefix("Я") == []
+
+
+def test_contains_uses_trigrams_and_short_text_as_prefix():
+    index, _ = _index()
+    assert _names(index.contains("ров")) == ["Петров", "Сидоров"]
+    assert _names(index.contains("ов")) == []
+    assert _names(index.contains("Пе")) == ["Петренко", "Петров"]
+
+
+def test_fuzzy_finds_typos():
+    index, _ = _index()
+    assert _names(index.fuzzy("Смирнвов"))[0] == "Смирнов"
+    assert _names(index.fuzzy("Петрав"))[0] == "Петров"
+    assert index.fuzzy("Щщщщщ") == []
+
+
+def test_search_orders_prefix_then_contains_then_fuzzy():
+    index, _ = _index()
+    assert _names(index.search("Пет")) == ["Петренко", "Петров"]
+    assert _names(index.search("иванов")) == ["Иванов", "Иванова"]
+    assert _names(index.search("тро"))[:1] == ["Петров"]
+    assert _names(index.search("Сидоров"))[0] == "Сидоров"
+    assert _names(index.search("Сидорв")) == ["Сидоров"]
+
+
+def test_rename_and_remove_update_index():
+    index, clients = _index()
+    client = clients["Петров"]
+    client.rename("Кузнецов")
+    index.update(client)
+    assert index.get("Петров") == []
+    assert index.prefix("Кузн") == [client]
+    index.remove(client)
+    assert index.prefix("Кузн") == [] and len(index) == len(NAMES) - 1
+
+
+def test_contains_matches_linear_scan():
+    rng = random.Random(3)
+    letters = "абвгдеклмнопрст"
+    index, clients = ClientIndex(), []
+    for i in range(300):
+        name = "".join(rng.choice(letters) for _ in range(rng.randint(4, 9))) + str(i)
+        clients.append(Client(name, 10.0))
+        index.add(clients[-1])
+    for query in ("абв", "кор", "ре1", "мно", "ст1"):
+        expected = sorted((c for c in clients if query in c.name.lower()),
+                          key=lambda c: c.name.lower())[:50]
+        assert _names(index.contains(query)) == _names(expected)
+
+
+def test_company_search_after_removal():
+    company = TransportCompany("Тест")
+    for name in NAMES:
+        company.add_client(Client(name, 100.0))
+    company.remove_client("Иванова")
+    assert _names(company.search_clients("Иван")) == ["Иванов", "Ивантеевка"]
@@ -0,0 +1,82 @@
+"""Тесты упаковки по классам совместимости со всеми стратегиями"""
+
+import functools
+import random
+
+import pytest
+
+from transport import compatibility, packing
+from transport.compatibility import REFRIGERATED, ROAD, SEA
+from transport.cost_packing import cost_fit
+from transport.vector_packing import UNLIMITED, vector_first_fit
+
+# Холодильный фургон, обычный фургон, судно и малый фургон
+CAPACITIES = [1000, 1000, 3000, 800]
+CAPABILITIES = [REFRIGERATED | ROAD, ROAD, SEA, ROAD]
+COSTS = [30.0, 10.0, 100.0, 5.0]
+
+# Клиенты: VIP и обычные в разных классах; последний не помещается никуда
+WEIGHTS = [600, 500, 700, 900, 2000, 400, 5000]
+VIP_FLAGS = [True, False, True, False, False, True, False]
+REQUIREMENTS = [REFRIGERATED, REFRIGERATED, 0, ROAD, SEA, SEA, 0]
+
+STRATEGIES = {
+    "first_fit": (packing.first_fit, {}),
+    "best_fit": (packing.best_fit, {}),
+    "worst_fit": (packing.worst_fit, {}),
+    "randomized": (functools.partial(packing.randomized_first_fit, rng=random.Random(1)), {}),
+    "balanced": (packing.balanced_fit, {"vip_first": False, "pass_loads": True}),
+    "cost": (cost_fit, {"costs": COSTS}),
+}
+
+
+def _check(assignment, weights=WEIGHTS):
+    loads = [0] * len(CAPACITIES)
+    for i, j in enumerate(assignment):
+        if j < 0:
+            continue
+        assert compatibility.is_compatible(REQUIREMENTS[i], CAPABILITIES[j]), (i, j)
+        loads[j] += weights[i]
+    assert all(load <= capacity for load, capacity in zip(loads, CAPACITIES))
+    assert assignment[-1] == -1
+    # Грузоподъемности хватает на все VIP-грузы — каждый должен быть загружен
+    assert all(j >= 0 for j, vip in zip(assignment, VIP_FLAGS) if vip)
+
+
+@pytest.mark.parametrize("strategy", sorted(STRATEGIES))
+def test_pack_by_class_respects_classes(strategy):
+    pack, options = STRATEGIES[strategy]
+    assignment = compatibility.pack_by_class(WEIGHTS, VIP_FLAGS, REQUIREMENTS, CAPACITIES,
+                                             CAPABILITIES, pack, **options)
+    _check(assignment)
+    # Холодильный и морской VIP-грузы подходят только к одному транспорту
+    assert assignment[0] == 0 and assignment[5] == 2
+
+
+def test_pack_by_class_vectors():
+    demands = [(weight, 0, 0) for weight in WEIGHTS]
+    capacities = [(capacity, UNLIMITED, UNLIMITED) for capacity in CAPACITIES]
+    assignment = compatibility.pack_by_class(demands, VIP_FLAGS, REQUIREMENTS, capacities,
+                                             CAPABILITIES, vector_first_fit)
+    _check(assignment)
+
+
+def test_vip_class_is_packed_before_ordinary_clients():
+    # Оба груза подходят только к одному транспорту; VIP-груз меньше, но загружается он
+    assignment = compatibility.pack_by_class([900, 700], [False, True], [ROAD, 0], [1000],
+                                             [ROAD])
+    assert assignment == [-1, 0]
+
+
+def test_split_by_class_respects_classes():
+    pieces = compatibility.split_by_class(WEIGHTS, VIP_FLAGS, REQUIREMENTS, CAPACITIES,
+                                          CAPABILITIES)
+    loads = [0] * len(CAPACITIES)
+    for i, parts in enumerate(pieces):
+        for j, part in parts:
+            assert compatibility.is_compatible(REQUIREMENTS[i], CAPABILITIES[j])
+            loads[j] += part
+        assert sum(part for _, part in parts) <= WEIGHTS[i]
+    assert all(load <= capacity for load, capacity in zip(loads, CAPACITIES))
+    assert all(sum(part for _, part in pieces[i]) == WEIGHTS[i]
+               for i, vip in enumerate(VIP_FLAGS) if vip)
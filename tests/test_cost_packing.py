@@ -0,0 +1,62 @@
+"""Тесты упаковки с учетом стоимости рейсов (cost_packing)"""
+
+import contextlib
+import io
+
+from transport import compatibility
+from transport.client import Client
+from transport.compatibility import ROAD
+from transport.cost_packing import cost_fit, plan_cost
+from transport.transport_company import TransportCompany
+from transport.van import Van
+from transport.vehicle import Vehicle
+
+
+def test_cost_fit_prefers_cheap_capacity():
+    assignment = cost_fit([500, 500], [False, False], [1000, 1000], [10.0, 3.0])
+    assert assignment == [1, 1]
+    assert plan_cost(assignment, [10.0, 3.0]) == 3.0
+
+
+def test_cost_fit_zero_capacity_vehicle_is_not_used():
+    assert cost_fit([500], [False], [0, 1000], [1.0, 1.0]) == [1]
+
+
+def test_pack_by_class_does_not_charge_opened_vehicle_twice():
+    # VIP-груз отправляет первый транспорт; обычный груз помещается в его
+    # остаток и не должен открывать второй рейс той же стоимости
+    assignment = compatibility.pack_by_class([1000, 500], [True, False], [0, 0], [2000, 2000],
+                                             [ROAD, ROAD], cost_fit, costs=[10.0, 10.0])
+    assert assignment == [0, 0]
+    assert plan_cost(assignment, [10.0, 10.0]) == 10.0
+
+
+def test_minimize_cost_with_vip_filling_a_vehicle():
+    first, second = Van(1.0), Van(1.0)
+    vip = Client("VIP-клиент", 1000, True)
+    regular = Client("Обычный клиент", 500)
+    company = TransportCompany("Тест")
+    for vehicle in (first, second):
+        company.add_vehicle(vehicle)
+    company.add_client(vip)
+    company.add_client(regular)
+
+    distribution = company.optimize_cargo_distribution(minimize_cost=True, time_limit=0.1)
+
+    assert sorted(weight for cargo in distribution.values() for _, weight in cargo) == [500.0, 1000.0]
+    assert len(distribution) == 2
+
+
+def test_minimize_cost_reports_each_dispatch_once():
+    company = TransportCompany("Тест")
+    company.add_vehicle(Vehicle(2.0, dispatch_cost=10.0))
+    company.add_vehicle(Vehicle(2.0, dispatch_cost=10.0))
+    company.add_client(Client("VIP-клиент", 1000, True))
+    company.add_client(Client("Обычный клиент", 500))
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        distribution = company.optimize_cargo_distribution(minimize_cost=True, time_limit=0.1)
+
+    assert len(distribution) == 1
+    assert "Стоимость рейсов: 10.00" in output.getvalue()
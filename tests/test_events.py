@@ -0,0 +1,103 @@
+"""Тесты шины событий: слабые ссылки на подписчиков и пакетная доставка"""
+
+import gc
+import threading
+
+from transport.client import Client
+from transport.events import ClientAdded, ClientRemoved, EventBus, PlanCompleted
+from transport.transport_company import TransportCompany
+from transport.van import Van
+
+
+class _Window:
+    """Подписчик с методом, как окно интерфейса"""
+
+    def __init__(self, received):
+        self.received = received
+
+    def on_events(self, events):
+        self.received.append(list(events))
+
+
+def test_single_event_is_delivered_as_list():
+    bus, received = EventBus(), []
+    window = _Window(received)
+    bus.subscribe(window.on_events)
+    bus.publish("событие")
+    assert received == [["событие"]]
+
+
+def test_event_type_filter():
+    bus, received = EventBus(), []
+    window = _Window(received)
+    bus.subscribe(window.on_events, int)
+    bus.publish("строка")
+    bus.publish(5)
+    assert received == [[5]]
+
+
+def test_dead_subscriber_is_dropped():
+    bus, received = EventBus(), []
+    window = _Window(received)
+    bus.subscribe(window.on_events)
+    assert len(bus) == 1
+    del window
+    gc.collect()
+    bus.publish("событие")
+    assert received == []
+    assert len(bus) == 0
+
+
+def test_unsubscribe():
+    bus, received = EventBus(), []
+    window = _Window(received)
+    bus.subscribe(window.on_events)
+    bus.unsubscribe(window.on_events)
+    bus.publish("событие")
+    assert received == [] and len(bus) == 0
+
+
+def test_nested_batches_deliver_once_at_outer_exit():
+    bus, received = EventBus(), []
+    window = _Window(received)
+    bus.subscribe(window.on_events)
+    with bus.batch():
+        bus.publish(1)
+        with bus.batch():
+            bus.publish(2)
+        assert received == []
+        bus.publish(3)
+    assert received == [[1, 2, 3]]
+
+
+def test_batches_are_per_thread():
+    bus, received = EventBus(), []
+    window = _Window(received)
+    bus.subscribe(window.on_events)
+    with bus.batch():
+        other = threading.Thread(target=bus.publish, args=("другой поток",))
+        other.start()
+        other.join(5)
+        assert received == [["другой поток"]]
+        bus.publish("этот поток")
+    assert received == [["другой поток"], ["этот поток"]]
+
+
+def test_company_methods_are_single_batches():
+    company, received = TransportCompany("Тест"), []
+    window = _Window(received)
+    company.events.subscribe(window.on_events)
+    company.add_client(Client("Иванов", 300.0))
+    company.add_client(Client("Петров", 200.0))
+    company.add_vehicle(Van(1.0))
+    assert [[type(event) for event in batch] for batch in received[:2]] == [[ClientAdded]] * 2
+
+    received.clear()
+    company.optimize_cargo_distribution()
+    assert len(received) == 1
+    assert isinstance(received[0][-1], PlanCompleted)
+
+    received.clear()
+    company.remove_client("Иванов")
+    assert len(received) == 1
+    assert ClientRemoved in {type(event) for event in received[0]}
@@ -0,0 +1,105 @@
+"""Тесты истории изменений (отмена и повтор)"""
+
+from transport.client import Client
+from transport.history import History
+from transport.transport_company import TransportCompany
+from transport.van import Van
+from transport.vehicle import Vehicle
+
+
+def _state(company):
+    return (sorted(c.name for c in company.clients), [v.vehicle_id for v in company.vehicles],
+            {v.vehicle_id: sorted((c.name, w) for c, w in v.get_loaded_cargo())
+             for v in company.vehicles})
+
+
+def _company():
+    company = TransportCompany("Тест")
+    company.add_client(Client("Иванов", 400.0))
+    company.add_client(Client("Петров", 300.0, True))
+    company.add_vehicle(Van(0.5))
+    company.add_vehicle(Vehicle(0.5))
+    return company
+
+
+def test_undo_redo_plan_round_trip():
+    company = _company()
+    history = History(company)
+    before = _state(company)
+    company.optimize_cargo_distribution()
+    after = _state(company)
+    assert history.undo_label == "распределение грузов"
+
+    assert history.undo()
+    assert _state(company) == before
+    assert history.redo()
+    assert _state(company) == after
+    assert history.can_undo and not history.can_redo
+
+
+def test_undo_redo_clear_and_records():
+    company = _company()
+    company.optimize_cargo_distribution()
+    history = History(company)
+    planned = _state(company)
+
+    company.clear()
+    assert history.undo()
+    assert _state(company) == planned
+    assert history.redo()
+    assert not company.clients and not company.vehicles
+    assert history.undo()
+
+    company.remove_client("Иванов")
+    assert not history.can_redo
+    assert history.undo()
+    assert _state(company) == planned
+
+
+def test_depth_drops_oldest_steps():
+    company = TransportCompany("Тест")
+    history = History(company, depth=2)
+    for i in range(4):
+        company.add_client(Client(f"Клиент {i}", 100.0))
+    assert history.undo() and history.undo()
+    assert not history.undo()
+    assert [c.name for c in company.clients] == ["Клиент 0", "Клиент 1"]
+
+
+def test_failed_redo_keeps_step_and_company():
+    company = TransportCompany("Тест")
+    client = Client("Иванов", 400.0)
+    company.add_client(client)
+    history = History(company)
+    van = Van(1.0)
+    with company.events.batch():
+        company.add_vehicle(van)
+        van.load_cargo(client)
+    assert history.undo()
+    assert not company.vehicles
+
+    van.capacity = 0.3
+    before = _state(company)
+    assert not history.redo()
+    # Добавление транспорта откатано, шаг остался в стеке повтора
+    assert _state(company) == before
+    assert not van.get_loaded_cargo()
+    assert history.can_redo and not history.can_undo
+
+    van.capacity = 1.0
+    assert history.redo()
+    assert [c.name for c, _ in van.get_loaded_cargo()] == ["Иванов"]
+
+
+def test_failed_undo_restores_assignment():
+    company = _company()
+    history = History(company)
+    company.optimize_cargo_distribution()
+    company.unload("Иванов")
+    planned = _state(company)
+    for vehicle in company.vehicles:
+        vehicle.capacity = 0.1
+
+    assert not history.undo()
+    assert _state(company) == planned
+    assert history.undo_label == "изменение загрузки"
@@ -0,0 +1,35 @@
+"""Тесты выдачи идентификаторов транспорта"""
+
+import pytest
+
+from transport.id_allocator import IdAllocator
+
+
+def test_allocate_formats_prefix_shard_and_counter():
+    assert IdAllocator().allocate() == "00000001"
+    assert IdAllocator("V", shard=3, start=42).allocate() == "V3-0000002a"
+
+
+def test_number_parses_own_identifiers_only():
+    allocator = IdAllocator("V", shard=3)
+    assert allocator.number("V3-0000002a") == 42
+    assert allocator.number("V4-0000002a") is None
+    assert allocator.number("V3-2a") is None
+    assert allocator.number("V3-zzzzzzzz") is None
+
+
+def test_reserve_moves_counter_past_identifier():
+    allocator = IdAllocator()
+    allocator.reserve("000000ff")
+    assert allocator.allocate() == "00000100"
+
+    # Меньшие и чужие идентификаторы счетчик не сдвигают
+    allocator.reserve("00000005")
+    allocator.reserve("V3-00001000")
+    assert allocator.allocate() == "00000101"
+
+
+@pytest.mark.parametrize("kwargs", [{"prefix": "V-"}, {"shard": -1}, {"start": -1}])
+def test_invalid_arguments_rejected(kwargs):
+    with pytest.raises(ValueError):
+        IdAllocator(**kwargs)
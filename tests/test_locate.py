@@ -0,0 +1,56 @@
+"""Тесты обратного индекса «клиент → транспорт» (locate/unload)"""
+
+import pytest
+
+from transport.client import Client
+from transport.transport_company import TransportCompany
+from transport.vehicle import Vehicle
+
+
+@pytest.fixture
+def company():
+    company = TransportCompany("Тест")
+    company.add_vehicle(Vehicle(3.0))
+    company.add_vehicle(Vehicle(3.0))
+    company.add_client(Client("Иванов", 500))
+    company.add_client(Client("Крупный", 5000))
+    return company
+
+
+def test_locate_follows_direct_loads(company):
+    first = company.vehicles[0]
+    first.load_cargo(company.find_client("Иванов"))
+    assert company.locate("иванов") == [(first, 500)]
+
+    first.unload_cargo("Иванов")
+    assert company.locate("Иванов") == []
+
+
+def test_locate_split_cargo(company):
+    company.optimize_cargo_distribution(split=True)
+    first, second = company.vehicles
+    assert company.locate("Крупный") == [(first, 3000), (second, 2000)]
+    assert company.locate("Иванов") == [(second, 500)]
+
+
+def test_unload_from_every_vehicle(company):
+    company.optimize_cargo_distribution(split=True)
+    assert company.unload("Крупный")
+    assert company.locate("Крупный") == []
+    assert all(client.name != "Крупный"
+               for vehicle in company.vehicles for client in vehicle.clients_list)
+
+    # Повторная выгрузка и неизвестный клиент
+    assert not company.unload("Крупный")
+    assert not company.unload("Неизвестный")
+
+
+def test_reoptimization_and_removal_clear_index(company):
+    company.optimize_cargo_distribution(split=True)
+    company.optimize_cargo_distribution()
+    # Без разделения крупный груз не помещается никуда
+    assert company.locate("Крупный") == []
+    assert len(company.locate("Иванов")) == 1
+
+    company.remove_client("Иванов")
+    assert company.locate("Иванов") == []
@@ -0,0 +1,98 @@
+"""Тесты блокировки чтения/записи и чтения компании из подписчиков транспорта"""
+
+import threading
+import time
+
+from transport.client import Client
+from transport.locks import ReadWriteLock
+from transport.transport_company import TransportCompany
+from transport.van import Van
+
+
+def _run(target, timeout=10.0):
+    """Запуск в отдельном потоке; False — поток не завершился (взаимная блокировка)"""
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive()
+
+
+def test_writer_blocks_other_readers():
+    lock = ReadWriteLock()
+    acquired = threading.Event()
+    lock.acquire_write()
+    reader = threading.Thread(target=lambda: (lock.acquire_read(), acquired.set(),
+                                              lock.release_read()), daemon=True)
+    reader.start()
+    assert not acquired.wait(0.2)
+    lock.release_write()
+    assert acquired.wait(5)
+    reader.join(5)
+
+
+def test_writer_thread_can_read():
+    lock = ReadWriteLock()
+
+    def nested():
+        with lock.write_locked():
+            with lock.read_locked():
+                pass
+        # После снятия записи блокировка свободна для других писателей
+        with lock.write_locked():
+            pass
+
+    assert _run(nested)
+
+
+def test_vehicle_subscribers_read_company_during_optimize():
+    company = TransportCompany("Тест", thread_safe=True)
+    company.add_client(Client("Иванов", 300.0))
+    company.add_client(Client("Петров", 200.0))
+    van = Van(1.0)
+    company.add_vehicle(van)
+    found = []
+
+    def read_totals(events):
+        found.append(company.totals())
+
+    def search(events):
+        found.append(company.search_clients("Пет"))
+
+    van.add_observer(lambda vehicle, event, cargo: found.append(company.find_client("Иванов")))
+    # Шина транспорта хранит подписчиков по слабым ссылкам — функции держит тест
+    van.events.subscribe(read_totals)
+    van.events.subscribe(search)
+
+    assert _run(company.optimize_cargo_distribution)
+    assert any(isinstance(item, list) for item in found)
+    assert any(type(item).__name__ == "CompanyTotals" for item in found)
+    assert len(van.get_loaded_cargo()) == 2
+
+
+def test_vehicle_subscriber_does_not_hold_vehicle_lock():
+    # Поток загрузки читает компанию из подписчика, пока распределение
+    # держит блокировку записи и ждет тот же транспорт
+    company = TransportCompany("Тест", thread_safe=True)
+    company.add_client(Client("Иванов", 300.0))
+    company.add_client(Client("Петров", 200.0))
+    van = Van(1.0)
+    company.add_vehicle(van)
+    loader_started = threading.Event()
+    found = []
+
+    def observer(vehicle, event, cargo):
+        if threading.current_thread().name == "loader":
+            loader_started.set()
+            time.sleep(0.3)   # распределение успевает захватить запись
+            found.append(company.find_client("Петров"))
+
+    van.add_observer(observer)
+    loader = threading.Thread(target=van.load_cargo, args=(company.find_client("Иванов"),),
+                              name="loader", daemon=True)
+    loader.start()
+    assert loader_started.wait(5)
+    assert _run(company.optimize_cargo_distribution)
+    loader.join(10)
+    assert not loader.is_alive()
+    assert found and found[0].name == "Петров"
+    assert sorted(c.name for c, _ in van.get_loaded_cargo()) == ["Иванов", "Петров"]
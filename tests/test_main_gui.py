@@ -0,0 +1,46 @@
+"""Тесты сохранения данных интерфейса и их повторной загрузки"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import main_gui
+from transport.client import Client
+from transport.ship import Ship
+from transport.transport_company import TransportCompany
+from transport.validation import build_clients, build_vehicles
+from transport.van import Van
+from transport.vehicle import Vehicle
+
+
+def test_save_data_round_trips_planning_fields(tmp_path, monkeypatch):
+    path = tmp_path / "data.json"
+    monkeypatch.setattr(main_gui.filedialog, "asksaveasfilename", lambda **kwargs: str(path))
+    monkeypatch.setattr(main_gui.messagebox, "showinfo", lambda *args: None)
+    monkeypatch.setattr(main_gui.messagebox, "showerror", lambda *args: pytest.fail(args[1]))
+
+    company = TransportCompany("Тест")
+    company.add_client(Client("Иванов", 300.0, True, needs_refrigeration=True, volume=1.5,
+                              ready_time=8.0, deadline=12.0))
+    company.add_client(Client("Петров", 200.0, transport_mode="sea", pallets=2))
+    company.add_vehicle(Van(1.0, True, dispatch_cost=120.0))
+    company.add_vehicle(Ship(50.0, "Нева", dispatch_cost=900.0))
+    company.add_vehicle(Vehicle(2.0, volume_capacity=10.0, pallet_slots=4))
+
+    gui = SimpleNamespace(company=company, current_data_file=None)
+    main_gui.TransportCompanyGUI.save_data(gui)
+    data = json.loads(path.read_text(encoding="utf-8"))
+
+    clients, issues = build_clients(data["clients"])
+    assert not issues
+    fields = ("name", "cargo_weight", "is_vip", "needs_refrigeration", "transport_mode",
+              "volume", "pallets", "ready_time", "deadline")
+    assert ([tuple(getattr(c, f) for f in fields) for c in clients]
+            == [tuple(getattr(c, f) for f in fields) for c in company.clients])
+
+    vehicles, issues = build_vehicles(data["vehicles"])
+    assert not issues
+    fields = ("vehicle_id", "capacity", "volume_capacity", "pallet_slots", "dispatch_cost")
+    assert ([(*(getattr(v, f) for f in fields), v.capabilities()) for v in vehicles]
+            == [(*(getattr(v, f) for f in fields), v.capabilities()) for v in company.vehicles])
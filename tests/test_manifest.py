@@ -0,0 +1,67 @@
+"""Тесты манифеста груза транспортного средства"""
+
+import random
+
+from transport.client import Client
+from transport.manifest import LoadedCargo, Manifest
+from transport.vehicle import Vehicle
+
+
+def _cargo(client, weight_g=1000):
+    return LoadedCargo(client, weight_g, 0, 0)
+
+
+def test_sequence_behaviour_keeps_load_order():
+    manifest = Manifest()
+    clients = [Client(name, 1) for name in ("Борис", "Анна", "Вера")]
+    for client in clients:
+        manifest.add(_cargo(client))
+
+    assert len(manifest) == 3
+    assert list(manifest) == clients
+    assert manifest[1] is clients[1]
+    assert manifest[-1] is clients[2]
+    assert manifest[:2] == clients[:2]
+    assert not Manifest()
+
+
+def test_remove_ignores_case_and_takes_earliest():
+    manifest = Manifest()
+    first, second = Client("Иванов", 1), Client("иванов", 2)
+    manifest.add(_cargo(first, 1000))
+    manifest.add(_cargo(second, 2000))
+
+    assert manifest.remove("ИВАНОВ").client is first
+    assert manifest.remove("Иванов").client is second
+    assert manifest.remove("Иванов") is None
+    assert len(manifest) == 0
+
+
+def test_remove_after_rename():
+    manifest = Manifest()
+    client, other = Client("Старое", 1), Client("Другой", 1)
+    manifest.add(_cargo(client))
+    manifest.add(_cargo(other))
+    client.name = "Новое"
+
+    assert manifest.remove("Старое") is None
+    assert manifest.remove("новое").client is client
+    assert list(manifest) == [other]
+
+
+def test_vehicle_load_stays_exact():
+    rng = random.Random(4)
+    vehicle = Vehicle(100.0)
+    clients = [Client(f"Клиент {i}", rng.randint(1, 100) / 7) for i in range(300)]
+    for client in clients:
+        assert vehicle.load_cargo(client)
+    for client in rng.sample(clients, 200):
+        assert vehicle.unload_cargo(client.name)
+
+    loaded = [client for client in clients if client in list(vehicle.clients_list)]
+    assert len(loaded) == 100
+    assert vehicle.current_load_g == sum(client.cargo_weight_g for client in loaded)
+    for client in loaded:
+        assert vehicle.unload_cargo(client.name)
+    assert vehicle.current_load_g == 0
+    assert len(vehicle.clients_list) == 0
@@ -0,0 +1,139 @@
+"""Тесты алгоритмов упаковки (packing) и упаковки по классам совместимости"""
+
+import random
+
+from transport import compatibility, packing
+from transport.client import Client
+from transport.compatibility import REFRIGERATED, ROAD
+from transport.transport_company import TransportCompany
+from transport.van import Van
+from transport.vehicle import Vehicle
+
+
+def test_balanced_fit_evens_out_fill():
+    assignment = packing.balanced_fit([600, 400, 500, 500], [False] * 4, [1000, 1000])
+    loads = [0, 0]
+    for weight, vehicle_index in zip([600, 400, 500, 500], assignment):
+        loads[vehicle_index] += weight
+    assert loads == [1000, 1000]
+
+
+def test_balanced_fit_counts_existing_loads():
+    # Первый транспорт уже наполовину загружен — новые грузы идут во второй
+    assignment = packing.balanced_fit([600, 400], [False, False], [2000, 2000], loads=[1000, 0])
+    assert assignment == [1, 1]
+
+
+def test_balanced_fit_zero_capacity_is_skipped():
+    assert packing.balanced_fit([100], [False], [0, 500]) == [1]
+
+
+def test_pack_by_class_balances_against_full_capacity():
+    # Холодильный груз занимает половину первого фургона; обычные грузы
+    # выравнивают фактическую загрузку, а не долю остатка
+    weights = [1000, 600, 400]
+    requirements = [REFRIGERATED, 0, 0]
+    assignment = compatibility.pack_by_class(weights, [False] * 3, requirements, [2000, 2000],
+                                             [REFRIGERATED | ROAD, ROAD], packing.balanced_fit,
+                                             vip_first=False, pass_loads=True)
+    assert assignment == [0, 1, 1]
+
+
+def test_pack_by_class_skips_vehicles_filled_by_earlier_classes():
+    seen = []
+
+    def pack(weights, vip_flags, capacities):
+        seen.append(list(capacities))
+        return packing.first_fit(weights, vip_flags, capacities)
+
+    assignment = compatibility.pack_by_class([1000, 500], [False, False], [REFRIGERATED, 0],
+                                             [1000, 1000], [REFRIGERATED | ROAD, ROAD], pack)
+    assert assignment == [0, 1]
+    assert seen == [[1000], [1000]]
+
+
+def _company(vehicles, clients):
+    company = TransportCompany("Тест")
+    for vehicle in vehicles:
+        company.add_vehicle(vehicle)
+    for client in clients:
+        company.add_client(client)
+    return company
+
+
+def test_balanced_optimization_with_full_refrigerated_van():
+    refrigerated, plain = Van(1.0, True), Van(1.0, False)
+    cold = Client("Холодный груз", 1000, needs_refrigeration=True)
+    regular = Client("Обычный груз", 500)
+    company = _company([refrigerated, plain], [cold, regular])
+
+    distribution = company.optimize_cargo_distribution(balanced=True)
+
+    assert distribution == {refrigerated.vehicle_id: [(cold, 1000.0)],
+                            plain.vehicle_id: [(regular, 500.0)]}
+
+
+def test_balanced_fit_improvement_never_raises_peak():
+    rng = random.Random(11)
+    for _ in range(200):
+        capacities = [rng.choice([0, 1000, 2500, 4000]) for _ in range(rng.randint(1, 8))]
+        if not any(capacities):
+            continue
+        weights = [rng.randint(1, 1500) for _ in range(rng.randint(1, 40))]
+        vip_flags = [rng.random() < 0.2 for _ in weights]
+        greedy = packing.balanced_fit(weights, vip_flags, capacities, max_moves=0)
+        improved = packing.balanced_fit(weights, vip_flags, capacities)
+
+        def peak(assignment):
+            loads = [0] * len(capacities)
+            for weight, j in zip(weights, assignment):
+                if j >= 0:
+                    loads[j] += weight
+            assert all(load <= capacity for load, capacity in zip(loads, capacities))
+            return max(load / capacity for load, capacity in zip(loads, capacities) if capacity)
+
+        assert [j >= 0 for j in improved] == [j >= 0 for j in greedy]
+        assert peak(improved) <= peak(greedy)
+
+
+def test_balanced_fit_moves_best_item_from_crowded_vehicle():
+    # Второй транспорт уже полон наполовину; ровно поровну (750) не разложить,
+    # лучшее — 800 и 700
+    assignment = packing.balanced_fit([100, 200, 300, 400], [False] * 4, [1000, 1000],
+                                      loads=[0, 500])
+    loads = [0, 500]
+    for weight, j in zip([100, 200, 300, 400], assignment):
+        loads[j] += weight
+    assert max(loads) == 800
+
+
+def test_split_fit_keeps_whole_cargo_whole():
+    pieces = packing.split_fit([500, 300], [False, False], [1000, 1000])
+    assert pieces == [[(0, 500)], [(0, 300)]]
+
+
+def test_split_fit_divides_into_few_pieces():
+    # 2500 не помещается ни в один транспорт: сначала самый вместительный
+    pieces = packing.split_fit([2500], [False], [1000, 2000, 800])
+    assert pieces == [[(1, 2000), (0, 500)]]
+
+
+def test_split_fit_vip_first_and_skips_cargo_over_free_capacity():
+    pieces = packing.split_fit([1500, 1500, 5000], [False, True, False], [1000, 1000, 1000])
+    assert pieces[1] == [(0, 1000), (1, 500)]
+    assert pieces[0] == [(2, 1000), (1, 500)]
+    assert pieces[2] == []
+
+
+def test_split_distribution_records_partial_weights():
+    company = TransportCompany("Тест")
+    first, second = Vehicle(3.0), Vehicle(3.0)
+    company.add_vehicle(first)
+    company.add_vehicle(second)
+    company.add_client(Client("Крупный", 5000))
+
+    distribution = company.optimize_cargo_distribution(split=True)
+
+    parts = sorted(weight for loads in distribution.values() for _, weight in loads)
+    assert parts == [2000, 3000]
+    assert first.current_load + second.current_load == 5.0
@@ -0,0 +1,66 @@
+"""Тесты параллельного планирования нескольких компаний"""
+
+from transport.client import Client
+from transport.parallel_planner import (decode_company, encode_company, plan_companies,
+                                        plan_encoded)
+from transport.transport_company import TransportCompany
+from transport.vehicle import Vehicle
+
+
+def _company(name, vehicles, clients):
+    company = TransportCompany(name)
+    for vehicle in vehicles:
+        company.add_vehicle(vehicle)
+    for client in clients:
+        company.add_client(client)
+    return company
+
+
+def test_encode_decode_round_trip():
+    company = _company("Тест", [Vehicle(1.0), Vehicle(2.0)],
+                       [Client("Первый", 300, True), Client("Второй", 1500)])
+    weights, vip_flags, _, capacities, _ = decode_company(encode_company(company))
+    assert list(weights) == [300000, 1500000]
+    assert list(vip_flags) == [1, 0]
+    assert list(capacities) == [1000000, 2000000]
+
+
+def test_apply_plan_uses_snapshot_after_registries_changed():
+    small, large = Vehicle(1.0), Vehicle(2.0)
+    first, second = Client("Первый", 300), Client("Второй", 1500)
+    company = _company("Тест", [small, large], [first, second])
+    clients, vehicles = company.snapshot_registries()
+    assignment = [0, 1]
+
+    # Пока план строился, клиент и транспорт удалены, а новые добавлены
+    company.remove_client("Первый")
+    company.add_client(Client("Новый", 100))
+    company.remove_vehicle(small.vehicle_id)
+    company.add_vehicle(Vehicle(5.0))
+
+    distribution = company.apply_plan(assignment, clients, vehicles)
+
+    assert distribution == {large.vehicle_id: [(second, 1500.0)]}
+    assert small.current_load == 0
+
+
+def test_plan_companies_respects_volume_limits():
+    # По весу оба груза помещаются в первый транспорт, по объему — нет
+    first, second = Vehicle(1.0, volume_capacity=1.0), Vehicle(1.0, volume_capacity=1.0)
+    company = _company("Объем", [first, second],
+                       [Client("Первый", 100, volume=0.6), Client("Второй", 100, volume=0.6)])
+
+    [distribution] = plan_companies([company], max_workers=1)
+
+    assert sorted(len(cargo) for cargo in distribution.values()) == [1, 1]
+
+
+def test_plan_companies_in_worker_processes():
+    companies = [_company(f"Компания {n}", [Vehicle(1.0)], [Client(f"Клиент {n}", 100 * (n + 1))])
+                 for n in range(3)]
+
+    distributions = plan_companies(companies, max_workers=2)
+
+    for n, (company, distribution) in enumerate(zip(companies, distributions)):
+        assert distribution == {company.vehicles[0].vehicle_id: [(company.clients[0], 100.0 * (n + 1))]}
+    assert plan_encoded(encode_company(TransportCompany("Пустая"))) == b""
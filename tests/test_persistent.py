@@ -0,0 +1,39 @@
+"""Тесты персистентного вектора"""
+
+import pytest
+
+from transport.persistent import PersistentVector
+
+
+def test_append_grows_tree_levels():
+    vector = PersistentVector()
+    for value in range(2000):
+        vector = vector.append(value)
+    assert len(vector) == 2000
+    assert list(vector) == list(range(2000))
+    assert vector[1500] == 1500
+    assert vector[-1] == 1999
+
+
+def test_set_keeps_old_version():
+    old = PersistentVector.from_iterable(range(100))
+    new = old.set(40, "x")
+    assert old[40] == 40
+    assert new[40] == "x"
+    assert list(new)[:40] == list(range(40))
+
+
+def test_from_iterable_matches_appends():
+    built = PersistentVector()
+    for value in range(1057):
+        built = built.append(value)
+    assert list(PersistentVector.from_iterable(range(1057))) == list(built)
+    assert len(PersistentVector.from_iterable([])) == 0
+
+
+def test_index_out_of_range():
+    vector = PersistentVector.from_iterable([1, 2, 3])
+    with pytest.raises(IndexError):
+        vector[3]
+    with pytest.raises(IndexError):
+        vector.set(-1, 0)
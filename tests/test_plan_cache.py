@@ -0,0 +1,117 @@
+"""Тесты кэша планов и его инвалидации при изменении данных компании"""
+
+from transport.client import Client
+from transport.plan_cache import PlanCache, fingerprint, from_canonical, to_canonical
+from transport.transport_company import TransportCompany
+from transport.van import Van
+
+
+def test_fingerprint_ignores_order():
+    clients = [(300, 0, 0, False, 0), (100, 0, 0, True, 0)]
+    vehicles = [(1000, 0, 0, 1, 10.0), (500, 0, 0, 1, 5.0)]
+    first = fingerprint(clients, vehicles)
+    second = fingerprint(clients[::-1], vehicles[::-1])
+    assert first.digest == second.digest
+
+    pieces = [[(0, 300)], [(1, 100)]]
+    canonical = to_canonical(pieces, first)
+    assert from_canonical(canonical, second) == [[(0, 100)], [(1, 300)]]
+
+
+def test_cache_lru_evicts_oldest():
+    cache = PlanCache(max_entries=1)
+    cache.put("a", [[(0, 1)]])
+    cache.put("b", [[(0, 2)]])
+    assert cache.get("a") is None
+    assert cache.get("b") == [[(0, 2)]]
+
+
+def _company():
+    company = TransportCompany("Тест")
+    company.add_client(Client("Иванов", 600.0))
+    company.add_client(Client("Петров", 300.0))
+    van = Van(1.0)
+    company.add_vehicle(van)
+    return company, van
+
+
+def _plan(company, capsys, **options):
+    capsys.readouterr()
+    company.optimize_cargo_distribution(**options)
+    return "План найден в кэше" in capsys.readouterr().out
+
+
+def test_identical_replan_hits_cache(capsys):
+    company, _ = _company()
+    assert not _plan(company, capsys)
+    assert _plan(company, capsys)
+
+
+def test_direct_capacity_change_invalidates_plan(capsys):
+    company, van = _company()
+    _plan(company, capsys)
+    van.capacity = 0.5
+    assert not _plan(company, capsys)
+    assert van.current_load_g <= van.capacity_g
+    assert len(van.get_loaded_cargo()) == 1
+
+
+def test_direct_client_field_changes_invalidate_plan(capsys):
+    company, van = _company()
+    _plan(company, capsys)
+    petrov = company.find_client("Петров")
+    petrov.is_vip = True
+    assert not _plan(company, capsys)
+
+    petrov.cargo_weight = 500.0
+    assert not _plan(company, capsys)
+    assert van.current_load_g <= van.capacity_g
+
+
+def test_direct_vehicle_field_changes_invalidate_plan(capsys):
+    company, van = _company()
+    company.find_client("Иванов").needs_refrigeration = True
+    _plan(company, capsys)
+    assert [c.name for c, _ in van.get_loaded_cargo()] == ["Петров"]
+
+    van.is_refrigerated = True
+    assert not _plan(company, capsys)
+    assert sorted(c.name for c, _ in van.get_loaded_cargo()) == ["Иванов", "Петров"]
+
+    _plan(company, capsys, minimize_cost=True)
+    van.dispatch_cost = 50.0
+    assert not _plan(company, capsys, minimize_cost=True)
+
+
+def test_unchanged_company_reuses_fingerprint(capsys, monkeypatch):
+    from transport import plan_cache as module
+
+    calls = []
+    original = module.fingerprint
+    monkeypatch.setattr(module, "fingerprint", lambda *args: calls.append(1) or original(*args))
+    company, van = _company()
+    _plan(company, capsys)
+    _plan(company, capsys)
+    _plan(company, capsys, balanced=True)
+    assert len(calls) == 1
+
+    van.capacity = 0.8
+    _plan(company, capsys)
+    company.find_client("Петров").is_vip = True
+    _plan(company, capsys)
+    assert len(calls) == 3
+
+
+def test_setters_bump_version():
+    company, van = _company()
+    client = company.find_client("Иванов")
+    version = company._version
+    for change in (lambda: setattr(van, "capacity", 2.0),
+                   lambda: setattr(van, "is_refrigerated", True),
+                   lambda: setattr(van, "dispatch_cost", 15.0),
+                   lambda: setattr(client, "is_vip", True),
+                   lambda: setattr(client, "cargo_weight", 650.0),
+                   lambda: setattr(client, "transport_mode", "road")):
+        change()
+        assert company._version > version
+        version = company._version
@@ -0,0 +1,65 @@
+"""Тесты планирования без изменения объектов и сценариев «что если»"""
+
+import random
+
+import pytest
+
+from transport import compatibility
+from transport.client import Client
+from transport.compatibility import REFRIGERATED, ROAD, SEA
+from transport.planning import FleetView, evaluate_scenarios, plan
+from transport.transport_company import TransportCompany
+from transport.van import Van
+
+MASKS = [0, ROAD, SEA, REFRIGERATED]
+CAPABILITIES = [ROAD, REFRIGERATED | ROAD, SEA]
+
+
+def _random_view(rng):
+    n, m = rng.randint(0, 40), rng.randint(1, 6)
+    return FleetView([rng.randint(1, 1500) for _ in range(n)], [rng.random() < 0.3 for _ in range(n)],
+                     [rng.choice(MASKS) for _ in range(n)],
+                     [rng.randint(500, 3000) for _ in range(m)],
+                     [rng.choice(CAPABILITIES) for _ in range(m)])
+
+
+def test_plan_matches_pack_by_class():
+    rng = random.Random(7)
+    for _ in range(50):
+        view = _random_view(rng)
+        expected = compatibility.pack_by_class(view.weights, view.vip_flags, view.requirements,
+                                               view.capacities, view.capabilities)
+        assert plan(view).assignment == expected
+
+
+def test_scenarios_match_full_replan():
+    rng = random.Random(8)
+    for _ in range(50):
+        view = _random_view(rng)
+        add = [(rng.randint(500, 3000), rng.choice(CAPABILITIES)) for _ in range(rng.randint(0, 3))]
+        drop = rng.sample(range(len(view.capacities)), rng.randint(0, 1))
+        scenarios = {"add": (add, ()), "drop": ((), drop), "both": (add, drop)}
+        plans = evaluate_scenarios(view, scenarios)
+        for name, (scenario_add, scenario_drop) in scenarios.items():
+            assert plans[name] == plan(view.with_vehicles(scenario_add, scenario_drop)), name
+
+
+def test_plan_does_not_touch_vehicles():
+    company = TransportCompany("Тест")
+    van = Van(1.0)
+    company.add_vehicle(van)
+    company.add_client(Client("Иванов", 300))
+
+    result = plan(FleetView.from_company(company))
+
+    assert result.assignment == [0]
+    assert result.loads == [300000]
+    assert result.vehicles_used() == 1
+    assert van.current_load == 0
+    assert len(van.clients_list) == 0
+
+
+def test_with_vehicles_rejects_unknown_index():
+    view = FleetView([100], [False], [0], [1000], [ROAD])
+    with pytest.raises(IndexError):
+        view.with_vehicles(drop=[1])
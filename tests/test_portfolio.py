@@ -0,0 +1,58 @@
+"""Тесты портфельного режима оптимизации"""
+
+import pytest
+
+from transport.client import Client
+from transport.portfolio import run_strategy, solve_portfolio
+from transport.parallel_planner import encode_registries
+from transport.transport_company import TransportCompany
+from transport.vehicle import Vehicle
+
+
+def _company(vehicles, clients):
+    company = TransportCompany("Тест")
+    for vehicle in vehicles:
+        company.add_vehicle(vehicle)
+    for client in clients:
+        company.add_client(client)
+    return company
+
+
+def test_solve_portfolio_returns_ffd_when_it_reaches_bound():
+    company = _company([Vehicle(1.0), Vehicle(1.0)],
+                       [Client("Первый", 600), Client("Второй", 400)])
+    result = solve_portfolio(company, time_budget=1.0, max_workers=1)
+    # Оба груза помещаются в один транспорт — это нижняя оценка, процессы не нужны
+    assert result.strategy == "ffd"
+    assert result.assignment == [0, 0]
+    assert result.score[1] == 0
+    assert result.score[2] == 1
+
+
+def test_solve_portfolio_returns_snapshot_it_planned():
+    company = _company([Vehicle(1.0)], [Client("Первый", 300)])
+    result = solve_portfolio(company, time_budget=1.0, max_workers=1)
+
+    # Список изменился после планирования: план применяется к снимку
+    company.add_client(Client("Новый", 100))
+    company.apply_plan(result.assignment, result.clients, result.vehicles)
+
+    assert [client.name for client in result.clients] == ["Первый"]
+    assert company.vehicles[0].current_load == pytest.approx(0.3)
+
+
+def test_run_strategy_scores_plan():
+    clients = [Client("Первый", 700), Client("Второй", 700), Client("Третий", 300)]
+    vehicles = [Vehicle(1.0), Vehicle(1.0)]
+    payload = encode_registries(clients, vehicles)
+    name, assignment, score = run_strategy("bfd", payload, deadline=float("inf"))
+    assert name == "bfd"
+    # Незагруженный вес и число транспорта
+    assert score[1] == 0
+    assert score[2] == 2
+
+
+def test_run_strategy_rejects_unknown_name():
+    payload = encode_registries([Client("Первый", 100)], [Vehicle(1.0)])
+    with pytest.raises(ValueError):
+        run_strategy("lifo", payload, deadline=float("inf"))
@@ -0,0 +1,66 @@
+"""Тесты построчных отчетов с выбором страницы и сортировкой"""
+
+import pytest
+
+from transport.client import Client
+from transport.reports import pages
+from transport.transport_company import TransportCompany
+from transport.vehicle import Vehicle
+
+
+@pytest.fixture
+def company():
+    company = TransportCompany("Тест")
+    for name, weight, vip in [("Петров", 300, False), ("Антонов", 100, True),
+                              ("Сидоров", 200, False), ("Борисов", 400, True)]:
+        company.add_client(Client(name, weight, vip))
+    for capacity in (3.0, 1.0, 2.0):
+        company.add_vehicle(Vehicle(capacity))
+    return company
+
+
+def _numbered(lines):
+    """Пронумерованные строки отчета (номер. текст)"""
+    return [line for line in lines if line[:1].isdigit()]
+
+
+def test_clients_default_order_is_vip_first(company):
+    lines = list(company.iter_clients_report())
+    assert _numbered(lines) == ["1. Антонов", "2. Борисов", "3. Петров", "4. Сидоров"]
+    assert lines.index("\nVIP КЛИЕНТЫ:") < lines.index("\nОБЫЧНЫЕ КЛИЕНТЫ:")
+    assert company.list_clients() == "\n".join(lines)
+
+
+def test_clients_sorted_page(company):
+    lines = list(company.iter_clients_report(offset=1, limit=2, sort_by="weight", descending=True))
+    assert _numbered(lines) == ["2. Петров", "3. Сидоров"]
+    assert "\nПоказано: 2 из 4 (с 2)" in lines
+    assert "Итого: 4 клиентов" in lines[-3]
+
+
+def test_vehicles_sorted_by_capacity(company):
+    ids = [vehicle.vehicle_id for vehicle in company.vehicles]
+    lines = list(company.iter_vehicles_report(sort_by="capacity", limit=2))
+    assert _numbered(lines) == [f"1. Транспорт (ID: {ids[1]})",
+                                f"2. Транспорт (ID: {ids[2]})"]
+    assert company.list_vehicles() == "\n".join(company.iter_vehicles_report())
+
+
+def test_bad_page_arguments(company):
+    with pytest.raises(ValueError):
+        list(company.iter_clients_report(sort_by="age"))
+    with pytest.raises(ValueError):
+        list(company.iter_vehicles_report(offset=-1))
+    with pytest.raises(ValueError):
+        list(pages([], 0))
+
+
+def test_pages_split_stream():
+    assert list(pages(iter(["a", "b", "c"]), 2)) == [["a", "b"], ["c"]]
+    assert list(pages([], 3)) == []
+
+
+def test_empty_company_reports():
+    company = TransportCompany("Пустая")
+    assert company.list_clients() == "В компании 'Пустая' нет клиентов"
+    assert company.list_vehicles() == "В компании 'Пустая' нет транспортных средств"
@@ -0,0 +1,61 @@
+"""Тесты планирования нескольких рейсов за день"""
+
+import random
+
+from transport.scheduler import schedule_trips
+
+INF = float("inf")
+
+
+def _schedule(weights, capacities, ready_times=None, deadlines=None, durations=None, **kwargs):
+    n, m = len(weights), len(capacities)
+    return schedule_trips(weights, [False] * n, [0] * n, capacities, [0] * m,
+                          ready_times or [0.0] * n, deadlines or [INF] * n,
+                          durations or [2.0] * m, **kwargs)
+
+
+def test_one_vehicle_makes_several_trips():
+    schedule = _schedule([900, 900, 900], [1000])
+    assert [(trip.number, trip.start, trip.end) for trip in schedule.trips] == \
+        [(1, 0.0, 2.0), (2, 2.0, 4.0), (3, 4.0, 6.0)]
+    assert sorted(i for trip in schedule.trips for i in trip.clients) == [0, 1, 2]
+    assert schedule.unscheduled == []
+
+
+def test_ready_time_and_deadline():
+    # Второй груз готов только к 5 часам, третий должен быть доставлен к 1 часу
+    schedule = _schedule([500, 500, 500], [1000], ready_times=[0.0, 5.0, 0.0],
+                         deadlines=[INF, INF, 1.0])
+    assert schedule.unscheduled == [2]
+    starts = {i: trip.start for trip in schedule.trips for i in trip.clients}
+    assert starts[1] >= 5.0
+
+
+def test_horizon_limits_trips():
+    schedule = _schedule([900, 900, 900], [1000], horizon=4.0)
+    assert len(schedule.trips) == 2
+    assert len(schedule.unscheduled) == 1
+
+
+def test_random_schedules_are_feasible():
+    rng = random.Random(5)
+    for _ in range(20):
+        n, m = rng.randint(1, 60), rng.randint(1, 6)
+        weights = [rng.randint(1, 1000) for _ in range(n)]
+        capacities = [rng.randint(800, 2000) for _ in range(m)]
+        ready_times = [rng.uniform(0, 8) for _ in range(n)]
+        deadlines = [r + rng.uniform(1, 10) for r in ready_times]
+        durations = [rng.uniform(0.5, 3) for _ in range(m)]
+        schedule = _schedule(weights, capacities, ready_times, deadlines, durations, horizon=12.0)
+
+        placed = [i for trip in schedule.trips for i in trip.clients]
+        assert sorted(placed + schedule.unscheduled) == list(range(n))
+        busy_until = [0.0] * m
+        for trip in sorted(schedule.trips, key=lambda trip: trip.start):
+            assert trip.start >= busy_until[trip.vehicle_index]
+            busy_until[trip.vehicle_index] = trip.end
+            assert sum(weights[i] for i in trip.clients) <= capacities[trip.vehicle_index]
+            assert trip.end <= 12.0
+            for i in trip.clients:
+                assert ready_times[i] <= trip.start
+                assert trip.end <= deadlines[i]
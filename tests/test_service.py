@@ -0,0 +1,66 @@
+"""Тесты асинхронного сервиса планирования"""
+
+import asyncio
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from transport.service import PlanningService
+from transport.transport_company import TransportCompany
+
+
+class _BrokenPool(Executor):
+    """Исполнитель, процесс которого будто бы аварийно завершился"""
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        future.set_exception(BrokenProcessPool("процесс пула завершился"))
+        return future
+
+
+async def _requests(service, requests):
+    return [await service.handle_request(request) for request in requests]
+
+
+def test_add_and_plan():
+    service = PlanningService(TransportCompany("Сервис"), replan_delay=0)
+    try:
+        add_vehicle, add_client, plan = asyncio.run(_requests(service, [
+            {"id": 1, "op": "add_vehicle", "type": "Van", "capacity": 1.0},
+            {"id": 2, "op": "add_client", "name": "Клиент", "cargo_weight": 400},
+            {"id": 3, "op": "plan"},
+        ]))
+    finally:
+        service.close()
+    assert add_vehicle["ok"] and add_client["ok"]
+    assert plan["result"]["distribution"] == {add_vehicle["result"]: [["Клиент", 400.0]]}
+
+
+def test_unknown_operation_and_bad_arguments():
+    service = PlanningService(TransportCompany("Сервис"), executor=_BrokenPool())
+    try:
+        unknown, missing = asyncio.run(_requests(service, [
+            {"id": 1, "op": "fly"},
+            {"id": 2, "op": "add_client", "name": "Клиент"},
+        ]))
+    finally:
+        service.close()
+    assert not unknown["ok"] and not missing["ok"]
+
+
+def test_broken_pool_is_reported_and_replaced():
+    service = PlanningService(TransportCompany("Сервис"), replan_delay=0)
+    service._executor.shutdown()
+    service._executor = _BrokenPool()
+    try:
+        responses = asyncio.run(_requests(service, [
+            {"id": 1, "op": "add_vehicle", "type": "Vehicle", "capacity": 1.0},
+            {"id": 2, "op": "add_client", "name": "Клиент", "cargo_weight": 100},
+            {"id": 3, "op": "plan"},
+            {"id": 4, "op": "plan"},
+        ]))
+    finally:
+        service.close()
+    failed, recovered = responses[2], responses[3]
+    assert failed["id"] == 3 and not failed["ok"] and "BrokenProcessPool" in failed["error"]
+    assert isinstance(service._executor, ProcessPoolExecutor)
+    assert recovered["ok"] and recovered["result"]["vehicles_used"] == 1
@@ -0,0 +1,120 @@
+"""Тесты снимков компании и сводных показателей (CompanyTotals)"""
+
+import random
+
+from transport.client import Client
+from transport.ship import Ship
+from transport.snapshot import CompanyTotals
+from transport.transport_company import TransportCompany
+from transport.van import Van
+from transport.vehicle import Vehicle
+
+
+def _recount(company):
+    """Показатели, посчитанные заново по спискам компании"""
+    vip = [c for c in company.clients if c.is_vip]
+    return CompanyTotals(
+        clients_count=len(company.clients),
+        vip_count=len(vip),
+        clients_weight_g=sum(c.cargo_weight_g for c in company.clients),
+        vip_weight_g=sum(c.cargo_weight_g for c in vip),
+        vehicles_count=len(company.vehicles),
+        capacity_g=sum(v.capacity_g for v in company.vehicles),
+        load_g=sum(v.current_load_g for v in company.vehicles),
+        vans_count=sum(isinstance(v, Van) for v in company.vehicles),
+        ships_count=sum(isinstance(v, Ship) for v in company.vehicles),
+        others_count=sum(type(v) is Vehicle for v in company.vehicles),
+    )
+
+
+def _company():
+    company = TransportCompany("Тест")
+    client = Client("Иванов", 100.0)
+    vehicle = Van(2.0)
+    company.add_client(client)
+    company.add_vehicle(vehicle)
+    return company, client, vehicle
+
+
+def test_capacity_setter_updates_totals():
+    company, _, vehicle = _company()
+    vehicle.capacity = 5.0
+    assert company.totals().capacity_g == 5000000
+    assert next(company.snapshot().vehicles()).capacity == 5.0
+
+
+def test_current_load_setter_updates_totals():
+    company, _, vehicle = _company()
+    vehicle.current_load = 1.5
+    assert company.totals().load_g == 1500000
+
+
+def test_is_vip_setter_updates_totals():
+    company, client, _ = _company()
+    client.is_vip = True
+    assert company.totals().vip_count == 1
+    assert company.totals().vip_weight_g == 100000
+    client.is_vip = False
+    assert company.totals().vip_count == 0
+
+
+def test_cargo_weight_setter_updates_totals():
+    company, client, _ = _company()
+    client.cargo_weight = 500
+    assert company.totals().clients_weight_g == 500000
+    assert next(company.snapshot().clients()).cargo_weight == 500.0
+
+
+def test_vehicle_field_setters_publish_changes():
+    company, _, vehicle = _company()
+    seen = []
+    record = seen.extend   # шина хранит подписчиков по слабым ссылкам
+    company.events.subscribe(record)
+    vehicle.is_refrigerated = True
+    vehicle.dispatch_cost = 40.0
+    vehicle.pallet_slots = 10
+    assert [type(event).__name__ for event in seen] == ["VehicleChanged"] * 3
+    assert next(company.snapshot().vehicles()).is_refrigerated is True
+
+
+def test_totals_match_recount_after_random_changes():
+    rng = random.Random(7)
+    company = TransportCompany("Тест")
+    for i in range(30):
+        company.add_client(Client(f"Клиент {i}", rng.uniform(10, 900), rng.random() < 0.3))
+    for i in range(6):
+        company.add_vehicle(rng.choice([Van(2.0), Ship(5.0, f"Судно {i}"), Vehicle(1.5)]))
+    company.optimize_cargo_distribution()
+    for i in range(40):
+        client = rng.choice(company.clients)
+        action = rng.randrange(5)
+        if action == 0:
+            client.cargo_weight = rng.uniform(10, 900)
+        elif action == 1:
+            client.is_vip = not client.is_vip
+        elif action == 2:
+            company.remove_client(client.name)
+            company.add_client(Client(f"Новый {i}", rng.uniform(10, 900)))
+        elif action == 3:
+            rng.choice(company.vehicles).capacity = rng.uniform(1, 6)
+        else:
+            company.optimize_cargo_distribution(balanced=rng.random() < 0.5)
+        assert company.totals() == _recount(company)
+    assert company.snapshot().totals == company.totals()
+
+
+def test_snapshot_is_not_changed_by_later_edits():
+    company, client, vehicle = _company()
+    company.optimize_cargo_distribution()
+    snapshot = company.snapshot()
+
+    company.add_client(Client("Петров", 50.0, True))
+    company.remove_client("Иванов")
+    company.add_vehicle(Ship(10.0, "Волга"))
+
+    assert [record.name for record in snapshot.clients()] == ["Иванов"]
+    assert [record.vehicle_id for record in snapshot.vehicles()] == [vehicle.vehicle_id]
+    assert [(record.name, placements) for record, placements in snapshot.assignments()] == \
+        [("Иванов", ((vehicle.vehicle_id, 100.0),))]
+    assert snapshot.totals.clients_count == 1
+    assert [record.name for record in company.snapshot().clients()] == ["Петров"]
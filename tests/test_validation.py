@@ -0,0 +1,84 @@
+"""Тесты пакетной проверки записей и доверенного создания объектов"""
+
+import pytest
+
+from transport.client import Client
+from transport.ship import Ship
+from transport.validation import Issue, build_clients, build_vehicles
+from transport.van import Van
+from transport.vehicle import Vehicle
+
+
+def _constructor_error(cls, *args, **kwargs):
+    with pytest.raises((TypeError, ValueError)) as error:
+        cls(*args, **kwargs)
+    return str(error.value)
+
+
+def test_build_clients_collects_every_issue():
+    rows = [
+        {"name": "Иванов", "cargo_weight": 100, "is_vip": True},
+        {"name": "И", "cargo_weight": 100},
+        {"cargo_weight": 100},
+        {"name": "Петров", "cargo_weight": -5, "transport_mode": "air"},
+        "не словарь",
+        {"name": "иванов", "cargo_weight": 1},
+        {"name": "Сидоров", "cargo_weight": 1, "ready_time": 5, "deadline": 3},
+        {"name": "Смирнов", "cargo_weight": 2.5, "pallets": 2},
+    ]
+    clients, issues = build_clients(rows)
+
+    assert [client.name for client in clients] == ["Иванов", "Смирнов"]
+    assert clients[0].is_vip and clients[1].pallets == 2
+    assert [(issue.row, issue.field) for issue in issues] == [
+        (1, "name"), (2, "name"), (3, "cargo_weight"), (3, "transport_mode"),
+        (4, ""), (5, "name"), (6, "deadline")]
+    assert issues[0].message == _constructor_error(Client, "И", 100)
+    assert issues[1].message == "Отсутствует обязательное поле 'name'"
+    assert issues[2].message == _constructor_error(Client, "Петров", -5)
+    assert issues[6].message == _constructor_error(Client, "Сидоров", 1, ready_time=5, deadline=3)
+
+
+def test_build_clients_matches_constructor():
+    for weight in [1, 0.5, 100000, 100000.5, True, "10", float("nan"), float("inf")]:
+        clients, issues = build_clients([{"name": "Иванов", "cargo_weight": weight}])
+        try:
+            expected = Client("Иванов", weight)
+        except (TypeError, ValueError, OverflowError):
+            assert clients == [] and len(issues) == 1, weight
+        else:
+            assert issues == [], weight
+            assert clients[0].cargo_weight_g == expected.cargo_weight_g
+
+
+def test_build_vehicles_by_type():
+    rows = [
+        {"type": "Van", "capacity": 2.0, "is_refrigerated": True, "vehicle_id": "v1"},
+        {"type": "Ship", "capacity": 50.0, "name": "Волга"},
+        {"type": "Ship", "capacity": 50.0},
+        {"type": "Plane", "capacity": 1.0},
+        {"capacity": 3.0, "vehicle_id": "v1"},
+        {"capacity": 0, "pallet_slots": 4},
+        {"capacity": 3.0, "pallet_slots": 4, "dispatch_cost": 10.0},
+    ]
+    vehicles, issues = build_vehicles(rows)
+
+    assert [type(vehicle) for vehicle in vehicles] == [Van, Ship, Vehicle]
+    assert vehicles[0].vehicle_id == "v1" and vehicles[0].is_refrigerated
+    assert vehicles[1].name == "Волга"
+    assert vehicles[2].pallet_slots == 4 and vehicles[2].dispatch_cost == 10.0
+    assert [(issue.row, issue.field) for issue in issues] == [
+        (2, "name"), (3, "type"), (4, "vehicle_id"), (5, "capacity")]
+    assert issues[3].message == _constructor_error(Vehicle, 0)
+    assert all(isinstance(issue, Issue) for issue in issues)
+
+
+def test_load_validated_skips_checks_but_keeps_load_exact():
+    vehicle = Vehicle(1.0)
+    client = Client.from_validated("Иванов", 300.0)
+    assert vehicle.load_validated(client)
+    assert vehicle.load_validated(client, 200000)
+    assert vehicle.current_load_g == 500000
+    # Перегрузку быстрый путь тоже не допускает
+    assert not vehicle.load_validated(Client("Петров", 600))
+    assert vehicle.current_load_g == 500000
@@ -0,0 +1,48 @@
+"""Тесты векторной упаковки (вес, объем, паллетоместа)"""
+
+import random
+
+from transport import packing
+from transport.client import Client
+from transport.transport_company import TransportCompany
+from transport.vector_packing import UNLIMITED, vector_first_fit
+from transport.vehicle import Vehicle
+
+
+def test_weight_only_matches_first_fit():
+    rng = random.Random(3)
+    for _ in range(50):
+        weights = [rng.randint(1, 900) for _ in range(rng.randint(1, 30))]
+        vip_flags = [rng.random() < 0.2 for _ in weights]
+        capacities = [rng.randint(500, 2000) for _ in range(rng.randint(1, 8))]
+        expected = packing.first_fit(weights, vip_flags, capacities)
+        demands = [(w,) for w in weights]
+        assert vector_first_fit(demands, vip_flags, [(c,) for c in capacities]) == expected
+
+
+def test_every_dimension_is_respected():
+    # По весу все помещается в первый транспорт, по паллетам — только два груза
+    demands = [(100, 0, 2), (100, 0, 2), (100, 0, 2)]
+    capacities = [(1000, UNLIMITED, 4), (1000, UNLIMITED, 4)]
+    assert vector_first_fit(demands, [False] * 3, capacities) == [0, 0, 1]
+
+
+def test_scarce_dimension_goes_first():
+    # Объемный груз дефицитен по объему и загружается раньше тяжелого
+    demands = [(900, 1, 0), (100, 10, 0)]
+    capacities = [(1000, 10, UNLIMITED)]
+    assert vector_first_fit(demands, [False, False], capacities) == [-1, 0]
+
+
+def test_company_plan_respects_pallet_slots():
+    company = TransportCompany("Тест")
+    first, second = Vehicle(1.0, pallet_slots=3), Vehicle(1.0, pallet_slots=3)
+    company.add_vehicle(first)
+    company.add_vehicle(second)
+    company.add_client(Client("Первый", 100, pallets=2))
+    company.add_client(Client("Второй", 100, pallets=2))
+
+    company.optimize_cargo_distribution()
+
+    assert len(first.clients_list) == 1
+    assert len(second.clients_list) == 1
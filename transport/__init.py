@@ -1,11 +0,0 @@
-"""
-Пакет transport для управления транспортной компанией.
-"""
-
-from .client import Client
-from .vehicle import Vehicle
-from .van import Van
-from .ship import Ship
-from .transport_company import TransportCompany
-
-__all__ = ['Client', 'Vehicle', 'Van', 'Ship', 'TransportCompany']
\ No newline at end of file
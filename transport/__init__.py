@@ -0,0 +1,63 @@
+"""
+Пакет transport для управления транспортной компанией.
+
+Подмодули и основные классы загружаются при первом обращении к ним
+(PEP 562): `import transport` не импортирует ничего, а `transport.Client`
+загружает только модуль клиента и его зависимости. Тяжелые необязательные
+части — параллельное планирование, гонка стратегий, сервис, алгоритмы
+упаковки с учетом стоимости и расписания, хранение планов на диске —
+загружаются только при использовании.
+"""
+
+import importlib
+from typing import List
+
+# Класс -> подмодуль, в котором он определен
+_EXPORTS = {
+    'Client': 'client',
+    'Vehicle': 'vehicle',
+    'Van': 'van',
+    'Ship': 'ship',
+    'TransportCompany': 'transport_company',
+}
+
+_SUBMODULES = frozenset({
+    'bounds', 'client', 'client_index', 'compatibility', 'cost_packing',
+    'history', 'id_allocator', 'locks', 'manifest', 'packing', 'parallel_planner',
+    'persistent', 'plan_cache', 'planning', 'portfolio', 'reports',
+    'scheduler', 'service', 'ship', 'snapshot', 'transport_company', 'units',
+    'events', 'validation', 'van', 'vector_packing', 'vehicle',
+})
+
+__all__ = ['Client', 'Vehicle', 'Van', 'Ship', 'TransportCompany']
+
+
+def __getattr__(name: str):
+    """
+    Загрузка класса или подмодуля при первом обращении
+
+    Загруженный объект сохраняется в пространстве имен пакета, поэтому
+    следующие обращения не доходят до этой функции.
+
+    Args:
+        name (str): Имя класса из __all__ или подмодуля
+
+    Returns:
+        Класс или подмодуль
+
+    Raises:
+        AttributeError: Если такого имени в пакете нет
+    """
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Имена пакета вместе с еще не загруженными классами и подмодулями"""
+    return sorted(set(globals()) | set(_EXPORTS) | _SUBMODULES)
@@ -0,0 +1,153 @@
+"""
+Нижние оценки и предварительная проверка выполнимости распределения.
+
+Анализ выполняется за O(n log n) до запуска упаковки: находит клиентов,
+чей груз не поместится ни в один совместимый транспорт, оценивает снизу
+число нужного транспорта (оценки L1 и L2 Мартелло — Тота) и недостачу
+грузоподъемности. Планировщики используют его, чтобы не упаковывать
+заведомо невозможное и останавливаться, как только план достиг оценки.
+"""
+
+import bisect
+from itertools import accumulate
+from typing import List, NamedTuple, Sequence, Tuple
+
+from . import compatibility, packing
+
+
+def l2_bound(weights: Sequence[int], capacity: int) -> int:
+    """
+    Оценка L2 Мартелло — Тота для одинакового транспорта грузоподъемности capacity
+
+    Для каждого порога K (0 и веса не больше capacity/2) грузы делятся на
+    J1 (> capacity-K: с ними не поместится ни один груз из J3), J2
+    (> capacity/2: каждый в отдельном транспорте) и J3 (от K до capacity/2).
+    Грузы J3 занимают остаток транспорта J2 и дополнительный транспорт.
+
+    Args:
+        weights (Sequence[int]): Веса грузов в граммах (каждый не больше capacity)
+        capacity (int): Грузоподъемность в граммах
+
+    Returns:
+        int: Нижняя оценка числа транспорта
+    """
+    if not weights or capacity <= 0:
+        return 0
+    ordered = sorted(weights)
+    prefix = [0] + list(accumulate(ordered))
+    count = len(ordered)
+    half_end = bisect.bisect_right(ordered, capacity // 2)   # грузы не больше capacity/2
+
+    # Пороги K перебираются по возрастанию: граница J3 сдвигается вправо,
+    # граница J1 — влево, поэтому хватает двух указателей без бинарного поиска
+    best = 0
+    j3_start = 0
+    big_start = count
+    previous = None
+    for k in [0] + ordered[:half_end]:
+        if k == previous:
+            continue    # тот же порог уже учтен
+        previous = k
+        while j3_start < half_end and ordered[j3_start] < k:
+            j3_start += 1
+        while big_start > half_end and ordered[big_start - 1] > capacity - k:
+            big_start -= 1
+        j2_count = big_start - half_end
+        j2_sum = prefix[big_start] - prefix[half_end]
+        j3_sum = prefix[half_end] - prefix[j3_start]
+        extra = j3_sum - (j2_count * capacity - j2_sum)
+        best = max(best, (count - half_end) + max(0, -(-extra // capacity)))
+    return best
+
+
+class FeasibilityReport(NamedTuple):
+    """Результат предварительного анализа распределения"""
+    impossible: List[int]     # клиенты, которых не вмещает ни один совместимый транспорт
+    l1_bound: int             # оценка по суммарному весу (самый вместительный транспорт первым)
+    l2_bound: int             # оценка L2 Мартелло — Тота
+    min_vehicles: int         # нижняя оценка числа транспорта для возможных грузов
+    shortfall: int            # нехватка грузоподъемности в граммах (оценка снизу)
+    unloaded_bound: int       # незагружаемый вес в граммах (оценка снизу)
+    vip_unloaded_bound: int   # незагружаемый вес VIP в граммах (оценка снизу)
+    vehicles_bound: int       # оценка числа транспорта для плана с unloaded_bound
+
+    def is_feasible(self) -> bool:
+        """
+        Могут ли (по оценкам) поместиться все грузы
+
+        Returns:
+            bool: False если груз заведомо не поместится целиком
+        """
+        return self.unloaded_bound == 0
+
+    def is_optimal(self, score: Tuple[int, int, int, float]) -> bool:
+        """
+        Достиг ли план оценок (улучшать его по первым трем критериям бесполезно)
+
+        Args:
+            score (Tuple): Оценка плана из packing.plan_score
+
+        Returns:
+            bool: True если незагруженный вес VIP и всех клиентов равен
+                нижним оценкам, а число транспорта не больше оценки
+        """
+        return (score[0] == self.vip_unloaded_bound and score[1] == self.unloaded_bound
+                and score[2] <= self.vehicles_bound)
+
+
+def analyze(weights: Sequence[int], vip_flags: Sequence[bool], requirements: Sequence[int],
+            capacities: Sequence[int], capabilities: Sequence[int]) -> FeasibilityReport:
+    """
+    Предварительный анализ распределения за O(n log n)
+
+    Оценки считаются для каждой маски требований r: грузы, чьи требования
+    включают r, могут ехать только транспортом, совместимым с r, поэтому
+    оценки по этому подмножеству верны и для всего плана; берется максимум.
+
+    Args:
+        weights (Sequence[int]): Веса грузов в граммах
+        vip_flags (Sequence[bool]): VIP-статусы клиентов
+        requirements (Sequence[int]): Маски требований клиентов
+        capacities (Sequence[int]): Грузоподъемности транспорта в граммах
+        capabilities (Sequence[int]): Маски возможностей транспорта
+
+    Returns:
+        FeasibilityReport: Результат анализа
+    """
+    masks = set(requirements) | {0}
+    compatible = {mask: [capacity for capacity, capability in zip(capacities, capabilities)
+                         if compatibility.is_compatible(mask, capability)]
+                  for mask in masks}
+    largest = {mask: max(caps, default=0) for mask, caps in compatible.items()}
+
+    impossible = [i for i, (weight, mask) in enumerate(zip(weights, requirements))
+                  if weight > largest[mask]]
+    excluded = set(impossible)
+    possible = [i for i in range(len(weights)) if i not in excluded]
+
+    l1 = l2 = shortfall = 0
+    for mask in masks:
+        subset = [weights[i] for i in possible if requirements[i] & mask == mask]
+        if not subset:
+            continue
+        caps = compatible[mask]
+        l1 = max(l1, packing.vehicles_lower_bound(subset, caps))
+        l2 = max(l2, l2_bound(subset, largest[mask]))
+        shortfall = max(shortfall, sum(subset) - sum(caps))
+
+    impossible_weight = sum(weights[i] for i in impossible)
+    if shortfall == 0:
+        vehicles_bound = max(l1, l2)
+    else:
+        loaded = sum(weights[i] for i in possible) - shortfall
+        vehicles_bound = packing.vehicles_lower_bound([loaded], capacities)
+    return FeasibilityReport(
+        impossible=impossible,
+        l1_bound=l1,
+        l2_bound=l2,
+        min_vehicles=max(l1, l2),
+        shortfall=shortfall,
+        unloaded_bound=impossible_weight + shortfall,
+        vip_unloaded_bound=sum(weights[i] for i in impossible if vip_flags[i]),
+        vehicles_bound=vehicles_bound,
+    )
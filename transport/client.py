@@ -1,7 +1,19 @@
+from typing import Optional, Tuple
+
+from .compatibility import REFRIGERATED, TRANSPORT_MODES
+from .units import GRAMS_PER_KG, cm3_to_m3, kg_to_grams, m3_to_cm3
+
+# Ограничение на максимальный вес груза (100 тонн)
+MAX_CARGO_WEIGHT_KG = 100000
+
+
 class Client:
     """Класс для представления клиента транспортной компании"""
     
-    def __init__(self, name: str, cargo_weight: float, is_vip: bool = False):
+    def __init__(self, name: str, cargo_weight: float, is_vip: bool = False,
+                 needs_refrigeration: bool = False, transport_mode: str = "any",
+                 volume: Optional[float] = None, pallets: Optional[int] = None,
+                 ready_time: Optional[float] = None, deadline: Optional[float] = None):
         """
         Инициализация клиента
         
@@ -9,12 +21,191 @@ class Client:
             name (str): Имя клиента
             cargo_weight (float): Вес груза в килограммах
             is_vip (bool, optional): VIP-статус клиента. По умолчанию False.
+            needs_refrigeration (bool, optional): Груз требует холодильника. По умолчанию False.
+            transport_mode (str, optional): Вид перевозки: 'any', 'road' (только
+                наземная) или 'sea' (только морская). По умолчанию 'any'.
+            volume (float, optional): Объем груза в м³. По умолчанию не задан.
+            pallets (int, optional): Число паллет. По умолчанию не задано.
+            ready_time (float, optional): Час готовности груза от начала дня
+                планирования. По умолчанию груз готов сразу.
+            deadline (float, optional): Час, к которому рейс с грузом должен
+                завершиться. По умолчанию срок не ограничен.
         """
-        self.name = self._validate_name(name)
-        self.cargo_weight = self._validate_cargo_weight(cargo_weight)
-        self.is_vip = self._validate_is_vip(is_vip)
+        name = self._validate_name(name)
+        cargo_weight = self._validate_cargo_weight(cargo_weight)
+        is_vip = self._validate_is_vip(is_vip)
+        needs_refrigeration = self._validate_needs_refrigeration(needs_refrigeration)
+        transport_mode = self._validate_transport_mode(transport_mode)
+        volume = self._validate_volume(volume)
+        pallets = self._validate_pallets(pallets)
+        ready_time = self._validate_time(ready_time, "Время готовности")
+        deadline = self._validate_time(deadline, "Срок доставки")
+        self._validate_time_window(ready_time, deadline)
+        self._init_validated(name, cargo_weight, is_vip, needs_refrigeration, transport_mode,
+                             volume, pallets, ready_time, deadline)
     
-    def _validate_name(self, name: str) -> str:
+    def _init_validated(self, name: str, cargo_weight: float, is_vip: bool,
+                        needs_refrigeration: bool, transport_mode: str,
+                        volume: Optional[float], pallets: Optional[int],
+                        ready_time: Optional[float], deadline: Optional[float]) -> None:
+        """Заполнение атрибутов проверенными значениями (общая часть __init__ и from_validated)"""
+        self.name = name
+        self._cargo_weight_g = kg_to_grams(cargo_weight)
+        self._is_vip = is_vip
+        self._needs_refrigeration = needs_refrigeration
+        self._transport_mode = transport_mode
+        self._volume_cm3 = None if volume is None else m3_to_cm3(volume)
+        self._pallets = pallets
+        self.ready_time = ready_time
+        self.deadline = deadline
+        self._observers = []
+    
+    @classmethod
+    def from_validated(cls, name: str, cargo_weight: float, is_vip: bool = False,
+                       needs_refrigeration: bool = False, transport_mode: str = "any",
+                       volume: Optional[float] = None, pallets: Optional[int] = None,
+                       ready_time: Optional[float] = None,
+                       deadline: Optional[float] = None) -> "Client":
+        """
+        Создание клиента из заведомо корректных данных без проверок
+        
+        Только для данных, уже прошедших проверку (transport.validation) или
+        взятых из объектов и снимков самого пакета. Внешний ввод передается
+        в конструктор, который проверяет каждое поле.
+        
+        Args:
+            name (str): Имя клиента (без пробелов по краям)
+            cargo_weight (float): Вес груза в килограммах
+            is_vip (bool, optional): VIP-статус клиента. По умолчанию False.
+            needs_refrigeration (bool, optional): Груз требует холодильника. По умолчанию False.
+            transport_mode (str, optional): Вид перевозки. По умолчанию 'any'.
+            volume (float, optional): Объем груза в м³. По умолчанию не задан.
+            pallets (int, optional): Число паллет. По умолчанию не задано.
+            ready_time (float, optional): Час готовности груза. По умолчанию сразу.
+            deadline (float, optional): Срок доставки. По умолчанию не ограничен.
+        
+        Returns:
+            Client: Новый клиент
+        """
+        client = cls.__new__(cls)
+        client._init_validated(name, cargo_weight, is_vip, needs_refrigeration, transport_mode,
+                               volume, pallets, ready_time, deadline)
+        return client
+    
+    @property
+    def cargo_weight(self) -> float:
+        """Вес груза в килограммах"""
+        return self._cargo_weight_g / GRAMS_PER_KG
+    
+    @cargo_weight.setter
+    def cargo_weight(self, kilograms: float) -> None:
+        self._cargo_weight_g = kg_to_grams(self._validate_cargo_weight(kilograms))
+        self._notify_observers()
+    
+    @property
+    def cargo_weight_g(self) -> int:
+        """Вес груза в граммах (внутреннее представление)"""
+        return self._cargo_weight_g
+    
+    @property
+    def volume(self) -> Optional[float]:
+        """Объем груза в м³ (None, если не задан)"""
+        return None if self._volume_cm3 is None else cm3_to_m3(self._volume_cm3)
+    
+    @volume.setter
+    def volume(self, cubic_meters: Optional[float]) -> None:
+        cubic_meters = self._validate_volume(cubic_meters)
+        self._volume_cm3 = None if cubic_meters is None else m3_to_cm3(cubic_meters)
+        self._notify_observers()
+    
+    @property
+    def pallets(self) -> Optional[int]:
+        """Число паллет (None, если не задано)"""
+        return self._pallets
+    
+    @pallets.setter
+    def pallets(self, pallets: Optional[int]) -> None:
+        self._pallets = self._validate_pallets(pallets)
+        self._notify_observers()
+    
+    @property
+    def is_vip(self) -> bool:
+        """VIP-статус клиента"""
+        return self._is_vip
+    
+    @is_vip.setter
+    def is_vip(self, is_vip: bool) -> None:
+        self._is_vip = self._validate_is_vip(is_vip)
+        self._notify_observers()
+    
+    @property
+    def needs_refrigeration(self) -> bool:
+        """Груз требует холодильника"""
+        return self._needs_refrigeration
+    
+    @needs_refrigeration.setter
+    def needs_refrigeration(self, needs_refrigeration: bool) -> None:
+        self._needs_refrigeration = self._validate_needs_refrigeration(needs_refrigeration)
+        self._notify_observers()
+    
+    @property
+    def transport_mode(self) -> str:
+        """Вид перевозки: 'any', 'road' или 'sea'"""
+        return self._transport_mode
+    
+    @transport_mode.setter
+    def transport_mode(self, transport_mode: str) -> None:
+        self._transport_mode = self._validate_transport_mode(transport_mode)
+        self._notify_observers()
+    
+    def has_dimensions(self) -> bool:
+        """
+        Проверка, заданы ли для груза объем или паллеты
+        
+        Returns:
+            bool: True если задано хотя бы одно измерение кроме веса
+        """
+        return self._volume_cm3 is not None or self._pallets is not None
+    
+    def demand_vector(self) -> Tuple[int, int, int]:
+        """
+        Вектор потребностей груза для векторной упаковки
+        
+        Returns:
+            Tuple[int, int, int]: (вес в граммах, объем в см³, паллеты);
+                незаданные измерения равны нулю
+        """
+        return (self._cargo_weight_g, self._volume_cm3 or 0, self._pallets or 0)
+    
+    def add_observer(self, callback) -> None:
+        """
+        Подписка на изменения клиента
+        
+        Подписчики вызываются после каждого изменения через методы и
+        свойства клиента (вес, VIP-статус, требования, объем, паллеты, имя).
+        
+        Args:
+            callback: Функция callback(client), вызываемая после изменения
+        """
+        self._observers.append(callback)
+    
+    def remove_observer(self, callback) -> None:
+        """
+        Отписка от изменений клиента
+        
+        Args:
+            callback: Ранее подписанная функция
+        """
+        if callback in self._observers:
+            self._observers.remove(callback)
+    
+    def _notify_observers(self) -> None:
+        """Оповещение подписчиков об изменении клиента"""
+        for callback in list(self._observers):
+            callback(self)
+    
+    @staticmethod
+    def _validate_name(name: str) -> str:
         """
         Валидация имени клиента
         
@@ -39,7 +230,8 @@ class Client:
         
         return cleaned_name
     
-    def _validate_cargo_weight(self, weight: float) -> float:
+    @staticmethod
+    def _validate_cargo_weight(weight: float) -> float:
         """
         Валидация веса груза
         
@@ -50,21 +242,26 @@ class Client:
             float: Проверенный вес
             
         Raises:
-            ValueError: Если вес отрицательный или равен нулю
+            ValueError: Если вес отрицательный, равен нулю или меньше 1 г
+                после перевода в граммы
             TypeError: Если вес не является числом
         """
         if not isinstance(weight, (int, float)):
             raise TypeError(f"Вес должен быть числом, получен тип: {type(weight)}")
         
-        if weight <= 0:
+        if not weight > 0:
             raise ValueError(f"Вес груза должен быть положительным числом. Получено: {weight}")
         
-        if weight > 100000:  # Ограничение на максимальный вес (100 тонн)
+        if weight > MAX_CARGO_WEIGHT_KG:
             raise ValueError(f"Вес груза слишком большой. Максимально допустимый вес: 100000 кг. Получено: {weight}")
         
+        if kg_to_grams(weight) == 0:
+            raise ValueError(f"Вес груза меньше 1 г. Получено: {weight}")
+        
         return float(weight)
     
-    def _validate_is_vip(self, is_vip: bool) -> bool:
+    @staticmethod
+    def _validate_is_vip(is_vip: bool) -> bool:
         """
         Валидация VIP-статуса
         
@@ -82,6 +279,153 @@ class Client:
         
         return is_vip
     
+    @staticmethod
+    def _validate_needs_refrigeration(needs_refrigeration: bool) -> bool:
+        """
+        Валидация требования холодильника
+        
+        Args:
+            needs_refrigeration (bool): Флаг для проверки
+            
+        Returns:
+            bool: Проверенный флаг
+            
+        Raises:
+            TypeError: Если значение не является булевым
+        """
+        if not isinstance(needs_refrigeration, bool):
+            raise TypeError(f"Требование холодильника должно быть булевым значением, "
+                            f"получен тип: {type(needs_refrigeration)}")
+        
+        return needs_refrigeration
+    
+    @staticmethod
+    def _validate_transport_mode(transport_mode: str) -> str:
+        """
+        Валидация вида перевозки
+        
+        Args:
+            transport_mode (str): Вид перевозки для проверки
+            
+        Returns:
+            str: Проверенный вид перевозки
+            
+        Raises:
+            ValueError: Если вид перевозки неизвестен
+        """
+        if transport_mode not in TRANSPORT_MODES:
+            raise ValueError(f"Неизвестный вид перевозки: {transport_mode}. "
+                             f"Допустимые значения: {', '.join(TRANSPORT_MODES)}")
+        
+        return transport_mode
+    
+    @staticmethod
+    def _validate_volume(volume: Optional[float]) -> Optional[float]:
+        """
+        Валидация объема груза
+        
+        Args:
+            volume (float, optional): Объем в м³ для проверки
+            
+        Returns:
+            float: Проверенный объем или None
+            
+        Raises:
+            TypeError: Если объем не является числом
+            ValueError: Если объем не положительный
+        """
+        if volume is None:
+            return None
+        
+        if isinstance(volume, bool) or not isinstance(volume, (int, float)):
+            raise TypeError(f"Объем должен быть числом, получен тип: {type(volume)}")
+        
+        if volume <= 0:
+            raise ValueError(f"Объем груза должен быть положительным числом. Получено: {volume}")
+        
+        return float(volume)
+    
+    @staticmethod
+    def _validate_pallets(pallets: Optional[int]) -> Optional[int]:
+        """
+        Валидация числа паллет
+        
+        Args:
+            pallets (int, optional): Число паллет для проверки
+            
+        Returns:
+            int: Проверенное число паллет или None
+            
+        Raises:
+            TypeError: Если значение не является целым числом
+            ValueError: Если число паллет не положительное
+        """
+        if pallets is None:
+            return None
+        
+        if isinstance(pallets, bool) or not isinstance(pallets, int):
+            raise TypeError(f"Число паллет должно быть целым числом, получен тип: {type(pallets)}")
+        
+        if pallets <= 0:
+            raise ValueError(f"Число паллет должно быть положительным. Получено: {pallets}")
+        
+        return pallets
+    
+    @staticmethod
+    def _validate_time(value: Optional[float], label: str) -> Optional[float]:
+        """
+        Валидация момента времени (часы от начала дня планирования)
+        
+        Args:
+            value (float, optional): Время для проверки
+            label (str): Название поля для сообщения об ошибке
+            
+        Returns:
+            float: Проверенное время или None
+            
+        Raises:
+            TypeError: Если время не является числом
+            ValueError: Если время отрицательное
+        """
+        if value is None:
+            return None
+        
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise TypeError(f"{label}: ожидалось число, получен тип: {type(value)}")
+        
+        if value < 0:
+            raise ValueError(f"{label}: значение не может быть отрицательным. Получено: {value}")
+        
+        return float(value)
+    
+    @staticmethod
+    def _validate_time_window(ready_time: Optional[float], deadline: Optional[float]) -> None:
+        """
+        Валидация окна доставки
+        
+        Args:
+            ready_time (float, optional): Проверенное время готовности
+            deadline (float, optional): Проверенный срок доставки
+            
+        Raises:
+            ValueError: Если срок доставки не позже времени готовности
+        """
+        if ready_time is not None and deadline is not None and deadline <= ready_time:
+            raise ValueError(f"Срок доставки ({deadline}) должен быть позже "
+                             f"времени готовности ({ready_time})")
+    
+    def requirements(self) -> int:
+        """
+        Маска требований груза к транспорту (см. transport.compatibility)
+        
+        Returns:
+            int: Битовая маска требований
+        """
+        mask = TRANSPORT_MODES[self.transport_mode]
+        if self.needs_refrigeration:
+            mask |= REFRIGERATED
+        return mask
+    
     def update_cargo_weight(self, new_weight: float) -> None:
         """
         Обновление веса груза с валидацией
@@ -89,7 +433,19 @@ class Client:
         Args:
             new_weight (float): Новый вес груза
         """
-        self.cargo_weight = self._validate_cargo_weight(new_weight)
+        self.cargo_weight = new_weight
+    
+    def rename(self, new_name: str) -> None:
+        """
+        Переименование клиента с валидацией
+        
+        Уникальность имени в компании проверяет TransportCompany.rename_client.
+        
+        Args:
+            new_name (str): Новое имя клиента
+        """
+        self.name = self._validate_name(new_name)
+        self._notify_observers()
     
     def upgrade_to_vip(self) -> None:
         """Повышение клиента до VIP-статуса"""
@@ -109,7 +465,13 @@ class Client:
         vip_status = "VIP" if self.is_vip else "Обычный"
         return (f"Клиент: {self.name}\n"
                 f"Вес груза: {self.cargo_weight:.2f} кг\n"
-                f"Статус: {vip_status}")
+                f"Статус: {vip_status}"
+                + ("\nТребуется холодильник" if self.needs_refrigeration else "")
+                + (f"\nВид перевозки: {self.transport_mode}" if self.transport_mode != "any" else "")
+                + (f"\nОбъем: {self.volume:.3f} м³" if self.volume is not None else "")
+                + (f"\nПаллет: {self.pallets}" if self.pallets is not None else "")
+                + (f"\nГотов к отправке: {self.ready_time:g} ч" if self.ready_time is not None else "")
+                + (f"\nСрок доставки: {self.deadline:g} ч" if self.deadline is not None else ""))
     
     def __str__(self) -> str:
         """Строковое представление объекта"""
@@ -0,0 +1,251 @@
+"""
+Индекс клиентов по имени.
+
+Имена сравниваются без учета регистра. Индекс состоит из словаря для
+точного поиска, отсортированного массива имен для поиска по префиксу
+(бинарный поиск) и индекса триграмм: по нему ищется подстрока (пересечение
+списков имен с триграммами запроса) и похожие имена с опечатками
+(коэффициент Дайса по общим триграммам). Индекс обновляется при каждом
+добавлении, удалении и переименовании клиента, без перестроения.
+"""
+
+import bisect
+import heapq
+import math
+from collections import Counter
+from typing import Dict, Iterator, List, Set
+
+from .client import Client
+
+
+def _key(name: str) -> str:
+    """Ключ имени для сравнения без учета регистра"""
+    return name.lower()
+
+
+def _trigrams(text: str, padded: bool = True) -> Set[str]:
+    """
+    Триграммы строки
+
+    Args:
+        text (str): Строка (ключ имени)
+        padded (bool, optional): Дополнить пробелами по краям, чтобы начало
+            и конец имени давали свои триграммы. По умолчанию True.
+
+    Returns:
+        Set[str]: Множество триграмм
+    """
+    if padded:
+        text = f"  {text} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class ClientIndex:
+    """Индекс клиентов для точного, префиксного, подстрочного и нечеткого поиска"""
+
+    def __init__(self):
+        """Инициализация пустого индекса"""
+        self._clients: Dict[str, List[Client]] = {}   # ключ имени -> клиенты
+        self._keys: Dict[int, str] = {}               # id клиента -> ключ имени
+        self._sorted: List[str] = []                  # ключи имен по возрастанию
+        self._unsorted: Set[str] = set()              # добавленные, еще не влитые в _sorted
+        self._postings: Dict[str, Set[str]] = {}      # триграмма -> ключи имен
+
+    def __len__(self) -> int:
+        """Число клиентов в индексе"""
+        return len(self._keys)
+
+    def add(self, client: Client) -> None:
+        """
+        Добавление клиента в индекс
+
+        Args:
+            client (Client): Клиент
+        """
+        key = _key(client.name)
+        self._keys[id(client)] = key
+        same = self._clients.get(key)
+        if same is not None:
+            same.append(client)
+            return
+        self._clients[key] = [client]
+        # Новые ключи вливаются в отсортированный массив при следующем поиске
+        # по префиксу одной сортировкой, а не вставкой со сдвигом на каждое добавление
+        self._unsorted.add(key)
+        for gram in _trigrams(key):
+            self._postings.setdefault(gram, set()).add(key)
+
+    def remove(self, client: Client) -> None:
+        """
+        Удаление клиента из индекса (отсутствующий клиент пропускается)
+
+        Args:
+            client (Client): Клиент
+        """
+        key = self._keys.pop(id(client), None)
+        if key is None:
+            return
+        same = self._clients[key]
+        same.remove(client)
+        if same:
+            return
+        del self._clients[key]
+        if key in self._unsorted:
+            self._unsorted.discard(key)
+        else:
+            del self._sorted[bisect.bisect_left(self._sorted, key)]
+        for gram in _trigrams(key):
+            keys = self._postings[gram]
+            keys.discard(key)
+            if not keys:
+                del self._postings[gram]
+
+    def update(self, client: Client) -> None:
+        """
+        Обновление записи клиента после возможного переименования
+
+        Args:
+            client (Client): Клиент, уже находящийся в индексе
+        """
+        if self._keys.get(id(client)) != _key(client.name):
+            self.remove(client)
+            self.add(client)
+
+    def clear(self) -> None:
+        """Очистка индекса"""
+        self._clients.clear()
+        self._keys.clear()
+        self._sorted.clear()
+        self._unsorted.clear()
+        self._postings.clear()
+
+    def get(self, name: str) -> List[Client]:
+        """
+        Точный поиск по имени без учета регистра
+
+        Args:
+            name (str): Имя клиента
+
+        Returns:
+            List[Client]: Клиенты с таким именем (в компании — не больше одного)
+        """
+        return list(self._clients.get(_key(name.strip()), ()))
+
+    def _expand(self, keys: Iterator[str], limit: int) -> List[Client]:
+        """Клиенты для ключей имен (не больше limit)"""
+        found: List[Client] = []
+        for key in keys:
+            found.extend(self._clients[key])
+            if len(found) >= limit:
+                return found[:limit]
+        return found
+
+    def prefix(self, text: str, limit: int = 50) -> List[Client]:
+        """
+        Поиск клиентов, чье имя начинается с text, в алфавитном порядке
+
+        Args:
+            text (str): Начало имени
+            limit (int, optional): Наибольшее число результатов. По умолчанию 50.
+
+        Returns:
+            List[Client]: Найденные клиенты
+        """
+        text = _key(text.strip())
+        if self._unsorted:
+            # Массив уже упорядочен, поэтому сортировка сводится к слиянию
+            self._sorted.extend(sorted(self._unsorted))
+            self._sorted.sort()
+            self._unsorted.clear()
+        start = bisect.bisect_left(self._sorted, text)
+
+        def matching() -> Iterator[str]:
+            for position in range(start, len(self._sorted)):
+                key = self._sorted[position]
+                if not key.startswith(text):
+                    return
+                yield key
+
+        return self._expand(matching(), limit)
+
+    def contains(self, text: str, limit: int = 50) -> List[Client]:
+        """
+        Поиск клиентов, чье имя содержит text, в алфавитном порядке
+
+        Для text из трех и более символов кандидаты берутся из пересечения
+        списков триграмм (начиная с самого короткого); более короткий text
+        ищется только как префикс.
+
+        Args:
+            text (str): Часть имени
+            limit (int, optional): Наибольшее число результатов. По умолчанию 50.
+
+        Returns:
+            List[Client]: Найденные клиенты
+        """
+        text = _key(text.strip())
+        if len(text) < 3:
+            return self.prefix(text, limit)
+        postings = sorted((self._postings.get(gram, set()) for gram in _trigrams(text, padded=False)),
+                          key=len)
+        candidates = postings[0].intersection(*postings[1:])
+        # Каждому ключу соответствует хотя бы один клиент, поэтому хватает limit ключей
+        return self._expand(iter(heapq.nsmallest(limit, (key for key in candidates if text in key))), limit)
+
+    def fuzzy(self, text: str, limit: int = 10, min_similarity: float = 0.4) -> List[Client]:
+        """
+        Поиск похожих имен (с опечатками) по общим триграммам
+
+        Args:
+            text (str): Имя или его часть
+            limit (int, optional): Наибольшее число результатов. По умолчанию 10.
+            min_similarity (float, optional): Наименьший коэффициент Дайса
+                (от 0 до 1). По умолчанию 0.4.
+
+        Returns:
+            List[Client]: Клиенты по убыванию сходства
+        """
+        text = _key(text.strip())
+        grams = _trigrams(text)
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+
+        # У ключа с дополнением len(key) + 1 триграмма (с учетом повторов), а
+        # имя не короче двух символов, поэтому подходящий ключ имеет не меньше
+        # required общих триграмм и обязательно встречается в одном из
+        # len(grams) - required + 1 самых коротких списков. Кандидаты берутся
+        # только из них, остальные списки лишь проверяются на вхождение.
+        required = max(1, math.ceil(min_similarity * (len(grams) + 3) / 2))
+        rare = max(0, len(grams) - required + 1)
+        hits: Counter = Counter()
+        for keys in postings[:rare]:
+            hits.update(keys)
+
+        scored = []
+        for key, common in hits.items():
+            common += sum(1 for keys in postings[rare:] if key in keys)
+            similarity = 2 * common / (len(grams) + len(key) + 1)
+            if similarity >= min_similarity:
+                scored.append((-similarity, key))
+        return self._expand((key for _, key in heapq.nsmallest(limit, scored)), limit)
+
+    def search(self, text: str, limit: int = 50) -> List[Client]:
+        """
+        Поиск для диспетчера: имена, начинающиеся с text, затем содержащие
+        его, а если таких нет — похожие
+
+        Args:
+            text (str): Запрос
+            limit (int, optional): Наибольшее число результатов. По умолчанию 50.
+
+        Returns:
+            List[Client]: Найденные клиенты без повторов
+        """
+        found = self.prefix(text, limit)
+        if len(found) < limit:
+            seen = {id(client) for client in found}
+            found.extend(client for client in self.contains(text, limit)
+                         if id(client) not in seen)
+            found = found[:limit]
+        if not found:
+            found = self.fuzzy(text, limit)
+        return found
@@ -0,0 +1,208 @@
+"""
+Совместимость грузов и транспорта.
+
+Требования груза и возможности транспорта кодируются битовыми масками.
+Груз можно везти транспортом, если все биты требований есть среди битов
+возможностей. Клиенты и транспорт с одинаковыми масками образуют классы
+совместимости: планировщик сопоставляет классы между собой (их не больше
+2**число_признаков), а не каждого клиента с каждым транспортом.
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from . import packing
+
+# Биты требований/возможностей
+REFRIGERATED = 1   # холодильная установка
+ROAD = 2           # наземная перевозка
+SEA = 4            # морская перевозка
+
+TRANSPORT_MODES = {
+    "any": 0,
+    "road": ROAD,
+    "sea": SEA,
+}
+
+
+def is_compatible(requirements: int, capabilities: int) -> bool:
+    """
+    Проверка совместимости груза и транспорта по маскам
+
+    Args:
+        requirements (int): Маска требований груза
+        capabilities (int): Маска возможностей транспорта
+
+    Returns:
+        bool: True если транспорт удовлетворяет всем требованиям
+    """
+    return requirements & ~capabilities == 0
+
+
+def group_by_mask(masks: Sequence[int]) -> Dict[int, List[int]]:
+    """
+    Разбиение элементов на классы по маскам
+
+    Args:
+        masks (Sequence[int]): Маска каждого элемента
+
+    Returns:
+        Dict[int, List[int]]: Индексы элементов для каждой маски (в исходном порядке)
+    """
+    classes: Dict[int, List[int]] = {}
+    for index, mask in enumerate(masks):
+        classes.setdefault(mask, []).append(index)
+    return classes
+
+
+def _plan_classes(vip_flags: Sequence[bool], requirements: Sequence[int],
+                  capabilities: Sequence[int], vip_first: bool = True) -> List[Tuple[List[int], List[int]]]:
+    """
+    Классы клиентов в порядке упаковки вместе с совместимым транспортом
+
+    Args:
+        vip_flags (Sequence[bool]): VIP-статусы клиентов
+        requirements (Sequence[int]): Маски требований клиентов
+        capabilities (Sequence[int]): Маски возможностей транспорта
+        vip_first (bool, optional): Выделять VIP-клиентов в отдельные классы,
+            упаковываемые первыми. По умолчанию True.
+
+    Returns:
+        List[Tuple[List[int], List[int]]]: Пары (индексы клиентов класса,
+            индексы совместимого транспорта в исходном порядке)
+    """
+    vehicle_classes = group_by_mask(capabilities)
+    client_classes = group_by_mask([(vip_first and not vip) << 8 | mask
+                                    for vip, mask in zip(vip_flags, requirements)])
+
+    # Совместимый транспорт для каждого класса клиентов (в исходном порядке)
+    compatible = {}
+    for key in client_classes:
+        vehicles = []
+        for capability, members in vehicle_classes.items():
+            if is_compatible(key & 0xFF, capability):
+                vehicles.extend(members)
+        compatible[key] = sorted(vehicles)
+
+    order = sorted(client_classes, key=lambda k: (k >> 8, len(compatible[k])))
+    return [(client_classes[key], compatible[key]) for key in order if compatible[key]]
+
+
+def _subtract(remaining, demand):
+    """Остаток емкости после загрузки груза (число или вектор по измерениям)"""
+    if isinstance(remaining, tuple):
+        return tuple(r - d for r, d in zip(remaining, demand))
+    return remaining - demand
+
+
+def _exhausted(remaining) -> bool:
+    """Остаток, в который не поместится ни один груз (вес груза всегда положителен)"""
+    if isinstance(remaining, tuple):
+        return remaining[0] <= 0
+    return remaining <= 0
+
+
+def pack_by_class(weights: Sequence[int], vip_flags: Sequence[bool], requirements: Sequence[int],
+                  capacities: Sequence[int], capabilities: Sequence[int],
+                  pack: Callable = packing.first_fit, vip_first: bool = True,
+                  costs: Optional[Sequence[float]] = None, pass_loads: bool = False) -> List[int]:
+    """
+    Распределение грузов с учетом совместимости
+
+    Клиенты разбиваются на классы по маске требований (отдельно VIP и
+    остальные), транспорт — по маске возможностей. Для каждого класса
+    клиентов заранее собирается список совместимого транспорта, и класс
+    упаковывается функцией pack только по этому транспорту с учетом уже
+    занятой грузоподъемности. VIP-классы обрабатываются первыми, а внутри
+    одного уровня — классы с меньшим числом подходящего транспорта.
+    Транспорт, заполненный предыдущими классами, в упаковку класса не передается.
+
+    Args:
+        weights (Sequence[int]): Веса грузов в граммах (для векторной упаковки —
+            векторы потребностей, см. transport.vector_packing)
+        vip_flags (Sequence[bool]): VIP-статусы клиентов
+        requirements (Sequence[int]): Маски требований клиентов
+        capacities (Sequence[int]): Грузоподъемности транспорта в граммах
+            (для векторной упаковки — векторы грузоподъемности)
+        capabilities (Sequence[int]): Маски возможностей транспорта
+        pack (Callable, optional): Функция упаковки из transport.packing или
+            transport.vector_packing. По умолчанию first_fit.
+        vip_first (bool, optional): Упаковывать VIP-классы отдельно и первыми.
+            Если False, приоритет VIP обеспечивает сама функция pack (так
+            сбалансированная упаковка видит все грузы класса сразу).
+        costs (Sequence[float], optional): Стоимости рейсов транспорта. Если
+            заданы, pack получает их четвертым аргументом в том же порядке, что
+            и грузоподъемности; транспорт, уже задействованный предыдущими
+            классами, передается с нулевой стоимостью — его рейс уже оплачен.
+        pass_loads (bool, optional): Передавать pack полные грузоподъемности и
+            вес, уже загруженный предыдущими классами (ключевой аргумент loads),
+            вместо остатков. Нужно стратегиям, цель которых зависит от полной
+            грузоподъемности (packing.balanced_fit). Только для весов-чисел.
+            По умолчанию False.
+
+    Returns:
+        List[int]: Индекс транспорта для каждого клиента (-1 если груз не загружен)
+    """
+    remaining = list(capacities)
+    assignment = [-1] * len(weights)
+    opened = [False] * len(capacities)   # транспорт задействован предыдущими классами
+
+    for members, vehicles in _plan_classes(vip_flags, requirements, capabilities, vip_first):
+        vehicles = [j for j in vehicles if not _exhausted(remaining[j])]
+        if not vehicles:
+            continue
+        class_weights = [weights[i] for i in members]
+        class_vips = [vip_flags[i] for i in members]
+        if pass_loads:
+            arguments = [class_weights, class_vips, [capacities[j] for j in vehicles]]
+            keywords = {"loads": [capacities[j] - remaining[j] for j in vehicles]}
+        else:
+            arguments = [class_weights, class_vips, [remaining[j] for j in vehicles]]
+            keywords = {}
+        if costs is not None:
+            arguments.append([0.0 if opened[j] else costs[j] for j in vehicles])
+        class_assignment = pack(*arguments, **keywords)
+        for i, weight, position in zip(members, class_weights, class_assignment):
+            if position >= 0:
+                vehicle_index = vehicles[position]
+                remaining[vehicle_index] = _subtract(remaining[vehicle_index], weight)
+                opened[vehicle_index] = True
+                assignment[i] = vehicle_index
+
+    return assignment
+
+
+def split_by_class(weights: Sequence[int], vip_flags: Sequence[bool], requirements: Sequence[int],
+                   capacities: Sequence[int], capabilities: Sequence[int]) -> List[List[Tuple[int, int]]]:
+    """
+    Распределение с разделением крупных грузов (packing.split_fit) с учетом совместимости
+
+    Классы обрабатываются в том же порядке, что и в pack_by_class.
+
+    Args:
+        weights (Sequence[int]): Веса грузов в граммах
+        vip_flags (Sequence[bool]): VIP-статусы клиентов
+        requirements (Sequence[int]): Маски требований клиентов
+        capacities (Sequence[int]): Грузоподъемности транспорта в граммах
+        capabilities (Sequence[int]): Маски возможностей транспорта
+
+    Returns:
+        List[List[Tuple[int, int]]]: Для каждого клиента — список частей
+            (индекс транспорта, вес части в граммах)
+    """
+    remaining = list(capacities)
+    pieces: List[List[Tuple[int, int]]] = [[] for _ in weights]
+
+    for members, vehicles in _plan_classes(vip_flags, requirements, capabilities):
+        vehicles = [j for j in vehicles if remaining[j] > 0]
+        if not vehicles:
+            continue
+        class_pieces = packing.split_fit([weights[i] for i in members],
+                                         [vip_flags[i] for i in members],
+                                         [remaining[j] for j in vehicles])
+        for i, parts in zip(members, class_pieces):
+            for position, part in parts:
+                vehicle_index = vehicles[position]
+                remaining[vehicle_index] -= part
+                pieces[i].append((vehicle_index, part))
+
+    return pieces
@@ -0,0 +1,222 @@
+"""
+Выбор транспорта с учетом стоимости рейсов (упаковка с переменной стоимостью).
+
+Каждая задействованная единица транспорта стоит свою стоимость рейса,
+и цель — минимальная суммарная стоимость, а не минимальное число единиц.
+Сначала грузы раскладываются жадно по транспорту в порядке возрастания
+стоимости тонны грузоподъемности, затем план улучшается, пока не истечет
+отведенное время: дорогие рейсы расформировываются, а транспорт
+заменяется более дешевым, вмещающим тот же груз.
+"""
+
+import bisect
+import time
+from typing import List, Optional, Sequence, Tuple
+
+from . import packing
+
+# Стоимость рейса транспорта, для которого она не задана: при ней цель
+# совпадает с минимизацией числа транспорта
+DEFAULT_DISPATCH_COST = 1.0
+
+
+def plan_cost(assignment: Sequence[int], costs: Sequence[float]) -> float:
+    """
+    Суммарная стоимость рейсов плана
+
+    Args:
+        assignment (Sequence[int]): Индекс транспорта для каждого клиента
+        costs (Sequence[float]): Стоимости рейсов транспорта
+
+    Returns:
+        float: Сумма стоимостей задействованного транспорта
+    """
+    return sum(costs[j] for j in set(assignment) if j >= 0)
+
+
+class _MinCostTree:
+    """Дерево отрезков минимумов стоимости для поиска самого дешевого свободного транспорта"""
+
+    def __init__(self, costs: Sequence[float]):
+        """
+        Инициализация дерева
+
+        Args:
+            costs (Sequence[float]): Стоимости (float('inf') — транспорт недоступен)
+        """
+        size = 1
+        while size < max(len(costs), 1):
+            size *= 2
+        self.size = size
+        self.tree: List[Tuple[float, int]] = [(float("inf"), -1)] * (2 * size)
+        for position, cost in enumerate(costs):
+            self.tree[size + position] = (cost, position)
+        for i in range(size - 1, 0, -1):
+            self.tree[i] = min(self.tree[2 * i], self.tree[2 * i + 1])
+
+    def update(self, position: int, cost: float) -> None:
+        """
+        Изменение стоимости листа
+
+        Args:
+            position (int): Позиция листа
+            cost (float): Новая стоимость
+        """
+        i = position + self.size
+        self.tree[i] = (cost, position)
+        i //= 2
+        while i:
+            self.tree[i] = min(self.tree[2 * i], self.tree[2 * i + 1])
+            i //= 2
+
+    def suffix_min(self, position: int) -> Tuple[float, int]:
+        """
+        Минимальная стоимость среди позиций не левее position
+
+        Args:
+            position (int): Начало диапазона
+
+        Returns:
+            Tuple[float, int]: (стоимость, позиция)
+        """
+        best = (float("inf"), -1)
+        left, right = position + self.size, 2 * self.size
+        while left < right:
+            if left & 1:
+                best = min(best, self.tree[left])
+                left += 1
+            if right & 1:
+                right -= 1
+                best = min(best, self.tree[right])
+            left //= 2
+            right //= 2
+        return best
+
+
+def cost_fit(weights: Sequence[int], vip_flags: Sequence[bool], capacities: Sequence[int],
+             costs: Sequence[float], deadline: Optional[float] = None) -> List[int]:
+    """
+    Распределение грузов с минимизацией суммарной стоимости рейсов
+
+    1. Жадный этап: «первый подходящий» (VIP первыми, по убыванию веса) по
+       транспорту, упорядоченному по стоимости тонны грузоподъемности.
+    2. Улучшение до истечения deadline:
+       - расформирование: грузы транспорта с наибольшей стоимостью на
+         килограмм перевозимого груза переносятся в остатки других
+         задействованных единиц; если поместились все, рейс отменяется;
+       - замена: груз задействованного транспорта целиком перекладывается
+         в самый дешевый свободный транспорт, который его вмещает (поиск
+         по дереву минимумов над транспортом, отсортированным по
+         грузоподъемности), если тот дешевле.
+
+    Незагруженные грузы не добавляются — улучшение только переставляет
+    уже загруженные, поэтому приоритет VIP сохраняется. Транспорт с нулевой
+    стоимостью (например, уже отправленный с грузами другого класса, см.
+    compatibility.pack_by_class) загружается в первую очередь и не
+    расформировывается.
+
+    Args:
+        weights (Sequence[int]): Веса грузов в граммах
+        vip_flags (Sequence[bool]): VIP-статусы клиентов
+        capacities (Sequence[int]): Грузоподъемности транспорта в граммах
+        costs (Sequence[float]): Стоимости рейсов транспорта
+        deadline (float, optional): Момент окончания улучшения (time.time()).
+            По умолчанию улучшение идет до тех пор, пока находит выгоду.
+
+    Returns:
+        List[int]: Индекс транспорта для каждого клиента (-1 если груз не загружен)
+    """
+    vehicles_count = len(capacities)
+    # Транспорт без грузоподъемности ничего не вместит — в конец порядка
+    order = sorted(range(vehicles_count),
+                   key=lambda j: (costs[j] / capacities[j] if capacities[j] > 0 else float("inf"),
+                                  -capacities[j], j))
+    greedy = packing.first_fit(weights, vip_flags, [capacities[j] for j in order])
+    assignment = [order[position] if position >= 0 else -1 for position in greedy]
+
+    loads = [0] * vehicles_count
+    contents: List[List[int]] = [[] for _ in range(vehicles_count)]
+    for i, j in enumerate(assignment):
+        if j >= 0:
+            loads[j] += weights[i]
+            contents[j].append(i)
+
+    # Остатки задействованного транспорта (-1 у свободного)
+    residual = packing.MaxTree([capacities[j] - loads[j] if contents[j] else -1
+                                for j in range(vehicles_count)])
+
+    # Свободный транспорт, отсортированный по грузоподъемности
+    by_capacity = sorted(range(vehicles_count), key=lambda j: capacities[j])
+    sorted_capacities = [capacities[j] for j in by_capacity]
+    position_of = {j: position for position, j in enumerate(by_capacity)}
+    spare = _MinCostTree([float("inf") if contents[j] else costs[j] for j in by_capacity])
+
+    def expired() -> bool:
+        return deadline is not None and time.time() >= deadline
+
+    def eliminate() -> bool:
+        improved = False
+        used = [j for j in range(vehicles_count) if contents[j]]
+        used.sort(key=lambda j: costs[j] / loads[j], reverse=True)
+        for j in used:
+            if expired():
+                break
+            if not contents[j] or costs[j] <= 0:
+                continue
+            residual.update(j, -1)
+            moved = []
+            for i in sorted(contents[j], key=lambda i: -weights[i]):
+                target = residual.find_first(weights[i])
+                if target < 0:
+                    break
+                moved.append((i, target))
+                loads[target] += weights[i]
+                residual.update(target, capacities[target] - loads[target])
+
+            if len(moved) == len(contents[j]):
+                for i, target in moved:
+                    contents[target].append(i)
+                    assignment[i] = target
+                contents[j] = []
+                loads[j] = 0
+                spare.update(position_of[j], costs[j])
+                improved = True
+            else:
+                # Откат: не все грузы поместились
+                for i, target in moved:
+                    loads[target] -= weights[i]
+                    residual.update(target, capacities[target] - loads[target])
+                residual.update(j, capacities[j] - loads[j])
+        return improved
+
+    def downsize() -> bool:
+        improved = False
+        used = [j for j in range(vehicles_count) if contents[j]]
+        used.sort(key=lambda j: -costs[j])
+        for j in used:
+            if expired():
+                break
+            start = bisect.bisect_left(sorted_capacities, loads[j])
+            cost, position = spare.suffix_min(start)
+            if position < 0 or cost >= costs[j]:
+                continue
+
+            target = by_capacity[position]
+            for i in contents[j]:
+                assignment[i] = target
+            contents[target], contents[j] = contents[j], []
+            loads[target], loads[j] = loads[j], 0
+            spare.update(position, float("inf"))
+            spare.update(position_of[j], costs[j])
+            residual.update(target, capacities[target] - loads[target])
+            residual.update(j, -1)
+            improved = True
+        return improved
+
+    while not expired():
+        eliminated = eliminate()
+        downsized = downsize()
+        if not (eliminated or downsized):
+            break
+
+    return assignment
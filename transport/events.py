@@ -0,0 +1,199 @@
+"""
+Типизированные события транспортной компании и шина событий.
+
+Компания и транспортные средства публикуют события об изменениях
+(добавление и удаление клиентов и транспорта, загрузка и выгрузка
+грузов, завершение планирования), поэтому кэши, индексы, счетчики и
+окна интерфейса могут обновляться по изменениям, а не перечитывать
+списки целиком.
+
+Подписчики хранятся по слабым ссылкам: подписка не продлевает жизнь
+объекта (например, закрытого окна), а подписчики удаленных объектов
+отбрасываются сами. Событие, опубликованное внутри пакета (batch),
+доставляется вместе с остальными событиями пакета при выходе из
+внешнего пакета — так массовые операции (распределение грузов, очистка)
+вызывают каждого подписчика один раз со всем списком событий. Пакеты
+отдельные для каждого потока.
+"""
+
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .vehicle import Vehicle
+
+
+class ClientAdded(NamedTuple):
+    """Клиент добавлен в компанию"""
+    client: "Client"
+
+
+class ClientRemoved(NamedTuple):
+    """Клиент удален из компании"""
+    client: "Client"
+
+
+class ClientChanged(NamedTuple):
+    """Клиент изменен (имя, вес груза, VIP-статус, требования или размеры)"""
+    client: "Client"
+
+
+class VehicleAdded(NamedTuple):
+    """Транспортное средство добавлено в компанию"""
+    vehicle: "Vehicle"
+
+
+class VehicleRemoved(NamedTuple):
+    """Транспортное средство удалено из компании"""
+    vehicle: "Vehicle"
+
+
+class VehicleChanged(NamedTuple):
+    """Параметры транспорта изменены (грузоподъемность, стоимость рейса и т.п.)"""
+    vehicle: "Vehicle"
+
+
+class CargoLoaded(NamedTuple):
+    """Груз клиента (или его часть) загружен в транспорт"""
+    vehicle: "Vehicle"
+    client: "Client"
+    weight: float     # загруженный вес в кг
+
+
+class CargoUnloaded(NamedTuple):
+    """Груз клиента (или его часть) выгружен из транспорта"""
+    vehicle: "Vehicle"
+    client: "Client"
+    weight: float     # выгруженный вес в кг
+
+
+class CompanyCleared(NamedTuple):
+    """Из компании удалены все клиенты и транспорт"""
+    clients: Tuple["Client", ...]     # удаленные клиенты в прежнем порядке
+    vehicles: Tuple["Vehicle", ...]   # удаленный транспорт в прежнем порядке
+
+
+class PlanCompleted(NamedTuple):
+    """Завершено распределение грузов"""
+    strategy: str                                          # 'first_fit', 'split', 'apply', ...
+    distribution: Dict[str, List[Tuple["Client", float]]]  # {vehicle_id: [(клиент, вес в кг), ...]}
+    unloaded: Tuple["Client", ...]                         # клиенты, чей груз не загружен
+    from_cache: bool                                       # план взят из кэша планов
+
+
+class EventBus:
+    """Шина событий со слабыми ссылками на подписчиков и пакетной доставкой"""
+
+    def __init__(self):
+        """Инициализация шины без подписчиков"""
+        self._subscribers: List[Tuple[weakref.ref, Tuple[type, ...]]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()   # отложенные события открытого пакета потока
+
+    @staticmethod
+    def _reference(callback: Callable) -> weakref.ref:
+        """Слабая ссылка на функцию или связанный метод"""
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            return weakref.WeakMethod(callback)
+        return weakref.ref(callback)
+
+    def subscribe(self, callback: Callable[[List[Any]], None], *event_types: type) -> None:
+        """
+        Подписка на события
+
+        Подписчик хранится по слабой ссылке: вызывающий код должен сам
+        хранить функцию (лямбда без других ссылок будет сразу удалена).
+
+        Args:
+            callback (Callable[[List[Any]], None]): Функция или метод, получающий
+                список событий (одно событие — список из одного элемента)
+            *event_types (type): Типы событий; по умолчанию все события
+        """
+        with self._lock:
+            self._subscribers.append((self._reference(callback), event_types))
+
+    def unsubscribe(self, callback: Callable) -> None:
+        """
+        Отписка от событий
+
+        Args:
+            callback (Callable): Ранее подписанная функция или метод
+        """
+        with self._lock:
+            self._subscribers = [(reference, types) for reference, types in self._subscribers
+                                 if reference() not in (None, callback)]
+
+    def __len__(self) -> int:
+        """Число живых подписчиков"""
+        with self._lock:
+            return sum(1 for reference, _ in self._subscribers if reference() is not None)
+
+    def _pending(self) -> Optional[List[Any]]:
+        """Отложенные события текущего пакета потока (None — вне пакета)"""
+        return getattr(self._local, "pending", None)
+
+    def publish(self, event: Any) -> None:
+        """
+        Публикация события: внутри пакета оно откладывается до конца пакета,
+        иначе доставляется сразу
+
+        Args:
+            event (Any): Событие
+        """
+        if not self._subscribers:
+            # Без подписчиков события не копятся (массовые операции не тратят память)
+            return
+        pending = self._pending()
+        if pending is not None:
+            pending.append(event)
+        else:
+            self._dispatch([event])
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Пакет событий: события, опубликованные внутри (в том же потоке),
+        доставляются одним списком при выходе из внешнего пакета
+        """
+        outer = self._pending() is None
+        if outer:
+            self._local.pending = []
+        try:
+            yield
+        finally:
+            if outer:
+                events = self._local.pending
+                self._local.pending = None
+                if events:
+                    self._dispatch(events)
+
+    def _dispatch(self, events: List[Any]) -> None:
+        """
+        Доставка событий подписчикам
+
+        Ошибка одного подписчика не мешает остальным и не прерывает
+        операцию, опубликовавшую события.
+
+        Args:
+            events (List[Any]): События в порядке публикации
+        """
+        with self._lock:
+            if not self._subscribers:
+                return
+            live = [(reference(), types) for reference, types in self._subscribers]
+            if any(callback is None for callback, _ in live):
+                self._subscribers = [entry for entry, (callback, _) in zip(self._subscribers, live)
+                                     if callback is not None]
+        for callback, types in live:
+            if callback is None:
+                continue
+            selected = [event for event in events if isinstance(event, types)] if types else events
+            if not selected:
+                continue
+            try:
+                callback(selected)
+            except Exception as e:
+                print(f"Ошибка в подписчике событий: {e}")
@@ -0,0 +1,317 @@
+"""
+История изменений компании с отменой и повтором (undo/redo).
+
+История подписана на шину событий компании (events.py) и хранит не
+снимки компании, а разности: добавленные и удаленные записи клиентов и
+транспорта и изменения распределения грузов. Каждый пакет событий
+(один вызов изменяющего метода компании или внешний пакет, например
+загрузка файла) — один шаг истории.
+
+События загрузки и выгрузки внутри шага сворачиваются в итоговые
+изменения пар (транспорт, клиент): перепланирование, которое сбросило
+весь транспорт и загрузило почти все так же, оставляет в истории только
+переставленные грузы. Поэтому отмена и повтор перепланирования стоят
+времени, пропорционального разнице планов, а не размеру компании.
+
+Глубина истории ограничена: самые старые шаги отбрасываются. Изменения
+полей клиентов (имя, вес, VIP-статус) и параметров транспорта
+(грузоподъемность, стоимость рейса) в историю не записываются.
+
+Если шаг не удается применить (например, грузоподъемность транспорта
+уменьшили и груз больше не помещается), уже примененные операции шага
+откатываются, а шаг остается в своем стеке.
+"""
+
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from .events import (CargoLoaded, CargoUnloaded, ClientAdded, ClientRemoved, CompanyCleared,
+                     PlanCompleted, VehicleAdded, VehicleRemoved)
+from .units import kg_to_grams
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .transport_company import TransportCompany
+    from .vehicle import Vehicle
+
+# Глубина истории по умолчанию (число шагов отмены)
+DEFAULT_DEPTH = 50
+
+# Название шага по первому событию этого типа в пакете (в порядке приоритета)
+_LABELS = (
+    (CompanyCleared, "очистка данных"),
+    (PlanCompleted, "распределение грузов"),
+    (ClientAdded, "добавление клиента"),
+    (ClientRemoved, "удаление клиента"),
+    (VehicleAdded, "добавление транспорта"),
+    (VehicleRemoved, "удаление транспорта"),
+    ((CargoLoaded, CargoUnloaded), "изменение загрузки"),
+)
+
+
+class AssignmentChange(NamedTuple):
+    """Изменение груза клиента в транспорте за шаг"""
+    vehicle: "Vehicle"
+    client: "Client"
+    before_g: int    # загруженный вес до шага в граммах (0 — не загружен)
+    after_g: int     # загруженный вес после шага в граммах (0 — не загружен)
+
+
+class Assignments(NamedTuple):
+    """Итоговые изменения распределения подряд идущих событий загрузки и выгрузки"""
+    changes: Tuple[AssignmentChange, ...]
+
+
+class Step(NamedTuple):
+    """Шаг истории"""
+    label: str                   # название действия для интерфейса
+    operations: Tuple[Any, ...]  # события записей и Assignments в порядке изменений
+
+
+class History:
+    """Стек отмены и повтора изменений компании с ограниченной глубиной"""
+
+    def __init__(self, company: "TransportCompany", depth: int = DEFAULT_DEPTH):
+        """
+        Инициализация истории и подписка на события компании
+
+        Шина событий хранит подписчиков по слабым ссылкам, поэтому историю
+        должен хранить владелец (например, окно интерфейса).
+
+        Args:
+            company (TransportCompany): Компания
+            depth (int, optional): Наибольшее число шагов отмены. По умолчанию 50.
+
+        Raises:
+            TypeError: Если глубина не целое число
+            ValueError: Если глубина не положительная
+        """
+        if not isinstance(depth, int) or isinstance(depth, bool):
+            raise TypeError(f"Глубина истории должна быть целым числом, получен тип: {type(depth)}")
+        if depth <= 0:
+            raise ValueError(f"Глубина истории должна быть положительной. Получено: {depth}")
+        self.company = company
+        self.depth = depth
+        self._undo: Deque[Step] = deque(maxlen=depth)
+        self._redo: List[Step] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()   # поток, который сейчас отменяет или повторяет шаг
+        company.events.subscribe(self._record)
+
+    @property
+    def can_undo(self) -> bool:
+        """Есть ли шаг для отмены"""
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        """Есть ли шаг для повтора"""
+        return bool(self._redo)
+
+    @property
+    def undo_label(self) -> Optional[str]:
+        """Название шага, который будет отменен (None — отменять нечего)"""
+        with self._lock:
+            return self._undo[-1].label if self._undo else None
+
+    @property
+    def redo_label(self) -> Optional[str]:
+        """Название шага, который будет повторен (None — повторять нечего)"""
+        with self._lock:
+            return self._redo[-1].label if self._redo else None
+
+    def clear(self) -> None:
+        """Удаление всех шагов отмены и повтора"""
+        with self._lock:
+            self._undo.clear()
+            self._redo.clear()
+
+    @staticmethod
+    def _compact(events: List[Any]) -> Tuple[Any, ...]:
+        """
+        Операции шага: события записей как есть, а подряд идущие события
+        загрузки и выгрузки — итоговыми изменениями пар (транспорт, клиент)
+
+        Args:
+            events (List[Any]): События пакета
+
+        Returns:
+            Tuple[Any, ...]: Операции шага (пустой кортеж — шаг ничего не изменил)
+        """
+        operations: List[Any] = []
+        pending: Dict[Tuple[int, int], List[Any]] = {}
+
+        def flush() -> None:
+            changes = tuple(AssignmentChange(vehicle, client, before_g, after_g)
+                            for vehicle, client, before_g, after_g in pending.values()
+                            if before_g != after_g)
+            if changes:
+                operations.append(Assignments(changes))
+            pending.clear()
+
+        for event in events:
+            if isinstance(event, (CargoLoaded, CargoUnloaded)):
+                key = (id(event.vehicle), id(event.client))
+                entry = pending.get(key)
+                weight_g = kg_to_grams(event.weight)
+                if entry is None:
+                    # Первое событие пары в шаге задает вес до шага
+                    before_g = 0 if isinstance(event, CargoLoaded) else weight_g
+                    entry = pending[key] = [event.vehicle, event.client, before_g, before_g]
+                entry[3] = weight_g if isinstance(event, CargoLoaded) else 0
+            elif isinstance(event, (ClientAdded, ClientRemoved, VehicleAdded, VehicleRemoved,
+                                    CompanyCleared)):
+                flush()
+                operations.append(event)
+        flush()
+        return tuple(operations)
+
+    def _record(self, events: List[Any]) -> None:
+        """Запись пакета событий компании шагом истории"""
+        if getattr(self._local, "replaying", False):
+            # События собственной отмены или повтора шагами не считаются
+            return
+        operations = self._compact(events)
+        if not operations:
+            return
+        label = next((label for types, label in _LABELS
+                      if any(isinstance(event, types) for event in events)), "изменение")
+        with self._lock:
+            self._undo.append(Step(label, operations))
+            self._redo.clear()
+
+    @staticmethod
+    def _move_cargo(changes: Tuple[AssignmentChange, ...], forward: bool) -> bool:
+        """
+        Перенос грузов к состоянию после шага (forward) или до него
+
+        Сначала выгружаются все изменяемые грузы, затем загружаются новые
+        веса — так освобожденная грузоподъемность доступна для загрузки.
+        Если груз не помещается, прежнее распределение восстанавливается.
+
+        Returns:
+            bool: True если все грузы перенесены
+        """
+        for vehicle, client, before_g, after_g in changes:
+            current_g = before_g if forward else after_g
+            if current_g:
+                vehicle.unload_cargo(client.name)
+        loaded: List[AssignmentChange] = []
+        for change in changes:
+            vehicle, client, before_g, after_g = change
+            weight_g = after_g if forward else before_g
+            if not weight_g:
+                continue
+            if not vehicle.load_validated(client, weight_g):
+                print(f"Груз клиента {client.name} не помещается в транспорт {vehicle.vehicle_id}")
+                for vehicle, client, _, _ in loaded:
+                    vehicle.unload_cargo(client.name)
+                for vehicle, client, before_g, after_g in changes:
+                    current_g = before_g if forward else after_g
+                    if current_g:
+                        vehicle.load_validated(client, current_g)
+                return False
+            loaded.append(change)
+        return True
+
+    def _apply(self, operation: Any, forward: bool) -> bool:
+        """
+        Повтор (forward) или отмена операции шага
+
+        Args:
+            operation (Any): Событие записи или Assignments
+            forward (bool): True — повтор, False — отмена
+
+        Returns:
+            bool: True если операция применена (при False компания не изменилась)
+        """
+        company = self.company
+        if isinstance(operation, Assignments):
+            return self._move_cargo(operation.changes, forward)
+        if isinstance(operation, CompanyCleared):
+            if forward:
+                company.clear()
+                return True
+            # Транспорт сохранил свои грузы — при возврате распределение восстановится
+            for client in operation.clients:
+                company.add_client(client)
+            for vehicle in operation.vehicles:
+                company.add_vehicle(vehicle)
+            return True
+        if isinstance(operation, (ClientAdded, ClientRemoved)):
+            if forward == isinstance(operation, ClientAdded):
+                return company.add_client(operation.client)
+            return company.remove_client(operation.client.name)
+        if forward == isinstance(operation, VehicleAdded):
+            return company.add_vehicle(operation.vehicle)
+        return company.remove_vehicle(operation.vehicle.vehicle_id)
+
+    def _replay(self, step: Step, forward: bool) -> bool:
+        """
+        Применение шага одним пакетом событий, который история не записывает
+
+        Если операция не применилась, уже примененные операции шага
+        откатываются в обратном порядке.
+
+        Returns:
+            bool: True если шаг применен целиком
+        """
+        operations = step.operations if forward else tuple(reversed(step.operations))
+        self._local.replaying = True
+        try:
+            with self.company.events.batch():
+                for done, operation in enumerate(operations):
+                    if not self._apply(operation, forward):
+                        for applied in reversed(operations[:done]):
+                            self._apply(applied, not forward)
+                        return False
+            return True
+        finally:
+            self._local.replaying = False
+
+    def undo(self) -> bool:
+        """
+        Отмена последнего шага
+
+        Returns:
+            bool: True если шаг отменен, False если отменять нечего или шаг
+                не удалось применить (тогда он остается в стеке отмены)
+        """
+        with self._lock:
+            if not self._undo:
+                print("Нет действий для отмены")
+                return False
+            step = self._undo.pop()
+        if not self._replay(step, forward=False):
+            with self._lock:
+                self._undo.append(step)
+            print(f"Не удалось отменить: {step.label}")
+            return False
+        with self._lock:
+            self._redo.append(step)
+        print(f"Отменено: {step.label}")
+        return True
+
+    def redo(self) -> bool:
+        """
+        Повтор последнего отмененного шага
+
+        Returns:
+            bool: True если шаг повторен, False если повторять нечего или шаг
+                не удалось применить (тогда он остается в стеке повтора)
+        """
+        with self._lock:
+            if not self._redo:
+                print("Нет действий для повтора")
+                return False
+            step = self._redo.pop()
+        if not self._replay(step, forward=True):
+            with self._lock:
+                self._redo.append(step)
+            print(f"Не удалось повторить: {step.label}")
+            return False
+        with self._lock:
+            self._undo.append(step)
+        print(f"Повторено: {step.label}")
+        return True
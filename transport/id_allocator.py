@@ -0,0 +1,104 @@
+"""
+Выдача идентификаторов транспортных средств.
+
+Идентификатор — префикс, необязательный номер сегмента и значение
+монотонного счетчика в шестнадцатеричном виде (не короче 8 цифр), например
+'0000002a' или 'V3-0000002a'. Выдача стоит одного инкремента под
+блокировкой, без генерации UUID, а уникальность гарантирована, а не
+вероятностна. Разные процессы (или компании, заполняемые независимо)
+получают разные номера сегментов и не пересекаются без согласования.
+
+Идентификаторы, пришедшие извне (например, из сохраненного файла),
+регистрируются методом reserve: счетчик переводится за них, и новые
+идентификаторы с ними не совпадут. Число счетчика (number) удобно
+хранить в индексах и двоичных снимках вместо строки.
+"""
+
+import threading
+from typing import Optional
+
+
+class IdAllocator:
+    """Монотонный счетчик идентификаторов с префиксом и сегментом"""
+
+    def __init__(self, prefix: str = "", shard: Optional[int] = None, start: int = 1):
+        """
+        Инициализация счетчика
+
+        Args:
+            prefix (str, optional): Префикс идентификаторов. По умолчанию пустой.
+            shard (int, optional): Номер сегмента (неотрицательный). По умолчанию без сегмента.
+            start (int, optional): Первое значение счетчика. По умолчанию 1.
+
+        Raises:
+            TypeError: Если префикс не строка
+            ValueError: Если префикс содержит '-'
+            ValueError: Если номер сегмента отрицательный
+            ValueError: Если start отрицательный
+        """
+        if not isinstance(prefix, str):
+            raise TypeError(f"Префикс должен быть строкой, получен тип: {type(prefix)}")
+        if "-" in prefix:
+            raise ValueError(f"Префикс не может содержать '-'. Получено: {prefix}")
+        if shard is not None and shard < 0:
+            raise ValueError(f"Номер сегмента не может быть отрицательным. Получено: {shard}")
+        if start < 0:
+            raise ValueError(f"Начальное значение не может быть отрицательным. Получено: {start}")
+        self.prefix = prefix
+        self.shard = shard
+        self._head = prefix if shard is None else f"{prefix}{shard:x}-"
+        self._next = start
+        self._lock = threading.Lock()
+
+    def allocate(self) -> str:
+        """
+        Выдача нового идентификатора
+
+        Returns:
+            str: Идентификатор, не совпадающий ни с выданными, ни с
+                зарегистрированными через reserve
+        """
+        with self._lock:
+            number = self._next
+            self._next += 1
+        return f"{self._head}{number:08x}"
+
+    def number(self, identifier: str) -> Optional[int]:
+        """
+        Значение счетчика в идентификаторе этого счетчика
+
+        Args:
+            identifier (str): Идентификатор
+
+        Returns:
+            int: Значение счетчика или None, если идентификатор другого формата
+                (другой префикс или сегмент)
+        """
+        if not identifier.startswith(self._head):
+            return None
+        digits = identifier[len(self._head):]
+        if len(digits) < 8:
+            return None
+        try:
+            return int(digits, 16)
+        except ValueError:
+            return None
+
+    def reserve(self, identifier: str) -> None:
+        """
+        Регистрация идентификатора, полученного извне: счетчик переводится
+        за него, чтобы новые идентификаторы с ним не совпали
+
+        Args:
+            identifier (str): Идентификатор (другого формата — пропускается)
+        """
+        number = self.number(identifier)
+        if number is None:
+            return
+        with self._lock:
+            if number >= self._next:
+                self._next = number + 1
+
+
+# Счетчик идентификаторов транспорта по умолчанию (общий для процесса)
+vehicle_ids = IdAllocator()
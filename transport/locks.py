@@ -0,0 +1,100 @@
+"""
+Примитивы синхронизации для потокобезопасного режима транспортной компании.
+"""
+
+import threading
+from contextlib import contextmanager, nullcontext
+from typing import Iterator
+
+
+class ReadWriteLock:
+    """
+    Блокировка «много читателей / один писатель»
+
+    Писатели имеют приоритет: пока писатель ждет, новые читатели не
+    допускаются, поэтому частые чтения не могут бесконечно задерживать запись.
+
+    Поток, удерживающий блокировку на запись, может захватывать ее и на
+    чтение (например, подписчик на загрузку транспорта, вызванный во время
+    распределения, читает компанию через find_client или totals). Остальные
+    повторные захваты не поддерживаются и приводят к взаимной блокировке:
+    запись внутри записи, а также запись при удерживаемом этим же потоком
+    чтении.
+    """
+
+    def __init__(self):
+        """Инициализация блокировки"""
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+        self._writer_thread = None   # идентификатор потока-писателя
+        self._writer_reads = 0       # чтения, захваченные писателем внутри записи
+
+    def acquire_read(self) -> None:
+        """Захват блокировки на чтение"""
+        with self._condition:
+            if self._writer_thread == threading.get_ident():
+                # Писатель уже исключил всех остальных — чтение не ждет
+                self._writer_reads += 1
+                return
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        """Освобождение блокировки на чтение"""
+        with self._condition:
+            if self._writer_reads and self._writer_thread == threading.get_ident():
+                self._writer_reads -= 1
+                return
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """Захват блокировки на запись"""
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+            self._writer_thread = threading.get_ident()
+
+    def release_write(self) -> None:
+        """Освобождение блокировки на запись"""
+        with self._condition:
+            self._writer = False
+            self._writer_thread = None
+            self._condition.notify_all()
+
+    @contextmanager
+    def read_locked(self) -> Iterator[None]:
+        """Контекстный менеджер для чтения"""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self) -> Iterator[None]:
+        """Контекстный менеджер для записи"""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class NullReadWriteLock:
+    """Заглушка с интерфейсом ReadWriteLock для однопоточного режима"""
+
+    def read_locked(self) -> nullcontext:
+        """Контекстный менеджер для чтения (ничего не блокирует)"""
+        return nullcontext()
+
+    def write_locked(self) -> nullcontext:
+        """Контекстный менеджер для записи (ничего не блокирует)"""
+        return nullcontext()
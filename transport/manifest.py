@@ -0,0 +1,132 @@
+"""
+Манифест груза транспортного средства.
+
+Грузы хранятся в словаре по порядковому номеру загрузки (словарь
+сохраняет порядок вставки), а дополнительный словарь связывает имя
+клиента (без учета регистра) с номерами его грузов. Поэтому поиск и
+выгрузка груза по имени стоят O(1), а перебор грузов идет в порядке
+загрузки.
+"""
+
+import bisect
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .client import Client
+
+
+class LoadedCargo(NamedTuple):
+    """Загруженный груз (или его часть)"""
+    client: Client
+    weight_g: int       # загруженный вес в граммах
+    volume_cm3: int     # занятый объем в см³
+    pallets: int        # занятые паллетоместа
+
+
+class Manifest:
+    """
+    Манифест груза: клиенты в порядке загрузки
+
+    Ведет себя как последовательность клиентов только для чтения (len,
+    перебор, индекс, проверка на пустоту), поэтому заменяет прежний список
+    Vehicle.clients_list. Доступ по индексу стоит O(k) и нужен только для вывода.
+    """
+
+    __slots__ = ("_entries", "_by_name", "_next")
+
+    def __init__(self):
+        """Инициализация пустого манифеста"""
+        self._entries: Dict[int, Tuple[str, LoadedCargo]] = {}   # номер -> (ключ имени, груз)
+        self._by_name: Dict[str, List[int]] = {}                 # ключ имени -> номера по возрастанию
+        self._next = 0
+
+    def add(self, cargo: LoadedCargo) -> None:
+        """
+        Добавление груза в конец манифеста
+
+        Args:
+            cargo (LoadedCargo): Груз
+        """
+        key = cargo.client.name.lower()
+        self._entries[self._next] = (key, cargo)
+        self._by_name.setdefault(key, []).append(self._next)
+        self._next += 1
+
+    def _unlink(self, number: int, key: str) -> None:
+        """Удаление номера груза из списка его имени"""
+        numbers = self._by_name[key]
+        numbers.pop(bisect.bisect_left(numbers, number))
+        if not numbers:
+            del self._by_name[key]
+
+    def remove(self, client_name: str) -> Optional[LoadedCargo]:
+        """
+        Удаление первого по порядку загрузки груза клиента с таким именем
+
+        Если клиента переименовали после загрузки, его груз находится под
+        старым именем; такие записи переносятся под текущее имя при первой
+        встрече, а поиск отсутствующего имени просматривает весь манифест.
+        Порядок загрузки среди грузов с одинаковым именем соблюдается, пока
+        их клиентов не переименовывают.
+
+        Args:
+            client_name (str): Имя клиента (без учета регистра)
+
+        Returns:
+            LoadedCargo: Удаленный груз или None, если клиент не найден
+        """
+        key = client_name.lower()
+        numbers = self._by_name.get(key, ())
+        while numbers:
+            number = numbers[0]
+            cargo = self._entries[number][1]
+            current = cargo.client.name.lower()
+            if current == key:
+                self._unlink(number, key)
+                del self._entries[number]
+                return cargo
+            self._relink(number, key, current)
+            numbers = self._by_name.get(key, ())
+
+        # Клиента могли переименовать в это имя после загрузки
+        for number, (stored_key, cargo) in self._entries.items():
+            if stored_key != key and cargo.client.name.lower() == key:
+                self._unlink(number, stored_key)
+                del self._entries[number]
+                return cargo
+        return None
+
+    def _relink(self, number: int, old_key: str, new_key: str) -> None:
+        """Перенос груза переименованного клиента под его текущее имя"""
+        self._unlink(number, old_key)
+        self._entries[number] = (new_key, self._entries[number][1])
+        bisect.insort(self._by_name.setdefault(new_key, []), number)
+
+    def clear(self) -> None:
+        """Удаление всех грузов"""
+        self._entries.clear()
+        self._by_name.clear()
+
+    def entries(self) -> Iterator[LoadedCargo]:
+        """
+        Грузы в порядке загрузки
+
+        Returns:
+            Iterator[LoadedCargo]: Перебор грузов
+        """
+        return (cargo for _, cargo in self._entries.values())
+
+    def __len__(self) -> int:
+        """Число грузов"""
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Client]:
+        """Перебор клиентов в порядке загрузки"""
+        return (cargo.client for _, cargo in self._entries.values())
+
+    def __getitem__(self, index):
+        """Клиент (или список клиентов для среза) по позиции в порядке загрузки"""
+        return list(self)[index]
+
+    def __repr__(self) -> str:
+        """Представление для отладки"""
+        return f"Manifest({list(self)!r})"
@@ -0,0 +1,495 @@
+"""
+Чистые алгоритмы упаковки грузов по транспортным средствам.
+
+Функции модуля работают только со списками целых чисел — весов грузов и
+грузоподъемностей в граммах (см. transport.units) — и не изменяют объекты
+Vehicle/Client. Благодаря этому их можно запускать в отдельных процессах,
+а все сравнения остатков выполняются точно, без ошибок округления.
+"""
+
+import bisect
+import heapq
+import random
+from typing import List, Optional, Sequence, Tuple
+
+
+def sort_order(weights: Sequence[int], vip_flags: Sequence[bool]) -> List[int]:
+    """
+    Порядок обработки клиентов: VIP в первую очередь, затем по убыванию веса
+
+    Args:
+        weights (Sequence[int]): Веса грузов в граммах
+        vip_flags (Sequence[bool]): VIP-статусы клиентов
+
+    Returns:
+        List[int]: Индексы клиентов в порядке загрузки
+    """
+    return sorted(range(len(weights)), key=lambda i: (not vip_flags[i], -weights[i]))
+
+
+class MaxTree:
+    """Дерево отрезков по остаткам грузоподъемности для поиска первого подходящего транспорта"""
+
+    def __init__(self, values: Sequence[int]):
+        """
+        Инициализация дерева
+
+        Args:
+            values (Sequence[int]): Начальные остатки грузоподъемности
+        """
+        size = 1
+        while size < max(len(values), 1):
+            size *= 2
+        self.size = size
+        self.tree = [-1] * (2 * size)
+        self.tree[size:size + len(values)] = values
+        for i in range(size - 1, 0, -1):
+            self.tree[i] = max(self.tree[2 * i], self.tree[2 * i + 1])
+
+    def find_first(self, need: int) -> int:
+        """
+        Поиск самого левого листа со значением не меньше need
+
+        Args:
+            need (int): Требуемый остаток
+
+        Returns:
+            int: Индекс листа или -1, если подходящего нет
+        """
+        tree = self.tree
+        if tree[1] < need:
+            return -1
+        i = 1
+        while i < self.size:
+            i = 2 * i if tree[2 * i] >= need else 2 * i + 1
+        return i - self.size
+
+    def update(self, index: int, value: int) -> None:
+        """
+        Обновление значения листа
+
+        Args:
+            index (int): Индекс листа
+            value (int): Новое значение
+        """
+        tree = self.tree
+        i = index + self.size
+        tree[i] = value
+        i //= 2
+        while i:
+            tree[i] = max(tree[2 * i], tree[2 * i + 1])
+            i //= 2
+
+
+def first_fit(weights: Sequence[int], vip_flags: Sequence[bool],
+              capacities: Sequence[int]) -> List[int]:
+    """
+    Распределение грузов методом «первый подходящий» (VIP первыми, по убыванию веса)
+
+    Поиск транспорта выполняется по дереву отрезков, поэтому распределение
+    занимает O(n log m) вместо O(n * m) при полном переборе.
+
+    Args:
+        weights (Sequence[int]): Веса грузов в граммах
+        vip_flags (Sequence[bool]): VIP-статусы клиентов
+        capacities (Sequence[int]): Грузоподъемности транспорта в граммах
+
+    Returns:
+        List[int]: Индекс транспорта для каждого клиента (-1 если груз не загружен)
+    """
+    assignment = [-1] * len(weights)
+    remaining = list(capacities)
+    tree = MaxTree(remaining)
+
+    for i in sort_order(weights, vip_flags):
+        weight = weights[i]
+        vehicle_index = tree.find_first(weight)
+        if vehicle_index < 0:
+            continue
+        remaining[vehicle_index] -= weight
+        tree.update(vehicle_index, remaining[vehicle_index])
+        assignment[i] = vehicle_index
+
+    return assignment
+
+
+def split_fit(weights: Sequence[int], vip_flags: Sequence[bool],
+              capacities: Sequence[int]) -> List[List[Tuple[int, int]]]:
+    """
+    Распределение с разделением грузов, не помещающихся целиком ни в один транспорт
+
+    Грузы обрабатываются в порядке sort_order. Груз, помещающийся целиком,
+    кладется в первый подходящий транспорт. Иначе он делится на части:
+    каждая часть заполняет транспорт с наибольшим остатком, пока остаток
+    груза не поместится целиком. Так число частей минимально для каждого
+    груза. Груз, который не помещается даже во весь свободный остаток,
+    не загружается совсем.
+
+    Args:
+        weights (Sequence[int]): Веса грузов в граммах
+        vip_flags (Sequence[bool]): VIP-статусы клиентов
+        capacities (Sequence[int]): Грузоподъемности транспорта в граммах
+
+    Returns:
+        List[List[Tuple[int, int]]]: Для каждого клиента — список частей
+            (индекс транспорта, вес части в граммах); пустой, если груз не загружен
+    """
+    pieces: List[List[Tuple[int, int]]] = [[] for _ in weights]
+    remaining = list(capacities)
+    free = sum(remaining)
+    tree = MaxTree(remaining)
+
+    for i in sort_order(weights, vip_flags):
+        rest = weights[i]
+        if rest > free:
+            continue
+
+        while rest:
+            vehicle_index = tree.find_first(rest)
+            if vehicle_index >= 0:
+                part = rest
+            else:
+                # Самый вместительный остаток забираем целиком
+                vehicle_index = tree.find_first(tree.tree[1])
+                part = remaining[vehicle_index]
+            remaining[vehicle_index] -= part
+            tree.update(vehicle_index, remaining[vehicle_index])
+            pieces[i].append((vehicle_index, part))
+            rest -= part
+        free -= weights[i]
+
+    return pieces
+
+
+_BALANCE_CANDIDATES = 3
+
+
+def balanced_fit(weights: Sequence[int], vip_flags: Sequence[bool],
+                 capacities: Sequence[int], max_moves: Optional[int] = None,
+                 loads: Optional[Sequence[int]] = None) -> List[int]:
+    """
+    Сбалансированное распределение: минимизация наибольшего процента загрузки
+
+    Жадный алгоритм LPT: грузы в порядке sort_order кладутся туда, где
+    процент загрузки после размещения окажется наименьшим. Кандидаты —
+    несколько наименее загруженных единиц транспорта из кучи по
+    заполненности и транспорт с наибольшим остатком (корень дерева
+    отрезков). Если груз ни в одну из них не помещается, берется первый
+    транспорт с достаточным остатком (дерево отрезков). Затем выполняется
+    проход улучшения: грузы переносятся из самого загруженного транспорта
+    в те же кандидаты, пока это снижает наибольший процент загрузки.
+
+    Каждое размещение стоит O(log m). Перед проходом улучшения грузы
+    каждого транспорта сортируются по весу (O(n log n) всего), и лучший
+    груз для переноса находится двоичным поиском вокруг веса, уравнивающего
+    загрузку пары, — O(log m + log k) сравнений на перенос (k — грузов в
+    транспорте; вставка в список и удаление из него сдвигают его элементы).
+    Число переносов не больше max_moves, по умолчанию — числа транспорта,
+    поэтому время O(n log n + m log m).
+
+    Процент загрузки считается от полной грузоподъемности с учетом груза,
+    уже размещенного в транспорте (loads), — так при упаковке по классам
+    совместимости выравнивается фактическая загрузка, а не доля остатка.
+
+    Args:
+        weights (Sequence[int]): Веса грузов в граммах
+        vip_flags (Sequence[bool]): VIP-статусы клиентов
+        capacities (Sequence[int]): Полные грузоподъемности транспорта в граммах
+        max_moves (int, optional): Наибольшее число переносов при улучшении.
+            По умолчанию равно числу транспорта.
+        loads (Sequence[int], optional): Вес, уже загруженный в транспорт, в
+            граммах (эти грузы не переносятся). По умолчанию транспорт пуст.
+
+    Returns:
+        List[int]: Индекс транспорта для каждого клиента (-1 если груз не загружен)
+    """
+    assignment = [-1] * len(weights)
+    loads = [0] * len(capacities) if loads is None else list(loads)
+    counts = [0] * len(capacities)   # число размещенных здесь грузов
+    tree = MaxTree([capacity - load for capacity, load in zip(capacities, loads)])
+
+    def fill(j: int) -> float:
+        # Транспорт без грузоподъемности считается заполненным
+        return loads[j] / capacities[j] if capacities[j] > 0 else float("inf")
+
+    # Кучи по заполненности (при равенстве — сначала более вместительный);
+    # записи с устаревшим значением пропускаются
+    least = [(fill(j), -capacities[j], j) for j in range(len(capacities))]
+    heapq.heapify(least)
+    most = []
+
+    def push(j: int) -> None:
+        heapq.heappush(least, (fill(j), -capacities[j], j))
+        if counts[j]:
+            heapq.heappush(most, (-fill(j), j))
+
+    def candidates(exclude: int = -1) -> List[int]:
+        # Несколько наименее загруженных и транспорт с наибольшим остатком
+        chosen = []
+        while least and len(chosen) < _BALANCE_CANDIDATES:
+            value, _, j = heapq.heappop(least)
+            if value == fill(j) and j != exclude and j not in chosen:
+                chosen.append(j)
+        for j in chosen:
+            heapq.heappush(least, (fill(j), -capacities[j], j))
+        roomiest = tree.find_first(tree.tree[1])
+        if roomiest >= 0 and roomiest != exclude and roomiest not in chosen:
+            chosen.append(roomiest)
+        return chosen
+
+    def move(i: int, source: int, target: int) -> None:
+        if source >= 0:
+            counts[source] -= 1
+            loads[source] -= weights[i]
+            tree.update(source, capacities[source] - loads[source])
+            push(source)
+        loads[target] += weights[i]
+        counts[target] += 1
+        assignment[i] = target
+        tree.update(target, capacities[target] - loads[target])
+        push(target)
+
+    for i in sort_order(weights, vip_flags):
+        weight = weights[i]
+        fitting = [j for j in candidates() if capacities[j] - loads[j] >= weight]
+        if fitting:
+            # Оставшийся в fitting транспорт вмещает груз, поэтому его грузоподъемность положительна
+            vehicle_index = min(fitting, key=lambda j: ((loads[j] + weight) / capacities[j], j))
+        else:
+            vehicle_index = tree.find_first(weight)
+            if vehicle_index < 0:
+                continue
+        move(i, -1, vehicle_index)
+
+    # Проход улучшения: перенос груза из самого загруженного транспорта.
+    # Грузы транспорта хранятся парами (вес, индекс) по возрастанию веса
+    moves = len(capacities) if max_moves is None else max_moves
+    if moves <= 0:
+        return assignment
+    items: List[List[Tuple[int, int]]] = [[] for _ in capacities]
+    for i, j in enumerate(assignment):
+        if j >= 0:
+            items[j].append((weights[i], i))
+    for pairs in items:
+        pairs.sort()
+    sentinel = len(weights)   # индекс больше любого: (вес, sentinel) — после всех пар с этим весом
+
+    def best_for(high: int, low: int) -> Tuple[float, int]:
+        # Загрузка пары после переноса веса w — max(убывающая, возрастающая);
+        # лучший груз — ближайший к весу их пересечения с одной из сторон
+        room = capacities[low] - loads[low]
+        balance = ((loads[high] * capacities[low] - loads[low] * capacities[high])
+                   // (capacities[high] + capacities[low]))
+        pairs = items[high]
+        split = bisect.bisect_right(pairs, (min(room, balance), sentinel))
+        best = (float("inf"), -1)
+        for position in (split - 1, split):
+            if 0 <= position < len(pairs) and pairs[position][0] <= room:
+                weight, i = pairs[position]
+                peak = max((loads[high] - weight) / capacities[high],
+                           (loads[low] + weight) / capacities[low])
+                best = min(best, (peak, i))
+        return best
+
+    while moves > 0 and most:
+        value, high = most[0]
+        if -value != fill(high) or not counts[high]:
+            heapq.heappop(most)
+            continue
+
+        best_item, best_target, best_peak = -1, -1, fill(high)
+        for low in candidates(exclude=high):
+            if capacities[low] <= 0:
+                continue
+            peak, i = best_for(high, low)
+            if peak < best_peak:
+                best_item, best_target, best_peak = i, low, peak
+        if best_item < 0:
+            break
+
+        pair = (weights[best_item], best_item)
+        del items[high][bisect.bisect_left(items[high], pair)]
+        bisect.insort(items[best_target], pair)
+        move(best_item, high, best_target)
+        moves -= 1
+
+    return assignment
+
+
+def _open_order(capacities: Sequence[int]) -> List[int]:
+    """
+    Порядок ввода транспорта в работу: сначала самый вместительный
+
+    Args:
+        capacities (Sequence[int]): Грузоподъемности транспорта в граммах
+
+    Returns:
+        List[int]: Индексы транспорта
+    """
+    return sorted(range(len(capacities)), key=lambda j: -capacities[j])
+
+
+def best_fit(weights: Sequence[int], vip_flags: Sequence[bool],
+             capacities: Sequence[int]) -> List[int]:
+    """
+    Распределение методом «наиболее подходящий»: груз кладется в уже
+    задействованный транспорт с наименьшим достаточным остатком
+
+    Args:
+        weights (Sequence[int]): Веса грузов в граммах
+        vip_flags (Sequence[bool]): VIP-статусы клиентов
+        capacities (Sequence[int]): Грузоподъемности транспорта в граммах
+
+    Returns:
+        List[int]: Индекс транспорта для каждого клиента (-1 если груз не загружен)
+    """
+    assignment = [-1] * len(weights)
+    closed = _open_order(capacities)
+    closed.reverse()
+    opened = []  # отсортированный список (остаток, индекс транспорта)
+
+    for i in sort_order(weights, vip_flags):
+        weight = weights[i]
+        position = bisect.bisect_left(opened, (weight, -1))
+        if position < len(opened):
+            remaining, vehicle_index = opened.pop(position)
+        else:
+            # closed[-1] — самый вместительный из незадействованных
+            if not closed or capacities[closed[-1]] < weight:
+                continue
+            vehicle_index = closed.pop()
+            remaining = capacities[vehicle_index]
+        bisect.insort(opened, (remaining - weight, vehicle_index))
+        assignment[i] = vehicle_index
+
+    return assignment
+
+
+def worst_fit(weights: Sequence[int], vip_flags: Sequence[bool],
+              capacities: Sequence[int]) -> List[int]:
+    """
+    Распределение методом «наименее подходящий»: груз кладется в уже
+    задействованный транспорт с наибольшим остатком
+
+    Args:
+        weights (Sequence[int]): Веса грузов в граммах
+        vip_flags (Sequence[bool]): VIP-статусы клиентов
+        capacities (Sequence[int]): Грузоподъемности транспорта в граммах
+
+    Returns:
+        List[int]: Индекс транспорта для каждого клиента (-1 если груз не загружен)
+    """
+    assignment = [-1] * len(weights)
+    closed = _open_order(capacities)
+    closed.reverse()
+    opened = []  # куча (-остаток, индекс транспорта)
+
+    for i in sort_order(weights, vip_flags):
+        weight = weights[i]
+        if opened and -opened[0][0] >= weight:
+            remaining, vehicle_index = heapq.heappop(opened)
+            remaining = -remaining
+        else:
+            # closed[-1] — самый вместительный из незадействованных
+            if not closed or capacities[closed[-1]] < weight:
+                continue
+            vehicle_index = closed.pop()
+            remaining = capacities[vehicle_index]
+        heapq.heappush(opened, (weight - remaining, vehicle_index))
+        assignment[i] = vehicle_index
+
+    return assignment
+
+
+def randomized_first_fit(weights: Sequence[int], vip_flags: Sequence[bool],
+                         capacities: Sequence[int], rng: random.Random) -> List[int]:
+    """
+    Один случайный перезапуск «первого подходящего»: порядок транспорта
+    перемешивается, а грузы с близким весом меняются местами
+    (VIP по-прежнему загружаются первыми)
+
+    Args:
+        weights (Sequence[int]): Веса грузов в граммах
+        vip_flags (Sequence[bool]): VIP-статусы клиентов
+        capacities (Sequence[int]): Грузоподъемности транспорта в граммах
+        rng (random.Random): Генератор случайных чисел
+
+    Returns:
+        List[int]: Индекс транспорта для каждого клиента (-1 если груз не загружен)
+    """
+    vehicle_order = list(range(len(capacities)))
+    rng.shuffle(vehicle_order)
+    noisy_weights = [w * rng.uniform(0.9, 1.1) for w in weights]
+
+    assignment = [-1] * len(weights)
+    remaining = [capacities[j] for j in vehicle_order]
+    tree = MaxTree(remaining)
+
+    for i in sort_order(noisy_weights, vip_flags):
+        weight = weights[i]
+        position = tree.find_first(weight)
+        if position < 0:
+            continue
+        remaining[position] -= weight
+        tree.update(position, remaining[position])
+        assignment[i] = vehicle_order[position]
+
+    return assignment
+
+
+def vehicles_lower_bound(weights: Sequence[int], capacities: Sequence[int]) -> int:
+    """
+    Нижняя оценка числа транспорта: сколько самых вместительных единиц
+    нужно, чтобы хотя бы суммарно вместить весь груз
+
+    Args:
+        weights (Sequence[int]): Веса грузов в граммах
+        capacities (Sequence[int]): Грузоподъемности транспорта в граммах
+
+    Returns:
+        int: Нижняя оценка (не больше числа транспорта)
+    """
+    total = sum(weights)
+    covered = 0
+    count = 0
+    for capacity in sorted(capacities, reverse=True):
+        if covered >= total:
+            break
+        covered += capacity
+        count += 1
+    return count
+
+
+def plan_score(assignment: Sequence[int], weights: Sequence[int],
+               vip_flags: Sequence[bool], capacities: Sequence[int]) -> Tuple[int, int, int, float]:
+    """
+    Оценка плана (меньше — лучше)
+
+    Сначала сравнивается незагруженный вес VIP-клиентов и всех клиентов,
+    затем число задействованного транспорта и, наконец, разброс
+    процента загрузки задействованного транспорта.
+
+    Args:
+        assignment (Sequence[int]): Индекс транспорта для каждого клиента
+        weights (Sequence[int]): Веса грузов в граммах
+        vip_flags (Sequence[bool]): VIP-статусы клиентов
+        capacities (Sequence[int]): Грузоподъемности транспорта в граммах
+
+    Returns:
+        Tuple: (незагруженный вес VIP в граммах, незагруженный вес в граммах,
+            транспорта, разброс загрузки %)
+    """
+    unloaded_vip = 0
+    unloaded = 0
+    loads = {}
+    for i, vehicle_index in enumerate(assignment):
+        if vehicle_index < 0:
+            unloaded += weights[i]
+            if vip_flags[i]:
+                unloaded_vip += weights[i]
+        else:
+            loads[vehicle_index] = loads.get(vehicle_index, 0) + weights[i]
+
+    fills = [load / capacities[j] * 100 for j, load in loads.items()]
+    spread = max(fills) - min(fills) if fills else 0.0
+    return unloaded_vip, unloaded, len(loads), spread
@@ -0,0 +1,190 @@
+"""
+Параллельное планирование распределения грузов для нескольких компаний.
+
+Состояние каждой компании передается в процессы-исполнители в компактном
+двоичном виде (массивы весов, VIP-флагов и грузоподъемностей), а не
+сериализованным графом объектов. Двоичный вид содержит только веса, поэтому
+компании с ограничениями по объему или паллетоместам планируются векторной
+упаковкой в основном процессе.
+
+Параллельно выполняется только упаковка. Планы применяются к компаниям
+последовательно в основном процессе (загрузка транспорта и обновление
+индексов компании), и эта часть в ускорение не входит.
+"""
+
+import os
+import struct
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .client import Client
+from .transport_company import TransportCompany
+from .vector_packing import vector_first_fit
+from .vehicle import Vehicle
+from . import compatibility
+
+_HEADER = struct.Struct("<II")
+
+
+def encode_company(company: TransportCompany) -> bytes:
+    """
+    Компактная сериализация входных данных планирования компании
+
+    Args:
+        company (TransportCompany): Компания
+
+    Returns:
+        bytes: Заголовок (число клиентов и транспорта), веса грузов, VIP-флаги,
+            маски требований, грузоподъемности и маски возможностей
+            (веса — int64 в граммах, маски — по байту)
+    """
+    return encode_registries(*company.snapshot_registries())
+
+
+def encode_registries(clients: Sequence[Client], vehicles: Sequence[Vehicle]) -> bytes:
+    """
+    Компактная сериализация входных данных планирования по снимку списков
+
+    Args:
+        clients (Sequence[Client]): Клиенты (снимок списка компании)
+        vehicles (Sequence[Vehicle]): Транспорт (снимок списка компании)
+
+    Returns:
+        bytes: То же, что и encode_company
+    """
+    weights = array("q", (c.cargo_weight_g for c in clients))
+    vip_flags = bytes(c.is_vip for c in clients)
+    requirements = bytes(c.requirements() for c in clients)
+    capacities = array("q", (v.capacity_g for v in vehicles))
+    capabilities = bytes(v.capabilities() for v in vehicles)
+    return (_HEADER.pack(len(weights), len(capacities))
+            + weights.tobytes() + vip_flags + requirements
+            + capacities.tobytes() + capabilities)
+
+
+def decode_company(payload: bytes) -> Tuple[array, bytes, bytes, array, bytes]:
+    """
+    Разбор данных, полученных из encode_company
+
+    Args:
+        payload (bytes): Сериализованные данные компании
+
+    Returns:
+        Tuple: (веса грузов, VIP-флаги, маски требований, грузоподъемности,
+            маски возможностей)
+    """
+    clients_count, vehicles_count = _HEADER.unpack_from(payload)
+    offset = _HEADER.size
+
+    weights = array("q")
+    weights.frombytes(payload[offset:offset + clients_count * weights.itemsize])
+    offset += clients_count * weights.itemsize
+
+    vip_flags = payload[offset:offset + clients_count]
+    offset += clients_count
+
+    requirements = payload[offset:offset + clients_count]
+    offset += clients_count
+
+    capacities = array("q")
+    capacities.frombytes(payload[offset:offset + vehicles_count * capacities.itemsize])
+    offset += vehicles_count * capacities.itemsize
+
+    capabilities = payload[offset:offset + vehicles_count]
+    return weights, vip_flags, requirements, capacities, capabilities
+
+
+def plan_encoded(payload: bytes) -> bytes:
+    """
+    Планирование распределения по сериализованным данным (выполняется в процессе-исполнителе)
+
+    Args:
+        payload (bytes): Данные из encode_company
+
+    Returns:
+        bytes: Массив индексов транспорта для каждого клиента (-1 если груз не загружен)
+    """
+    assignment = compatibility.pack_by_class(*decode_company(payload))
+    return array("i", assignment).tobytes()
+
+
+def uses_dimensions(clients: Sequence[Client], vehicles: Sequence[Vehicle]) -> bool:
+    """
+    Нужна ли векторная упаковка: у грузов заданы объем или паллеты, а у
+    транспорта — ограничения по ним (то же условие, что в optimize_cargo_distribution)
+
+    Args:
+        clients (Sequence[Client]): Клиенты
+        vehicles (Sequence[Vehicle]): Транспорт
+
+    Returns:
+        bool: True если план по одному весу может не поместиться в транспорт
+    """
+    return (any(c.has_dimensions() for c in clients)
+            and any(v.has_dimension_limits() for v in vehicles))
+
+
+def _plan_vectors(clients: Sequence[Client], vehicles: Sequence[Vehicle]) -> List[int]:
+    """Векторная упаковка снимка компании (в основном процессе)"""
+    return compatibility.pack_by_class([c.demand_vector() for c in clients],
+                                       [c.is_vip for c in clients],
+                                       [c.requirements() for c in clients],
+                                       [v.capacity_vector() for v in vehicles],
+                                       [v.capabilities() for v in vehicles], vector_first_fit)
+
+
+def plan_companies(companies: Sequence[TransportCompany],
+                   max_workers: Optional[int] = None) -> List[Dict[str, List[Tuple[Client, float]]]]:
+    """
+    Параллельное распределение грузов во всех переданных компаниях
+
+    Планы строятся по снимкам списков компаний и применяются вместе с
+    ними (apply_plan), поэтому изменения компаний во время планирования не
+    сдвигают индексы плана. Компании с ограничениями по объему или
+    паллетоместам планируются в основном процессе (uses_dimensions).
+    Применение планов последовательное.
+
+    Args:
+        companies (Sequence[TransportCompany]): Компании для планирования
+        max_workers (int, optional): Число процессов. По умолчанию число ядер.
+
+    Returns:
+        List[Dict]: Распределение {vehicle_id: [(client, weight), ...]} для каждой
+            компании в порядке companies (пустое, если у компании нет клиентов или транспорта)
+    """
+    distributions = [{} for _ in companies]
+    pending = [i for i, c in enumerate(companies) if c.clients and c.vehicles]
+    if not pending:
+        return distributions
+
+    snapshots = [companies[i].snapshot_registries() for i in pending]
+    assignments: List[Sequence[int]] = [[] for _ in pending]
+    weighted = []   # компании, планируемые в процессах по весам
+    for k, snapshot in enumerate(snapshots):
+        if uses_dimensions(*snapshot):
+            assignments[k] = _plan_vectors(*snapshot)
+        else:
+            weighted.append(k)
+
+    payloads = [encode_registries(*snapshots[k]) for k in weighted]
+    workers = min(max_workers or os.cpu_count() or 1, len(payloads))
+    if workers <= 1:
+        results = [plan_encoded(payload) for payload in payloads]
+    else:
+        # Отправляем компании пачками, чтобы накладные расходы на передачу
+        # не съедали выигрыш от параллельности на мелких компаниях
+        chunksize = max(1, len(payloads) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(plan_encoded, payloads, chunksize=chunksize))
+
+    for k, result in zip(weighted, results):
+        assignment = array("i")
+        assignment.frombytes(result)
+        assignments[k] = assignment
+
+    for k, i in enumerate(pending):
+        clients, vehicles = snapshots[k]
+        distributions[i] = companies[i].apply_plan(assignments[k], clients, vehicles)
+
+    return distributions
@@ -0,0 +1,152 @@
+"""
+Неизменяемые (персистентные) структуры данных со структурным разделением.
+
+Каждое изменение возвращает новую версию структуры, а старая остается
+неизменной. Новая и старая версии разделяют все неизмененные узлы,
+поэтому изменение стоит O(log32 n), а хранение старой версии — O(1).
+"""
+
+from typing import Any, Iterator, Tuple
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+
+
+def _assoc(node: Tuple, shift: int, index: int, value: Any) -> Tuple:
+    """
+    Копирование пути от корня до листа с заменой одного элемента
+
+    Args:
+        node (Tuple): Узел дерева
+        shift (int): Сдвиг текущего уровня
+        index (int): Индекс элемента
+        value (Any): Новое значение
+
+    Returns:
+        Tuple: Новый узел
+    """
+    position = (index >> shift) & _MASK
+    if shift:
+        child = node[position] if position < len(node) else ()
+        value = _assoc(child, shift - _BITS, index, value)
+    return node[:position] + (value,) + node[position + 1:]
+
+
+def _iterate(node: Tuple, shift: int) -> Iterator[Any]:
+    """
+    Обход листьев дерева слева направо
+
+    Args:
+        node (Tuple): Узел дерева
+        shift (int): Сдвиг текущего уровня
+
+    Yields:
+        Any: Элементы вектора
+    """
+    if shift:
+        for child in node:
+            yield from _iterate(child, shift - _BITS)
+    else:
+        yield from node
+
+
+class PersistentVector:
+    """Персистентный вектор на основе 32-арного префиксного дерева"""
+
+    __slots__ = ("_root", "_shift", "_size")
+
+    def __init__(self, root: Tuple = (), shift: int = 0, size: int = 0):
+        """
+        Инициализация вектора (для создания пустого вектора аргументы не нужны)
+
+        Args:
+            root (Tuple, optional): Корневой узел
+            shift (int, optional): Сдвиг корневого уровня
+            size (int, optional): Число элементов
+        """
+        self._root = root
+        self._shift = shift
+        self._size = size
+
+    def __len__(self) -> int:
+        """Число элементов"""
+        return self._size
+
+    def __getitem__(self, index: int) -> Any:
+        """
+        Получение элемента по индексу
+
+        Args:
+            index (int): Индекс (допускаются отрицательные)
+
+        Returns:
+            Any: Элемент
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Индекс вне диапазона вектора")
+
+        node = self._root
+        for shift in range(self._shift, 0, -_BITS):
+            node = node[(index >> shift) & _MASK]
+        return node[index & _MASK]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Обход элементов по порядку"""
+        return _iterate(self._root, self._shift)
+
+    def append(self, value: Any) -> "PersistentVector":
+        """
+        Новая версия вектора с элементом, добавленным в конец
+
+        Args:
+            value (Any): Добавляемый элемент
+
+        Returns:
+            PersistentVector: Новый вектор
+        """
+        root, shift = self._root, self._shift
+        if self._size == 1 << (shift + _BITS):
+            # Дерево заполнено — добавляем уровень сверху
+            root, shift = (root,), shift + _BITS
+        return PersistentVector(_assoc(root, shift, self._size, value), shift, self._size + 1)
+
+    def set(self, index: int, value: Any) -> "PersistentVector":
+        """
+        Новая версия вектора с замененным элементом
+
+        Args:
+            index (int): Индекс
+            value (Any): Новое значение
+
+        Returns:
+            PersistentVector: Новый вектор
+        """
+        if not 0 <= index < self._size:
+            raise IndexError("Индекс вне диапазона вектора")
+        return PersistentVector(_assoc(self._root, self._shift, index, value), self._shift, self._size)
+
+    @classmethod
+    def from_iterable(cls, values) -> "PersistentVector":
+        """
+        Построение вектора из последовательности
+
+        Args:
+            values: Элементы
+
+        Returns:
+            PersistentVector: Новый вектор
+        """
+        items = list(values)
+        if not items:
+            return cls()
+
+        # Строим дерево снизу вверх, заполняя узлы целиком
+        nodes = [tuple(items[i:i + _WIDTH]) for i in range(0, len(items), _WIDTH)]
+        shift = 0
+        while len(nodes) > 1:
+            nodes = [tuple(nodes[i:i + _WIDTH]) for i in range(0, len(nodes), _WIDTH)]
+            shift += _BITS
+        return cls(nodes[0], shift, len(items))
@@ -0,0 +1,202 @@
+"""
+Кэш планов распределения грузов.
+
+План зависит только от мультимножества грузов (вес, объем, паллеты,
+VIP-статус, требования), состава транспорта и стратегии, но не от порядка
+клиентов и не от их имен. Поэтому ключ — стабильный хэш отсортированных
+описаний грузов и транспорта, а план хранится в каноническом виде:
+номера клиентов и транспорта — это их позиции в отсортированном порядке.
+При совпадении ключа план переводится обратно на текущие индексы.
+
+Кэш двухуровневый: в памяти с вытеснением давно не использованных
+записей (LRU) и, по желанию, на диске (по файлу на ключ), так что план
+переживает перезапуск программы. Модуль json загружается только при
+первом обращении к диску.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+Pieces = List[List[Tuple[int, int]]]
+
+
+class Fingerprint(NamedTuple):
+    """Отпечаток входных данных планирования"""
+    digest: str               # хэш мультимножеств грузов и транспорта
+    client_order: List[int]   # индексы клиентов в каноническом порядке
+    vehicle_order: List[int]  # индексы транспорта в каноническом порядке
+
+
+def fingerprint(client_keys: Sequence[tuple], vehicle_keys: Sequence[tuple]) -> Fingerprint:
+    """
+    Отпечаток данных: хэш не зависит от порядка клиентов и транспорта
+
+    Args:
+        client_keys (Sequence[tuple]): Описание груза каждого клиента
+            (целые числа и флаги, одинаковой длины)
+        vehicle_keys (Sequence[tuple]): Описание каждого транспорта
+
+    Returns:
+        Fingerprint: Хэш и канонические порядки
+    """
+    client_order = sorted(range(len(client_keys)), key=client_keys.__getitem__)
+    vehicle_order = sorted(range(len(vehicle_keys)), key=vehicle_keys.__getitem__)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr([client_keys[i] for i in client_order]).encode())
+    digest.update(b"|")
+    digest.update(repr([vehicle_keys[j] for j in vehicle_order]).encode())
+    return Fingerprint(digest.hexdigest(), client_order, vehicle_order)
+
+
+def to_canonical(pieces: Pieces, print_: Fingerprint) -> Pieces:
+    """
+    Перевод плана в канонический вид
+
+    Args:
+        pieces (Pieces): Для каждого клиента — части (индекс транспорта, вес в граммах)
+        print_ (Fingerprint): Отпечаток тех же данных
+
+    Returns:
+        Pieces: План, где клиенты и транспорт заданы каноническими позициями
+    """
+    rank = [0] * len(print_.vehicle_order)
+    for position, j in enumerate(print_.vehicle_order):
+        rank[j] = position
+    return [[(rank[j], part) for j, part in pieces[i]] for i in print_.client_order]
+
+
+def from_canonical(canonical: Pieces, print_: Fingerprint) -> Pieces:
+    """
+    Перевод канонического плана на текущие индексы клиентов и транспорта
+
+    Args:
+        canonical (Pieces): План из to_canonical
+        print_ (Fingerprint): Отпечаток текущих данных (с тем же хэшем)
+
+    Returns:
+        Pieces: План для текущего порядка клиентов и транспорта
+    """
+    pieces: Pieces = [[] for _ in print_.client_order]
+    for position, parts in zip(print_.client_order, canonical):
+        pieces[position] = [(print_.vehicle_order[rank], part) for rank, part in parts]
+    return pieces
+
+
+class PlanCache:
+    """Кэш планов с вытеснением LRU и необязательным хранением на диске"""
+
+    def __init__(self, max_entries: int = 32, directory: Optional[str] = None):
+        """
+        Инициализация кэша
+
+        Args:
+            max_entries (int, optional): Число планов в памяти. По умолчанию 32.
+            directory (str, optional): Каталог для хранения планов на диске.
+                По умолчанию планы хранятся только в памяти.
+
+        Raises:
+            ValueError: Если max_entries меньше 1
+        """
+        if max_entries < 1:
+            raise ValueError(f"Размер кэша должен быть положительным. Получено: {max_entries}")
+        self.max_entries = max_entries
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Pieces]" = OrderedDict()
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(strategy: str, digest: str) -> str:
+        """
+        Ключ плана для стратегии и отпечатка данных
+
+        Args:
+            strategy (str): Стратегия с параметрами
+            digest (str): Хэш из Fingerprint
+
+        Returns:
+            str: Ключ (шестнадцатеричная строка, пригодная для имени файла)
+        """
+        return hashlib.blake2b(f"{strategy}|{digest}".encode(), digest_size=16).hexdigest()
+
+    def _path(self, key: str) -> str:
+        """Путь к файлу плана на диске"""
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Pieces]:
+        """
+        Поиск плана: сначала в памяти, затем на диске
+
+        Args:
+            key (str): Ключ из make_key
+
+        Returns:
+            Pieces: Канонический план или None
+        """
+        with self._lock:
+            canonical = self._entries.get(key)
+            if canonical is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return canonical
+
+        if self.directory is not None:
+            import json
+            try:
+                with open(self._path(key), encoding="utf-8") as file:
+                    canonical = [[(rank, part) for rank, part in parts] for parts in json.load(file)]
+            except (OSError, ValueError, TypeError):
+                canonical = None
+            if canonical is not None:
+                with self._lock:
+                    self._remember(key, canonical)
+                    self.hits += 1
+                return canonical
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, canonical: Pieces) -> None:
+        """
+        Сохранение плана
+
+        Args:
+            key (str): Ключ из make_key
+            canonical (Pieces): План из to_canonical
+        """
+        with self._lock:
+            self._remember(key, canonical)
+
+        if self.directory is not None:
+            import json
+            # Запись через временный файл, чтобы не оставить недописанный план
+            temporary = f"{self._path(key)}.{os.getpid()}.tmp"
+            try:
+                with open(temporary, "w", encoding="utf-8") as file:
+                    json.dump(canonical, file)
+                os.replace(temporary, self._path(key))
+            except OSError:
+                pass
+
+    def _remember(self, key: str, canonical: Pieces) -> None:
+        """Запись в память с вытеснением самого давнего плана (под _lock)"""
+        self._entries[key] = canonical
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Очистка кэша в памяти (файлы на диске не удаляются)"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Число планов в памяти"""
+        return len(self._entries)
@@ -0,0 +1,273 @@
+"""
+Планирование без изменения живых объектов и сценарии «что если».
+
+FleetView — легковесное неизменяемое представление клиентов и транспорта
+(веса и грузоподъемности в граммах, маски совместимости). Функция plan
+строит по нему план распределения, не трогая объекты Vehicle/Client.
+Клиентская часть представления (классы совместимости и порядок загрузки
+внутри каждого класса) вычисляется один раз, поэтому сценарии, меняющие
+только состав транспорта («добавить 5 фургонов», «убрать судно»),
+пересчитываются без повторной сортировки клиентов.
+
+Учитываются вес и совместимость; объем и паллетоместа в представление
+не входят.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from . import compatibility, packing
+
+
+class Plan(NamedTuple):
+    """План распределения, построенный по FleetView"""
+    assignment: List[int]    # индекс транспорта для каждого клиента (-1 — не загружен)
+    loads: List[int]         # загрузка каждого транспорта в граммах
+
+    def vehicles_used(self) -> int:
+        """
+        Число задействованного транспорта
+
+        Returns:
+            int: Количество транспорта с ненулевой загрузкой
+        """
+        return sum(1 for load in self.loads if load)
+
+    def unloaded(self) -> List[int]:
+        """
+        Клиенты, чей груз не загружен
+
+        Returns:
+            List[int]: Индексы клиентов
+        """
+        return [i for i, vehicle_index in enumerate(self.assignment) if vehicle_index < 0]
+
+
+class FleetView:
+    """Неизменяемое представление клиентов и транспорта для планирования"""
+
+    __slots__ = ("weights", "vip_flags", "requirements", "client_names",
+                 "capacities", "capabilities", "vehicle_ids", "_classes")
+
+    def __init__(self, weights: Sequence[int], vip_flags: Sequence[bool], requirements: Sequence[int],
+                 capacities: Sequence[int], capabilities: Sequence[int],
+                 client_names: Optional[Sequence[str]] = None,
+                 vehicle_ids: Optional[Sequence[str]] = None,
+                 _classes: Optional[Tuple[Tuple[int, Tuple[int, ...]], ...]] = None):
+        """
+        Инициализация представления
+
+        Args:
+            weights (Sequence[int]): Веса грузов в граммах
+            vip_flags (Sequence[bool]): VIP-статусы клиентов
+            requirements (Sequence[int]): Маски требований клиентов
+            capacities (Sequence[int]): Грузоподъемности транспорта в граммах
+            capabilities (Sequence[int]): Маски возможностей транспорта
+            client_names (Sequence[str], optional): Имена клиентов (для вывода)
+            vehicle_ids (Sequence[str], optional): ID транспорта (для вывода);
+                у транспорта, добавленного сценарием, ID равен None
+        """
+        self.weights = tuple(weights)
+        self.vip_flags = tuple(vip_flags)
+        self.requirements = tuple(requirements)
+        self.client_names = tuple(client_names) if client_names is not None else None
+        self.capacities = tuple(capacities)
+        self.capabilities = tuple(capabilities)
+        self.vehicle_ids = (tuple(vehicle_ids) if vehicle_ids is not None
+                            else (None,) * len(self.capacities))
+        if _classes is None:
+            # Классы клиентов (VIP отдельно) с участниками в порядке загрузки
+            groups = compatibility.group_by_mask([(not vip) << 8 | mask for vip, mask
+                                                  in zip(self.vip_flags, self.requirements)])
+            _classes = tuple(
+                (key, tuple(members[k] for k in packing.sort_order([self.weights[i] for i in members],
+                                                                    [self.vip_flags[i] for i in members])))
+                for key, members in groups.items())
+        self._classes = _classes
+
+    @classmethod
+    def from_objects(cls, clients: Sequence, vehicles: Sequence) -> "FleetView":
+        """
+        Построение представления по объектам клиентов и транспорта
+
+        Args:
+            clients (Sequence[Client]): Клиенты
+            vehicles (Sequence[Vehicle]): Транспортные средства
+
+        Returns:
+            FleetView: Представление (объекты не изменяются и не хранятся)
+        """
+        return cls([c.cargo_weight_g for c in clients], [c.is_vip for c in clients],
+                   [c.requirements() for c in clients],
+                   [v.capacity_g for v in vehicles], [v.capabilities() for v in vehicles],
+                   [c.name for c in clients], [v.vehicle_id for v in vehicles])
+
+    @classmethod
+    def from_company(cls, company) -> "FleetView":
+        """
+        Построение представления по согласованному снимку компании
+
+        Args:
+            company (TransportCompany): Компания
+
+        Returns:
+            FleetView: Представление
+        """
+        clients, vehicles = company.snapshot_registries()
+        return cls.from_objects(clients, vehicles)
+
+    def with_vehicles(self, add: Sequence[Tuple[int, int]] = (),
+                      drop: Sequence[int] = ()) -> "FleetView":
+        """
+        Сценарий «что если» с измененным составом транспорта
+
+        Клиентская часть (включая подготовленный порядок загрузки) переиспользуется.
+
+        Args:
+            add (Sequence[Tuple[int, int]], optional): Добавляемый транспорт —
+                пары (грузоподъемность в граммах, маска возможностей)
+            drop (Sequence[int], optional): Индексы убираемого транспорта
+
+        Returns:
+            FleetView: Новое представление; добавленный транспорт идет в конце
+
+        Raises:
+            IndexError: Если индекс убираемого транспорта вне диапазона
+        """
+        dropped = set(drop)
+        for j in dropped:
+            if not 0 <= j < len(self.capacities):
+                raise IndexError(f"Нет транспорта с индексом {j}")
+        kept = [j for j in range(len(self.capacities)) if j not in dropped]
+        return FleetView(self.weights, self.vip_flags, self.requirements,
+                         [self.capacities[j] for j in kept] + [capacity for capacity, _ in add],
+                         [self.capabilities[j] for j in kept] + [capability for _, capability in add],
+                         self.client_names,
+                         [self.vehicle_ids[j] for j in kept] + [None] * len(add),
+                         _classes=self._classes)
+
+
+def _ordered_classes(view: FleetView) -> List[Tuple[Tuple[int, ...], List[int]]]:
+    """
+    Классы клиентов в порядке упаковки с совместимым транспортом (как в
+    compatibility.pack_by_class: VIP первыми, затем классы с меньшим выбором)
+
+    Args:
+        view (FleetView): Представление
+
+    Returns:
+        List[Tuple[Tuple[int, ...], List[int]]]: Пары (участники класса в порядке
+            загрузки, индексы совместимого транспорта по возрастанию)
+    """
+    vehicle_classes = compatibility.group_by_mask(view.capabilities)
+    ordered = []
+    for key, members in view._classes:
+        vehicles: List[int] = []
+        for capability, indexes in vehicle_classes.items():
+            if compatibility.is_compatible(key & 0xFF, capability):
+                vehicles.extend(indexes)
+        if vehicles:
+            ordered.append((key >> 8, len(vehicles), members, sorted(vehicles)))
+    ordered.sort(key=lambda item: item[:2])
+    return [(members, vehicles) for _, _, members, vehicles in ordered]
+
+
+def _pack_classes(view: FleetView, classes: List[Tuple[Tuple[int, ...], List[int]]],
+                  remaining: List[int], assignment: List[int]) -> None:
+    """
+    Упаковка классов «первым подходящим» с изменением remaining и assignment на месте
+
+    Args:
+        view (FleetView): Представление
+        classes (List): Классы из _ordered_classes (участники могут быть подмножеством)
+        remaining (List[int]): Остатки грузоподъемности транспорта
+        assignment (List[int]): План, дополняемый для загруженных клиентов
+    """
+    for members, vehicles in classes:
+        # Участники уже упорядочены, поэтому сортировка внутри first_fit линейна
+        class_weights = [view.weights[i] for i in members]
+        class_assignment = packing.first_fit(class_weights, [view.vip_flags[i] for i in members],
+                                             [remaining[j] for j in vehicles])
+        for i, weight, position in zip(members, class_weights, class_assignment):
+            if position >= 0:
+                vehicle_index = vehicles[position]
+                remaining[vehicle_index] -= weight
+                assignment[i] = vehicle_index
+
+
+def plan(view: FleetView) -> Plan:
+    """
+    План распределения по представлению (совпадает с compatibility.pack_by_class
+    при упаковке first_fit)
+
+    Args:
+        view (FleetView): Представление клиентов и транспорта
+
+    Returns:
+        Plan: План распределения
+    """
+    remaining = list(view.capacities)
+    assignment = [-1] * len(view.weights)
+    _pack_classes(view, _ordered_classes(view), remaining, assignment)
+    loads = [capacity - left for capacity, left in zip(view.capacities, remaining)]
+    return Plan(assignment, loads)
+
+
+def _extend_plan(base_view: FleetView, base_plan: Plan, view: FleetView) -> Optional[Plan]:
+    """
+    План для представления, в котором к базовому транспорту добавлен новый в конце
+
+    Если порядок классов не изменился, «первый подходящий» кладет каждый
+    груз в тот же базовый транспорт, что и в базовом плане (его остатки
+    меняются одинаково), а в новый транспорт попадают только грузы, не
+    загруженные базовым планом. Поэтому упаковываются только они.
+
+    Args:
+        base_view (FleetView): Базовое представление
+        base_plan (Plan): План базового представления
+        view (FleetView): Представление с добавленным транспортом
+
+    Returns:
+        Plan: План, совпадающий с plan(view), или None, если порядок классов изменился
+    """
+    base_count = len(base_view.capacities)
+    base_classes = _ordered_classes(base_view)
+    classes = _ordered_classes(view)
+    if [members for members, _ in base_classes] != [members for members, _ in classes]:
+        return None
+
+    assignment = list(base_plan.assignment)
+    remaining = list(view.capacities)
+    for j, load in enumerate(base_plan.loads):
+        remaining[j] -= load
+    unloaded = [([i for i in members if assignment[i] < 0], [j for j in vehicles if j >= base_count])
+                for members, vehicles in classes]
+    _pack_classes(view, [(members, vehicles) for members, vehicles in unloaded if members and vehicles],
+                  remaining, assignment)
+    loads = [capacity - left for capacity, left in zip(view.capacities, remaining)]
+    return Plan(assignment, loads)
+
+
+def evaluate_scenarios(view: FleetView,
+                       scenarios: Dict[str, Tuple[Sequence[Tuple[int, int]], Sequence[int]]]) -> Dict[str, Plan]:
+    """
+    Планы для нескольких сценариев изменения состава транспорта
+
+    Базовый план строится один раз. Сценарии, которые только добавляют
+    транспорт, досчитываются от него (упаковываются лишь незагруженные
+    грузы); остальные пересчитываются с уже подготовленным порядком клиентов.
+
+    Args:
+        view (FleetView): Исходное представление
+        scenarios (Dict): {название: (добавляемый транспорт, индексы убираемого)},
+            см. FleetView.with_vehicles
+
+    Returns:
+        Dict[str, Plan]: План для каждого сценария
+    """
+    base_plan = plan(view)
+    plans = {}
+    for name, (add, drop) in scenarios.items():
+        scenario = view.with_vehicles(add, drop)
+        extended = _extend_plan(view, base_plan, scenario) if not drop else None
+        plans[name] = extended if extended is not None else plan(scenario)
+    return plans
@@ -0,0 +1,184 @@
+"""
+Портфельный режим оптимизации: несколько стратегий упаковки запускаются
+одновременно в отдельных процессах на одном снимке данных компании.
+
+Выбирается лучший план (по незагруженному весу, числу транспорта и
+равномерности загрузки). Остальные стратегии останавливаются, как только
+найден план на нижних оценках (transport.bounds) или истекло отведенное
+время. Если оценки достигает уже обычный FFD, процессы не запускаются.
+"""
+
+import multiprocessing
+import os
+import random
+import time
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from .client import Client
+from .transport_company import TransportCompany
+from .parallel_planner import decode_company, encode_registries
+from .vehicle import Vehicle
+from . import bounds, compatibility, packing
+
+DETERMINISTIC_STRATEGIES = {
+    "ffd": packing.first_fit,
+    "bfd": packing.best_fit,
+    "wfd": packing.worst_fit,
+}
+
+# Событие остановки, унаследованное процессом-исполнителем при запуске
+_stop_event = None
+
+
+class PortfolioResult(NamedTuple):
+    """Результат портфельной оптимизации"""
+    strategy: str
+    assignment: List[int]
+    score: Tuple[int, int, int, float]
+    clients: List[Client]
+    vehicles: List[Vehicle]
+
+
+def _init_worker(stop_event) -> None:
+    """
+    Инициализация процесса-исполнителя
+
+    Args:
+        stop_event: Общее событие остановки
+    """
+    global _stop_event
+    _stop_event = stop_event
+
+
+def _should_stop(deadline: float) -> bool:
+    """
+    Проверка, пора ли прекратить поиск
+
+    Args:
+        deadline (float): Момент окончания (time.time())
+
+    Returns:
+        bool: True если время вышло или другой исполнитель уже нашел оптимум
+    """
+    return time.time() >= deadline or (_stop_event is not None and _stop_event.is_set())
+
+
+def run_strategy(strategy: str, payload: bytes, deadline: float,
+                 seed: int = 0) -> Tuple[str, bytes, Tuple[int, int, int, float]]:
+    """
+    Запуск одной стратегии на сериализованных данных компании
+
+    Args:
+        strategy (str): Название стратегии ('ffd', 'bfd', 'wfd' или 'random')
+        payload (bytes): Данные из encode_company
+        deadline (float): Момент окончания (time.time())
+        seed (int, optional): Зерно для случайных перезапусков
+
+    Returns:
+        Tuple: (название стратегии, план в виде массива int, оценка плана)
+    """
+    weights, vip_flags, requirements, capacities, capabilities = decode_company(payload)
+
+    if strategy in DETERMINISTIC_STRATEGIES:
+        assignment = compatibility.pack_by_class(weights, vip_flags, requirements,
+                                                 capacities, capabilities,
+                                                 DETERMINISTIC_STRATEGIES[strategy])
+        score = packing.plan_score(assignment, weights, vip_flags, capacities)
+        return strategy, array("i", assignment).tobytes(), score
+
+    if strategy != "random":
+        raise ValueError(f"Неизвестная стратегия: {strategy}")
+
+    rng = random.Random(seed)
+    report = bounds.analyze(weights, vip_flags, requirements, capacities, capabilities)
+    best_assignment = None
+    best_score = None
+
+    def randomized(class_weights, class_vip_flags, class_capacities):
+        return packing.randomized_first_fit(class_weights, class_vip_flags, class_capacities, rng)
+
+    while best_assignment is None or not _should_stop(deadline):
+        assignment = compatibility.pack_by_class(weights, vip_flags, requirements,
+                                                 capacities, capabilities, randomized)
+        score = packing.plan_score(assignment, weights, vip_flags, capacities)
+        if best_score is None or score < best_score:
+            best_assignment, best_score = assignment, score
+            if report.is_optimal(score):
+                break
+
+    return f"random#{seed}", array("i", best_assignment).tobytes(), best_score
+
+
+def solve_portfolio(company: TransportCompany, time_budget: float = 2.0,
+                    max_workers: Optional[int] = None,
+                    strategies: Sequence[str] = ("ffd", "bfd", "wfd", "random")) -> PortfolioResult:
+    """
+    Гонка стратегий упаковки на одном снимке компании
+
+    План к компании не применяется — для этого используйте
+    company.apply_plan(result.assignment, result.clients, result.vehicles):
+    индексы плана относятся к снимку списков, по которому он построен.
+
+    Args:
+        company (TransportCompany): Компания
+        time_budget (float, optional): Ограничение по времени в секундах. По умолчанию 2.0.
+        max_workers (int, optional): Число процессов. По умолчанию число ядер.
+        strategies (Sequence[str], optional): Участвующие стратегии
+
+    Returns:
+        PortfolioResult: Лучший найденный план
+    """
+    clients, vehicles = company.snapshot_registries()
+    payload = encode_registries(clients, vehicles)
+    weights, vip_flags, requirements, capacities, capabilities = decode_company(payload)
+    report = bounds.analyze(weights, vip_flags, requirements, capacities, capabilities)
+    deadline = time.time() + time_budget
+    
+    # Быстрый FFD в текущем процессе: если он уже на оценках, гонка не нужна
+    assignment = compatibility.pack_by_class(weights, vip_flags, requirements,
+                                             capacities, capabilities)
+    best = PortfolioResult("ffd", assignment,
+                           packing.plan_score(assignment, weights, vip_flags, capacities),
+                           clients, vehicles)
+    if report.is_optimal(best.score) or len(report.impossible) == len(weights):
+        return best
+
+    # Свободные ядра отдаем дополнительным случайным перезапускам
+    workers = max_workers or os.cpu_count() or 1
+    # FFD уже посчитан в текущем процессе
+    tasks = [(name, 0) for name in strategies if name not in ("random", "ffd")]
+    if "random" in strategies:
+        random_runs = max(1, workers - len(tasks))
+        tasks.extend(("random", seed) for seed in range(random_runs))
+    if not tasks:
+        return best
+
+    stop_event = multiprocessing.Event()
+    executor = ProcessPoolExecutor(max_workers=min(workers, len(tasks)),
+                                   initializer=_init_worker, initargs=(stop_event,))
+    try:
+        pending = {executor.submit(run_strategy, name, payload, deadline, seed)
+                   for name, seed in tasks}
+        while pending:
+            timeout = max(0.0, deadline - time.time())
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                break
+
+            for future in done:
+                name, result, score = future.result()
+                if score < best.score:
+                    assignment = array("i")
+                    assignment.frombytes(result)
+                    best = PortfolioResult(name, assignment.tolist(), score, clients, vehicles)
+
+            if report.is_optimal(best.score):
+                break
+    finally:
+        stop_event.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # Если ни одна стратегия не уложилась во время, остается FFD
+    return best
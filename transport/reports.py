@@ -0,0 +1,198 @@
+"""
+Построчные отчеты по снимку транспортной компании.
+
+Отчеты — генераторы строк: строки формируются по мере чтения, поэтому
+показ страницы большого списка не создает строк для всех записей и не
+склеивает их в одну большую строку. Выбор страницы (offset/limit) без
+сортировки проходит снимок потоком; сортировка держит в памяти только
+записи (не строки), а при заданном limit — лишь offset + limit лучших
+записей (heapq). Итоги берутся из сводных показателей снимка за O(1).
+"""
+
+import heapq
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .snapshot import ClientRecord, CompanySnapshot, VehicleRecord
+from .units import grams_to_kg, grams_to_tons
+
+# Ключи сортировки отчетов
+VEHICLE_SORT_KEYS: Dict[str, Callable[[VehicleRecord], object]] = {
+    "id": lambda record: record.vehicle_id,
+    "type": lambda record: record.vehicle_type,
+    "capacity": lambda record: record.capacity,
+    "load": lambda record: record.current_load,
+    "percent": lambda record: record.get_current_load_percentage(),
+}
+CLIENT_SORT_KEYS: Dict[str, Callable[[ClientRecord], object]] = {
+    "name": lambda record: record.name.lower(),
+    "weight": lambda record: record.cargo_weight,
+}
+
+
+def _select(records: Iterable, keys: Dict[str, Callable], offset: int, limit: Optional[int],
+            sort_by: Optional[str], descending: bool) -> Iterator[Tuple[int, object]]:
+    """
+    Выбор записей страницы с их номерами в полном (отсортированном) списке
+
+    Args:
+        records (Iterable): Записи в исходном порядке
+        keys (Dict[str, Callable]): Допустимые ключи сортировки
+        offset (int): Сколько записей пропустить
+        limit (int, optional): Наибольшее число записей
+        sort_by (str, optional): Ключ сортировки; None — исходный порядок
+        descending (bool): Сортировка по убыванию
+
+    Returns:
+        Iterator[Tuple[int, object]]: Пары (номер с 1, запись)
+
+    Raises:
+        ValueError: Если offset или limit отрицательные или ключ сортировки неизвестен
+    """
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError(f"offset и limit не могут быть отрицательными. Получено: {offset}, {limit}")
+    if sort_by is not None:
+        if sort_by not in keys:
+            raise ValueError(f"Неизвестный ключ сортировки: {sort_by}. "
+                             f"Допустимые: {', '.join(keys)}")
+        key = keys[sort_by]
+        if limit is None:
+            records = sorted(records, key=key, reverse=descending)
+        elif descending:
+            records = heapq.nlargest(offset + limit, records, key=key)
+        else:
+            records = heapq.nsmallest(offset + limit, records, key=key)
+    stop = None if limit is None else offset + limit
+    return islice(enumerate(records, 1), offset, stop)
+
+
+def iter_vehicle_lines(snapshot: CompanySnapshot, offset: int = 0, limit: Optional[int] = None,
+                       sort_by: Optional[str] = None, descending: bool = False) -> Iterator[str]:
+    """
+    Отчет о транспорте компании по строкам
+
+    Args:
+        snapshot (CompanySnapshot): Снимок компании
+        offset (int, optional): Сколько транспортных средств пропустить. По умолчанию 0.
+        limit (int, optional): Наибольшее число транспортных средств. По умолчанию все.
+        sort_by (str, optional): Ключ из VEHICLE_SORT_KEYS. По умолчанию порядок добавления.
+        descending (bool, optional): Сортировка по убыванию. По умолчанию False.
+
+    Yields:
+        str: Строки отчета
+
+    Raises:
+        ValueError: Если параметры страницы или ключ сортировки некорректны
+    """
+    selected = _select(snapshot.vehicles(), VEHICLE_SORT_KEYS, offset, limit, sort_by, descending)
+    totals = snapshot.totals
+    if not totals.vehicles_count:
+        yield f"В компании '{snapshot.name}' нет транспортных средств"
+        return
+
+    yield f"ТРАНСПОРТНЫЕ СРЕДСТВА КОМПАНИИ '{snapshot.name}' ({totals.vehicles_count} шт.):"
+    yield "=" * 60
+
+    shown = 0
+    for i, vehicle in selected:
+        shown += 1
+        yield f"{i}. {vehicle.vehicle_type} (ID: {vehicle.vehicle_id})"
+        yield f"   Грузоподъемность: {vehicle.capacity:.3f} тонн"
+        yield f"   Текущая загрузка: {vehicle.current_load:.3f} тонн"
+
+        # Добавляем специфическую информацию для разных типов транспорта
+        if vehicle.kind == "van":
+            yield f"   Холодильник: {'Да' if vehicle.is_refrigerated else 'Нет'}"
+        elif vehicle.kind == "ship":
+            yield f"   Название: {vehicle.name}"
+
+        yield "-" * 40
+
+    if shown < totals.vehicles_count:
+        yield f"\nПоказано: {shown} из {totals.vehicles_count} (с {offset + 1})"
+
+    total_capacity = grams_to_tons(totals.capacity_g)
+    total_load = grams_to_tons(totals.load_g)
+    yield f"\nИтого: {totals.vehicles_count} транспортных средств"
+    yield f"Общая грузоподъемность: {total_capacity:.3f} тонн"
+    yield (f"Общая загрузка: {total_load:.3f} тонн ({total_load/total_capacity*100:.1f}%)"
+           if total_capacity > 0 else "Общая загрузка: 0 тонн")
+
+
+def _vip_first(snapshot: CompanySnapshot) -> Iterator[ClientRecord]:
+    """Клиенты: сначала VIP, затем обычные (два прохода по снимку без копирования)"""
+    yield from (record for record in snapshot.clients() if record.is_vip)
+    yield from (record for record in snapshot.clients() if not record.is_vip)
+
+
+def iter_client_lines(snapshot: CompanySnapshot, offset: int = 0, limit: Optional[int] = None,
+                      sort_by: Optional[str] = None, descending: bool = False) -> Iterator[str]:
+    """
+    Отчет о клиентах компании по строкам
+
+    Без сортировки клиенты идут группами: сначала VIP, затем обычные.
+
+    Args:
+        snapshot (CompanySnapshot): Снимок компании
+        offset (int, optional): Сколько клиентов пропустить. По умолчанию 0.
+        limit (int, optional): Наибольшее число клиентов. По умолчанию все.
+        sort_by (str, optional): Ключ из CLIENT_SORT_KEYS. По умолчанию VIP первыми.
+        descending (bool, optional): Сортировка по убыванию. По умолчанию False.
+
+    Yields:
+        str: Строки отчета
+
+    Raises:
+        ValueError: Если параметры страницы или ключ сортировки некорректны
+    """
+    records = snapshot.clients() if sort_by is not None else _vip_first(snapshot)
+    selected = _select(records, CLIENT_SORT_KEYS, offset, limit, sort_by, descending)
+    totals = snapshot.totals
+    if not totals.clients_count:
+        yield f"В компании '{snapshot.name}' нет клиентов"
+        return
+
+    yield f"КЛИЕНТЫ КОМПАНИИ '{snapshot.name}' ({totals.clients_count} чел.):"
+    yield "=" * 60
+
+    shown = 0
+    section = None
+    for i, client in selected:
+        shown += 1
+        if sort_by is None and client.is_vip != section:
+            section = client.is_vip
+            yield "\nVIP КЛИЕНТЫ:" if client.is_vip else "\nОБЫЧНЫЕ КЛИЕНТЫ:"
+        yield f"{i}. {client.name}" + (" (VIP)" if sort_by is not None and client.is_vip else "")
+        yield f"   Вес груза: {client.cargo_weight:.2f} кг"
+
+    if shown < totals.clients_count:
+        yield f"\nПоказано: {shown} из {totals.clients_count} (с {offset + 1})"
+
+    total_weight = grams_to_kg(totals.clients_weight_g)
+    yield f"\nИтого: {totals.clients_count} клиентов"
+    yield f"VIP клиентов: {totals.vip_count}"
+    yield f"Общий вес грузов: {total_weight:.2f} кг ({total_weight/1000:.3f} тонн)"
+
+
+def pages(lines: Iterable[str], page_size: int) -> Iterator[List[str]]:
+    """
+    Разбиение потока строк на страницы
+
+    Args:
+        lines (Iterable[str]): Строки (например, из iter_client_lines)
+        page_size (int): Число строк на странице
+
+    Yields:
+        List[str]: Строки очередной страницы
+
+    Raises:
+        ValueError: Если page_size меньше 1
+    """
+    if page_size < 1:
+        raise ValueError(f"Размер страницы должен быть положительным. Получено: {page_size}")
+    lines = iter(lines)
+    while True:
+        page = list(islice(lines, page_size))
+        if not page:
+            return
+        yield page
@@ -0,0 +1,240 @@
+"""
+Планирование нескольких рейсов транспорта за день с окнами времени.
+
+Каждая единица транспорта может совершить несколько рейсов подряд, а
+груз клиента — иметь время готовности и срок, к которому рейс должен
+завершиться. Планирование — событийная симуляция на очередях с
+приоритетом: события — готовность грузов и возвращение транспорта из
+рейса. Свободный транспорт ждет в пуле (отдельно для каждой маски
+возможностей), пока для него не наберется достаточно груза или пока
+груз не станет срочным. Грузы для рейсов раскладываются обычной
+упаковкой (compatibility.pack_by_class) — она же проверяет
+грузоподъемность и совместимость на каждом рейсе.
+"""
+
+import heapq
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from . import compatibility, packing
+
+# Во сколько раз суммарный вес кандидатов на рейсы может превышать
+# суммарную грузоподъемность свободного транспорта (запас для упаковки)
+_CANDIDATES_FACTOR = 2
+
+
+class Trip(NamedTuple):
+    """Рейс транспорта"""
+    vehicle_index: int
+    number: int              # порядковый номер рейса этого транспорта (с 1)
+    start: float
+    end: float
+    clients: Tuple[int, ...]
+
+
+class Schedule(NamedTuple):
+    """Результат планирования рейсов"""
+    trips: List[Trip]
+    unscheduled: List[int]
+
+
+def schedule_trips(weights: Sequence[int], vip_flags: Sequence[bool], requirements: Sequence[int],
+                   capacities: Sequence[int], capabilities: Sequence[int],
+                   ready_times: Sequence[float], deadlines: Sequence[float],
+                   trip_durations: Sequence[float], horizon: Optional[float] = None,
+                   min_fill: float = 0.8, pack: Callable = packing.first_fit) -> Schedule:
+    """
+    Распределение грузов по рейсам транспорта
+
+    В каждый момент события выпускаются готовые грузы, а вернувшийся
+    транспорт попадает в пул свободного. Затем:
+
+    1. Из очереди ожидающих грузов по приоритету (VIP, ранний срок, больший
+       вес) берутся кандидаты, пока их вес не превысит емкость пула в
+       _CANDIDATES_FACTOR раз. Грузы, которые уже не успеют к сроку, снимаются.
+    2. Из пула для каждой маски требований кандидатов извлекается
+       совместимый транспорт (сначала быстрый и вместительный), пока его
+       грузоподъемность не покроет вес кандидатов.
+    3. Кандидаты упаковываются по извлеченному транспорту. Груз, который
+       этим рейсом не успевает к сроку, возвращается в очередь.
+    4. Рейс отправляется, если транспорт заполнен не меньше чем на
+       min_fill, если в нем есть груз, который не дождется следующего
+       события, или если новых грузов больше не будет. Иначе транспорт
+       возвращается в пул, а грузы — в очередь ожидания.
+
+    Стоимость момента события пропорциональна числу кандидатов и
+    извлеченного транспорта, а не всему парку. После оценки без отправок
+    выпуск новых грузов не вызывает повторной упаковки, пока их вес не
+    покроет недостачу до min_fill или ожидающий груз не станет срочным.
+
+    Args:
+        weights (Sequence[int]): Веса грузов в граммах
+        vip_flags (Sequence[bool]): VIP-статусы клиентов
+        requirements (Sequence[int]): Маски требований клиентов
+        capacities (Sequence[int]): Грузоподъемности транспорта в граммах
+        capabilities (Sequence[int]): Маски возможностей транспорта
+        ready_times (Sequence[float]): Время готовности грузов (часы)
+        deadlines (Sequence[float]): Сроки завершения рейса с грузом
+            (float('inf') — без срока)
+        trip_durations (Sequence[float]): Длительность рейса каждого транспорта (часы)
+        horizon (float, optional): Конец дня: рейс должен завершиться не
+            позже. По умолчанию не ограничен.
+        min_fill (float, optional): Доля грузоподъемности, при которой рейс
+            отправляется без ожидания. По умолчанию 0.8.
+        pack (Callable, optional): Функция упаковки из transport.packing.
+            По умолчанию packing.first_fit.
+
+    Returns:
+        Schedule: Рейсы в порядке начала и индексы незапланированных клиентов
+    """
+    clients_count = len(weights)
+    trips: List[Trip] = []
+    unscheduled: List[int] = []
+    if not capacities:
+        return Schedule(trips, list(range(clients_count)))
+
+    if horizon is not None:
+        # Конец дня — общий крайний срок для всех грузов
+        deadlines = [min(deadline, horizon) for deadline in deadlines]
+    shortest_trip = min(trip_durations)
+    longest_trip = max(trip_durations)
+    smallest_capacity = min(capacities)
+    releases = sorted(range(clients_count), key=lambda i: ready_times[i])
+    released = 0
+    pending: List[Tuple[bool, float, int, int]] = []
+
+    # Пулы свободного транспорта по маскам: (длительность, -грузоподъемность, индекс, рейсов)
+    idle: Dict[int, List[Tuple[float, int, int, int]]] = {}
+    idle_capacity = 0
+    # Возвращение из рейса: (момент, индекс транспорта, рейсов совершено)
+    returns: List[Tuple[float, int, int]] = []
+
+    def release(j: int, done: int) -> None:
+        nonlocal idle_capacity
+        heapq.heappush(idle.setdefault(capabilities[j], []),
+                       (trip_durations[j], -capacities[j], j, done))
+        idle_capacity += capacities[j]
+
+    def next_event() -> Optional[float]:
+        upcoming = []
+        if released < clients_count:
+            upcoming.append(ready_times[releases[released]])
+        if returns:
+            upcoming.append(returns[0][0])
+        return min(upcoming) if upcoming else None
+
+    for j in range(len(capacities)):
+        release(j, 0)
+
+    # Затишье после оценки без отправок: сколько груза должно добавиться,
+    # чтобы какой-то рейс мог набрать min_fill, и самый ранний момент, когда
+    # ожидающий груз станет срочным
+    quiet_slack: Optional[int] = None
+    quiet_urgent = float("inf")
+
+    now = 0.0
+    while True:
+        added = 0
+        while released < clients_count and ready_times[releases[released]] <= now:
+            i = releases[released]
+            heapq.heappush(pending, (not vip_flags[i], deadlines[i], -weights[i], i))
+            added += weights[i]
+            quiet_urgent = min(quiet_urgent, deadlines[i] - longest_trip)
+            released += 1
+        returned = bool(returns) and returns[0][0] <= now
+        while returns and returns[0][0] <= now:
+            _, j, done = heapq.heappop(returns)
+            release(j, done)
+
+        next_moment = next_event()
+
+        # В затишье выпуск грузов не меняет решения, пока их вес не покроет
+        # недостачу и ни один груз не стал срочным: упаковка пропускается
+        if quiet_slack is not None:
+            quiet_slack -= added
+            if (not returned and released < clients_count and quiet_slack > 0
+                    and quiet_urgent >= next_moment):
+                now = next_moment
+                continue
+            quiet_slack = None
+
+        # 1. Кандидаты
+        candidates: List[Tuple[bool, float, int, int]] = []
+        needed: Dict[int, int] = {}
+        taken = 0
+        while pending and taken < _CANDIDATES_FACTOR * idle_capacity:
+            entry = heapq.heappop(pending)
+            i = entry[3]
+            if deadlines[i] < now + shortest_trip:
+                unscheduled.append(i)
+                continue
+            candidates.append(entry)
+            needed[requirements[i]] = needed.get(requirements[i], 0) + weights[i]
+            taken += weights[i]
+
+        examined_all = not pending
+
+        # 2. Транспорт из пула: сначала для требований с меньшим выбором
+        vehicles: List[Tuple[int, int]] = []
+        for mask in sorted(needed, key=lambda m: sum(compatibility.is_compatible(m, c) for c in idle)):
+            for capability, pool in idle.items():
+                if not compatibility.is_compatible(mask, capability):
+                    continue
+                while pool and needed[mask] > 0:
+                    duration, _, j, done = heapq.heappop(pool)
+                    idle_capacity -= capacities[j]
+                    if horizon is not None and now + duration > horizon:
+                        continue    # рейс уже не успевает до конца дня
+                    vehicles.append((j, done))
+                    needed[mask] -= capacities[j]
+
+        # 3. Упаковка кандидатов по извлеченному транспорту
+        assignment = compatibility.pack_by_class(
+            [weights[entry[3]] for entry in candidates],
+            [vip_flags[entry[3]] for entry in candidates],
+            [requirements[entry[3]] for entry in candidates],
+            [capacities[j] for j, _ in vehicles],
+            [capabilities[j] for j, _ in vehicles],
+            pack)
+        loads: List[List[Tuple[bool, float, int, int]]] = [[] for _ in vehicles]
+        for entry, position in zip(candidates, assignment):
+            if position >= 0 and deadlines[entry[3]] >= now + trip_durations[vehicles[position][0]]:
+                loads[position].append(entry)
+            else:
+                heapq.heappush(pending, entry)
+
+        # 4. Отправка рейсов
+        dispatched = False
+        shortfall = min_fill * smallest_capacity
+        urgent = float("inf")
+        for (j, done), loaded in zip(vehicles, loads):
+            duration = trip_durations[j]
+            load = sum(weights[entry[3]] for entry in loaded)
+            dispatch = loaded and (released == clients_count
+                                   or load >= min_fill * capacities[j]
+                                   or any(deadlines[entry[3]] < next_moment + duration
+                                          for entry in loaded))
+            if dispatch:
+                trips.append(Trip(j, done + 1, now, now + duration,
+                                  tuple(entry[3] for entry in loaded)))
+                heapq.heappush(returns, (now + duration, j, done + 1))
+                dispatched = True
+            else:
+                for entry in loaded:
+                    heapq.heappush(pending, entry)
+                release(j, done)
+                shortfall = min(shortfall, min_fill * capacities[j] - load)
+                for entry in loaded:
+                    urgent = min(urgent, deadlines[entry[3]] - duration)
+
+        if not dispatched and examined_all and released < clients_count:
+            quiet_slack = shortfall
+            quiet_urgent = urgent
+
+        next_moment = next_event()
+        if next_moment is None:
+            break
+        now = next_moment
+
+    unscheduled.extend(entry[3] for entry in pending)
+    unscheduled.sort()
+    return Schedule(trips, unscheduled)
@@ -0,0 +1,298 @@
+"""
+Локальный асинхронный сервис планирования на базе asyncio.
+
+Протокол — JSON Lines поверх TCP: каждая строка запроса содержит объект
+{"id": ..., "op": ..., ...}, в ответ приходит строка {"id": ..., "ok": ...}.
+
+Поддерживаемые операции:
+    add_client     {"name", "cargo_weight", "is_vip", "needs_refrigeration", "transport_mode"}
+    remove_client  {"name"}
+    add_vehicle    {"type": "Van" | "Ship" | "Vehicle", "capacity", "is_refrigerated", "name"}
+    remove_vehicle {"vehicle_id"}
+    plan           {} — актуальный план с учетом всех принятых изменений
+    status         {} — число клиентов, транспорта и версия данных
+
+Изменения применяются к компании сразу, а перепланирование запускается
+один раз на серию изменений (с небольшой задержкой) в пуле процессов,
+чтобы цикл событий не блокировался тяжелыми вычислениями. Сбой расчета
+(в том числе аварийное завершение процесса пула) возвращается ответом
+{"ok": false}; собственный пул сервиса после такого сбоя пересоздается.
+
+Запуск: python -m transport.service --port 8765
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+from array import array
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+from .client import Client
+from .vehicle import Vehicle
+from .van import Van
+from .ship import Ship
+from .transport_company import TransportCompany
+from .parallel_planner import encode_registries, plan_encoded
+
+
+class PlanningService:
+    """Асинхронный сервис планирования вокруг TransportCompany"""
+
+    def __init__(self, company: TransportCompany, replan_delay: float = 0.05,
+                 executor: Optional[Executor] = None):
+        """
+        Инициализация сервиса
+
+        Args:
+            company (TransportCompany): Обслуживаемая компания
+            replan_delay (float, optional): Задержка перед перепланированием в секундах,
+                за которую накапливаются изменения. По умолчанию 0.05.
+            executor (Executor, optional): Исполнитель для расчета планов.
+                По умолчанию собственный пул из одного процесса (после
+                аварийного завершения процесса он пересоздается; переданный
+                исполнитель не пересоздается).
+        """
+        self.company = company
+        self.replan_delay = replan_delay
+        self._owns_executor = executor is None
+        self._executor = executor or ProcessPoolExecutor(max_workers=1)
+        self._version = 0
+        self._plan: Optional[Dict[str, Any]] = None
+        self._plan_version = -1
+        self._replan_task: Optional[asyncio.Task] = None
+        self._devnull = open(os.devnull, "w", encoding="utf-8")
+
+        self._handlers = {
+            "add_client": self._add_client,
+            "remove_client": self._remove_client,
+            "add_vehicle": self._add_vehicle,
+            "remove_vehicle": self._remove_vehicle,
+            "plan": self._get_plan,
+            "status": self._get_status,
+        }
+
+    def close(self) -> None:
+        """Освобождение ресурсов сервиса"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._devnull.close()
+
+    def _reset_executor(self) -> None:
+        """Замена неисправного собственного пула процессов новым"""
+        if not self._owns_executor:
+            return
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = ProcessPoolExecutor(max_workers=1)
+
+    async def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Обработка одного запроса
+
+        Args:
+            request (Dict): Запрос с полем "op"
+
+        Returns:
+            Dict: Ответ с полем "ok" и результатом или текстом ошибки
+        """
+        response: Dict[str, Any] = {"id": request.get("id")}
+        handler = self._handlers.get(request.get("op"))
+        if handler is None:
+            response.update(ok=False, error=f"Неизвестная операция: {request.get('op')}")
+            return response
+
+        try:
+            # Методы компании печатают сообщения — в сервисе они не нужны
+            with contextlib.redirect_stdout(self._devnull):
+                result = handler(request)
+            if asyncio.iscoroutine(result):
+                result = await result
+            response.update(ok=True, result=result)
+        except (KeyError, TypeError, ValueError) as e:
+            response.update(ok=False, error=str(e))
+        except Exception as e:
+            # Сбой расчета в исполнителе не должен обрывать подключение без ответа
+            response.update(ok=False, error=f"Ошибка расчета плана: {type(e).__name__}: {e}")
+        return response
+
+    def _mark_changed(self) -> None:
+        """Учет изменения данных и планирование пересчета"""
+        self._version += 1
+        if self._replan_task is None:
+            self._replan_task = asyncio.get_running_loop().create_task(self._replan(self.replan_delay))
+
+    def _add_client(self, request: Dict[str, Any]) -> bool:
+        """Операция add_client"""
+        client = Client(request["name"], request["cargo_weight"], request.get("is_vip", False),
+                        request.get("needs_refrigeration", False), request.get("transport_mode", "any"))
+        added = self.company.add_client(client)
+        if added:
+            self._mark_changed()
+        return added
+
+    def _remove_client(self, request: Dict[str, Any]) -> bool:
+        """Операция remove_client"""
+        removed = self.company.remove_client(request["name"])
+        if removed:
+            self._mark_changed()
+        return removed
+
+    def _add_vehicle(self, request: Dict[str, Any]) -> str:
+        """Операция add_vehicle"""
+        vehicle_type = request.get("type", "Vehicle")
+        if vehicle_type == "Van":
+            vehicle = Van(request["capacity"], request.get("is_refrigerated", False))
+        elif vehicle_type == "Ship":
+            vehicle = Ship(request["capacity"], request["name"])
+        elif vehicle_type == "Vehicle":
+            vehicle = Vehicle(request["capacity"])
+        else:
+            raise ValueError(f"Неизвестный тип транспорта: {vehicle_type}")
+
+        if not self.company.add_vehicle(vehicle):
+            raise ValueError(f"Транспортное средство {vehicle.vehicle_id} не добавлено")
+        self._mark_changed()
+        return vehicle.vehicle_id
+
+    def _remove_vehicle(self, request: Dict[str, Any]) -> bool:
+        """Операция remove_vehicle"""
+        removed = self.company.remove_vehicle(request["vehicle_id"])
+        if removed:
+            self._mark_changed()
+        return removed
+
+    def _get_status(self, request: Dict[str, Any]) -> Dict[str, int]:
+        """Операция status"""
+        return {
+            "clients": len(self.company.clients),
+            "vehicles": len(self.company.vehicles),
+            "version": self._version,
+            "plan_version": self._plan_version,
+        }
+
+    async def _get_plan(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Операция plan: ожидание плана, учитывающего все принятые изменения"""
+        while self._plan_version != self._version:
+            if self._replan_task is None:
+                self._replan_task = asyncio.get_running_loop().create_task(self._replan(0))
+            await asyncio.shield(self._replan_task)
+        return self._plan
+
+    async def _replan(self, delay: float) -> None:
+        """
+        Пересчет плана по снимку текущих данных
+
+        Args:
+            delay (float): Задержка для накопления серии изменений
+        """
+        try:
+            if delay:
+                await asyncio.sleep(delay)
+
+            version = self._version
+            clients, vehicles = self.company.snapshot_registries()
+            payload = encode_registries(clients, vehicles)
+
+            loop = asyncio.get_running_loop()
+            try:
+                result = await loop.run_in_executor(self._executor, plan_encoded, payload)
+            except BrokenExecutor:
+                # Процесс пула завершился аварийно — следующий расчет пойдет в новый пул
+                self._reset_executor()
+                raise
+            assignment = array("i")
+            assignment.frombytes(result)
+
+            distribution: Dict[str, list] = {}
+            unloaded = []
+            for client, vehicle_index in zip(clients, assignment):
+                if vehicle_index < 0:
+                    unloaded.append(client.name)
+                else:
+                    distribution.setdefault(vehicles[vehicle_index].vehicle_id, []).append(
+                        [client.name, client.cargo_weight])
+
+            self._plan = {
+                "version": version,
+                "vehicles_used": len(distribution),
+                "distribution": distribution,
+                "unloaded": unloaded,
+            }
+            self._plan_version = version
+        finally:
+            self._replan_task = None
+
+        # Изменения, пришедшие во время расчета, попадут в следующий пересчет
+        if self._plan_version != self._version:
+            self._replan_task = asyncio.get_running_loop().create_task(self._replan(self.replan_delay))
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        """
+        Обслуживание одного подключения
+
+        Args:
+            reader (asyncio.StreamReader): Поток запросов
+            writer (asyncio.StreamWriter): Поток ответов
+        """
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("Запрос должен быть JSON-объектом")
+                except ValueError as e:
+                    response = {"id": None, "ok": False, "error": f"Некорректный запрос: {e}"}
+                else:
+                    response = await self.handle_request(request)
+
+                writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                # Ждем отправки, только когда буфер заполнен — так пачка
+                # мелких запросов не упирается в сетевые задержки
+                if writer.transport.get_write_buffer_size() > 64 * 1024:
+                    await writer.drain()
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        """
+        Запуск TCP-сервера и обслуживание подключений до отмены
+
+        Args:
+            host (str, optional): Адрес. По умолчанию 127.0.0.1.
+            port (int, optional): Порт. По умолчанию 8765.
+        """
+        server = await asyncio.start_server(self._handle_connection, host, port)
+        print(f"Сервис планирования компании '{self.company.name}' запущен на {host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+
+def main() -> None:
+    """Запуск сервиса из командной строки"""
+    parser = argparse.ArgumentParser(description="Сервис планирования распределения грузов")
+    parser.add_argument("--company", default="Сервис планирования", help="Название компании")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--replan-delay", type=float, default=0.05,
+                        help="Задержка перед перепланированием, с")
+    args = parser.parse_args()
+
+    service = PlanningService(TransportCompany(args.company), replan_delay=args.replan_delay)
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\nСервис остановлен")
+    finally:
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,58 @@
+from typing import Optional
+
+from .compatibility import SEA
 from .vehicle import Vehicle
 
 
 class Ship(Vehicle):
     """Класс судна, наследующий от Vehicle"""
     
-    def __init__(self, capacity: float, name: str):
+    def __init__(self, capacity: float, name: str,
+                 volume_capacity: Optional[float] = None, pallet_slots: Optional[int] = None,
+                 dispatch_cost: Optional[float] = None):
         """
         Инициализация судна
         
         Args:
             capacity (float): Грузоподъемность в тоннах
             name (str): Название судна
+            volume_capacity (float, optional): Вместимость по объему в м³.
+                По умолчанию не ограничена.
+            pallet_slots (int, optional): Число паллетомест. По умолчанию не ограничено.
+            dispatch_cost (float, optional): Стоимость одного рейса. По умолчанию не задана.
         """
-        super().__init__(capacity)
+        super().__init__(capacity, volume_capacity, pallet_slots, dispatch_cost)
         self.name = self._validate_name(name)
         self.vehicle_type = "Судно"
     
-    def _validate_name(self, name: str) -> str:
+    @classmethod
+    def from_validated(cls, capacity: float, name: str,
+                       volume_capacity: Optional[float] = None, pallet_slots: Optional[int] = None,
+                       dispatch_cost: Optional[float] = None,
+                       vehicle_id: Optional[str] = None) -> "Ship":
+        """
+        Создание судна из заведомо корректных данных без проверок
+        (см. Vehicle.from_validated)
+        
+        Args:
+            capacity (float): Грузоподъемность в тоннах
+            name (str): Название судна (без пробелов по краям)
+            volume_capacity (float, optional): Вместимость по объему в м³. По умолчанию не ограничена.
+            pallet_slots (int, optional): Число паллетомест. По умолчанию не ограничено.
+            dispatch_cost (float, optional): Стоимость одного рейса. По умолчанию не задана.
+            vehicle_id (str, optional): Сохраненный идентификатор. По умолчанию выдается новый.
+        
+        Returns:
+            Ship: Новое транспортное средство
+        """
+        vehicle = super().from_validated(capacity, volume_capacity, pallet_slots,
+                                         dispatch_cost, vehicle_id)
+        vehicle.name = name
+        vehicle.vehicle_type = "Судно"
+        return vehicle
+    
+    @staticmethod
+    def _validate_name(name: str) -> str:
         """
         Валидация названия судна
         
@@ -41,23 +77,14 @@ class Ship(Vehicle):
         
         return cleaned_name
     
-    def can_transport(self, client) -> bool:
+    def capabilities(self) -> int:
         """
-        Проверка возможности транспортировки груза клиента
+        Маска возможностей судна: морская перевозка (без холодильника)
         
-        Args:
-            client: Объект клиента
-            
         Returns:
-            bool: True если можно транспортировать
+            int: Битовая маска возможностей
         """
-        # Базовая проверка грузоподъемности
-        if not self.can_load_cargo(client.cargo_weight):
-            return False
-        
-        # Дополнительные проверки для судна
-        # Например, можно добавить проверки на морскую транспортировку
-        return True
+        return SEA
     
     def __str__(self) -> str:
         """
@@ -0,0 +1,158 @@
+"""
+Неизменяемые снимки состояния транспортной компании для чтения.
+
+Снимок хранит персистентные векторы записей клиентов, транспорта и
+распределения грузов. Компания поддерживает эти векторы при каждом
+изменении, поэтому получение снимка стоит O(1), а сам снимок остается
+согласованным, даже если компания продолжает меняться (например, во
+время оптимизации).
+"""
+
+from typing import Iterator, NamedTuple, Optional, Tuple
+
+from .persistent import PersistentVector
+from .units import kg_to_grams, tons_to_grams
+
+
+class ClientRecord(NamedTuple):
+    """Неизменяемая запись о клиенте"""
+    name: str
+    cargo_weight: float
+    is_vip: bool
+
+
+class VehicleRecord(NamedTuple):
+    """Неизменяемая запись о транспортном средстве"""
+    vehicle_id: str
+    kind: str                         # 'van', 'ship' или 'other'
+    vehicle_type: str
+    capacity: float
+    current_load: float
+    clients_count: int
+    is_refrigerated: Optional[bool]   # только для фургонов
+    name: Optional[str]               # только для судов
+
+    def get_current_load_percentage(self) -> float:
+        """
+        Процент загрузки на момент снимка
+
+        Returns:
+            float: Процент загрузки (0-100)
+        """
+        if self.capacity == 0:
+            return 0.0
+        return (self.current_load / self.capacity) * 100
+
+
+class CompanyTotals(NamedTuple):
+    """Сводные показатели компании (поддерживаются при каждом изменении)"""
+    clients_count: int = 0
+    vip_count: int = 0
+    clients_weight_g: int = 0     # общий вес грузов клиентов в граммах
+    vip_weight_g: int = 0         # вес грузов VIP-клиентов в граммах
+    vehicles_count: int = 0
+    capacity_g: int = 0           # общая грузоподъемность в граммах
+    load_g: int = 0               # общая текущая загрузка в граммах
+    vans_count: int = 0
+    ships_count: int = 0
+    others_count: int = 0
+
+    def with_client(self, record: ClientRecord, sign: int = 1) -> "CompanyTotals":
+        """
+        Показатели после добавления (sign=1) или удаления (sign=-1) записи клиента
+
+        Args:
+            record (ClientRecord): Запись клиента
+            sign (int, optional): 1 или -1. По умолчанию 1.
+
+        Returns:
+            CompanyTotals: Новые показатели
+        """
+        weight_g = kg_to_grams(record.cargo_weight)
+        return self._replace(
+            clients_count=self.clients_count + sign,
+            vip_count=self.vip_count + sign * record.is_vip,
+            clients_weight_g=self.clients_weight_g + sign * weight_g,
+            vip_weight_g=self.vip_weight_g + sign * weight_g * record.is_vip,
+        )
+
+    def with_vehicle(self, record: VehicleRecord, sign: int = 1) -> "CompanyTotals":
+        """
+        Показатели после добавления (sign=1) или удаления (sign=-1) записи транспорта
+
+        Args:
+            record (VehicleRecord): Запись транспорта
+            sign (int, optional): 1 или -1. По умолчанию 1.
+
+        Returns:
+            CompanyTotals: Новые показатели
+        """
+        return self._replace(
+            vehicles_count=self.vehicles_count + sign,
+            capacity_g=self.capacity_g + sign * tons_to_grams(record.capacity),
+            load_g=self.load_g + sign * tons_to_grams(record.current_load),
+            vans_count=self.vans_count + sign * (record.kind == "van"),
+            ships_count=self.ships_count + sign * (record.kind == "ship"),
+            others_count=self.others_count + sign * (record.kind == "other"),
+        )
+
+
+class CompanySnapshot:
+    """Согласованный неизменяемый снимок транспортной компании"""
+
+    __slots__ = ("name", "_clients", "_vehicles", "_assignment", "clients_count", "vehicles_count",
+                 "totals")
+
+    def __init__(self, name: str, clients: PersistentVector, vehicles: PersistentVector,
+                 assignment: PersistentVector, clients_count: int, vehicles_count: int,
+                 totals: CompanyTotals = CompanyTotals()):
+        """
+        Инициализация снимка (создается методом TransportCompany.snapshot)
+
+        Args:
+            name (str): Название компании
+            clients (PersistentVector): Записи клиентов (None на месте удаленных)
+            vehicles (PersistentVector): Записи транспорта (None на месте удаленных)
+            assignment (PersistentVector): Для каждой записи клиента — кортеж пар
+                (vehicle_id, вес в кг), в которые загружен его груз
+            clients_count (int): Число клиентов
+            vehicles_count (int): Число транспортных средств
+            totals (CompanyTotals, optional): Сводные показатели на момент снимка
+        """
+        self.name = name
+        self._clients = clients
+        self._vehicles = vehicles
+        self._assignment = assignment
+        self.clients_count = clients_count
+        self.vehicles_count = vehicles_count
+        self.totals = totals
+
+    def clients(self) -> Iterator[ClientRecord]:
+        """Записи клиентов в порядке добавления"""
+        return (record for record in self._clients if record is not None)
+
+    def vehicles(self) -> Iterator[VehicleRecord]:
+        """Записи транспорта в порядке добавления"""
+        return (record for record in self._vehicles if record is not None)
+
+    def assignments(self) -> Iterator[Tuple[ClientRecord, Tuple[Tuple[str, float], ...]]]:
+        """
+        Распределение грузов на момент снимка
+
+        Yields:
+            Tuple: (клиент, ((vehicle_id, вес в кг), ...)) для каждого загруженного клиента
+        """
+        for record, placements in zip(self._clients, self._assignment):
+            if record is not None and placements:
+                yield record, placements
+
+    def __str__(self) -> str:
+        """
+        Строковое представление снимка
+
+        Returns:
+            str: Краткая информация о снимке
+        """
+        return (f"Снимок компании: {self.name}\n"
+                f"Клиентов: {self.clients_count}\n"
+                f"Транспортных средств: {self.vehicles_count}")
@@ -1,23 +1,98 @@
-from typing import List, Dict, Tuple
+import threading
+import time
+from typing import TYPE_CHECKING, Iterator, List, Dict, Optional, Tuple, Sequence
 from .client import Client
+from .client_index import ClientIndex
+from .events import (CargoLoaded, CargoUnloaded, ClientAdded, ClientChanged, ClientRemoved,
+                     CompanyCleared, EventBus, PlanCompleted, VehicleAdded, VehicleChanged,
+                     VehicleRemoved)
 from .vehicle import Vehicle
 from .van import Van
 from .ship import Ship
+from .locks import NullReadWriteLock, ReadWriteLock
+from .persistent import PersistentVector
+from .snapshot import ClientRecord, CompanySnapshot, CompanyTotals, VehicleRecord
+from . import bounds, compatibility, packing, reports
+from .units import grams_to_kg, grams_to_tons
+
+if TYPE_CHECKING:
+    from .plan_cache import PlanCache
 
 
 class TransportCompany:
     """Класс транспортной компании"""
     
-    def __init__(self, name: str):
+    def __init__(self, name: str, thread_safe: bool = False,
+                 plan_cache: Optional["PlanCache"] = None):
         """
         Инициализация транспортной компании
         
         Args:
             name (str): Название компании
+            thread_safe (bool, optional): Потокобезопасный режим: списки клиентов и
+                транспорта защищены блокировкой чтения/записи, а каждое транспортное
+                средство — собственной блокировкой. По умолчанию False.
+                События шины events доставляются после снятия блокировки списков;
+                подписчики транспорта (add_observer, vehicle.events) вызываются
+                под ней, но могут читать компанию (locks.ReadWriteLock). Изменять
+                компанию из таких подписчиков нельзя.
+            plan_cache (PlanCache, optional): Кэш планов распределения (например,
+                общий для нескольких компаний или с хранением на диске).
+                По умолчанию у компании собственный кэш в памяти, создаваемый
+                при первом планировании.
         """
         self.name = self._validate_name(name)
         self.vehicles: List[Vehicle] = []
         self.clients: List[Client] = []
+        self.thread_safe = thread_safe
+        self._registry_lock = ReadWriteLock() if thread_safe else NullReadWriteLock()
+        
+        # Персистентные векторы для снимков: слот записи клиента/транспорта
+        # не меняется до удаления, удаленные записи заменяются на None
+        self._snapshot_lock = threading.Lock()
+        self._client_slots: Dict[int, int] = {}
+        self._vehicle_slots: Dict[int, int] = {}
+        self._client_records = PersistentVector()
+        self._vehicle_records = PersistentVector()
+        self._assignment = PersistentVector()
+        # Сводные показатели (суммы и счетчики по записям) — обновляются вместе с записями
+        self._totals = CompanyTotals()
+        
+        # Кэш планов распределения (см. свойство plan_cache)
+        self._plan_cache = plan_cache
+        
+        # Индекс имен клиентов и словарь транспорта по ID (под блокировкой
+        # записи вместе со списками)
+        self._client_index = ClientIndex()
+        self._vehicles_by_id: Dict[str, Vehicle] = {}
+        
+        # Обратный индекс распределения: id клиента -> [(транспорт, вес в кг)].
+        # Поддерживается подписками на загрузку и выгрузку (под _snapshot_lock)
+        self._placements: Dict[int, List[Tuple[Vehicle, float]]] = {}
+        
+        # Версия данных для планирования: растет при добавлении и удалении
+        # клиентов и транспорта и при изменении их полей (свойства клиентов и
+        # транспорта оповещают подписчиков). Загрузка и выгрузка версию не
+        # меняют. Пока версия та же, отпечаток данных и анализ не пересчитываются.
+        self._version = 0
+        self._plan_memo: Optional[tuple] = None
+        
+        # Шина событий об изменениях компании (events.py). Каждый изменяющий
+        # метод — один пакет: события доставляются подписчикам одним списком
+        # после снятия блокировки списков, поэтому подписчики могут читать компанию
+        self.events = EventBus()
+    
+    @property
+    def plan_cache(self) -> "PlanCache":
+        """Кэш планов распределения (собственный создается при первом обращении)"""
+        if self._plan_cache is None:
+            from .plan_cache import PlanCache
+            self._plan_cache = PlanCache()
+        return self._plan_cache
+    
+    @plan_cache.setter
+    def plan_cache(self, cache: "PlanCache") -> None:
+        self._plan_cache = cache
     
     def _validate_name(self, name: str) -> str:
         """
@@ -68,6 +143,171 @@ class TransportCompany:
         if not isinstance(client, Client):
             raise TypeError(f"Ожидается объект класса Client, получен тип: {type(client)}")
     
+    @staticmethod
+    def _make_client_record(client: Client) -> ClientRecord:
+        """Неизменяемая запись о клиенте"""
+        return ClientRecord(client.name, client.cargo_weight, client.is_vip)
+    
+    @staticmethod
+    def _make_vehicle_record(vehicle: Vehicle) -> VehicleRecord:
+        """Неизменяемая запись о транспортном средстве"""
+        is_van = isinstance(vehicle, Van)
+        is_ship = isinstance(vehicle, Ship)
+        return VehicleRecord(
+            vehicle.vehicle_id,
+            "van" if is_van else "ship" if is_ship else "other",
+            getattr(vehicle, 'vehicle_type', 'Транспорт'),
+            vehicle.capacity,
+            vehicle.current_load,
+            len(vehicle.clients_list),
+            vehicle.is_refrigerated if is_van else None,
+            vehicle.name if is_ship else None,
+        )
+    
+    def _place(self, client: Client, vehicle_id: str, weight: float) -> None:
+        """Добавление груза клиента в вектор распределения (под _snapshot_lock)"""
+        slot = self._client_slots.get(id(client))
+        if slot is not None:
+            self._assignment = self._assignment.set(slot, self._assignment[slot] + ((vehicle_id, weight),))
+    
+    def _unplace(self, client: Client, vehicle_id: str) -> None:
+        """Удаление груза клиента из вектора распределения (под _snapshot_lock)"""
+        slot = self._client_slots.get(id(client))
+        if slot is None:
+            return
+        placements = self._assignment[slot]
+        for i, (placed_vehicle_id, _) in enumerate(placements):
+            if placed_vehicle_id == vehicle_id:
+                self._assignment = self._assignment.set(slot, placements[:i] + placements[i + 1:])
+                return
+    
+    def _locate_add(self, client: Client, vehicle: Vehicle, weight: float) -> None:
+        """Добавление груза клиента в обратный индекс (под _snapshot_lock)"""
+        if id(client) in self._client_slots:
+            self._placements.setdefault(id(client), []).append((vehicle, weight))
+    
+    def _locate_remove(self, client: Client, vehicle: Vehicle) -> None:
+        """Удаление груза клиента из обратного индекса (под _snapshot_lock)"""
+        placements = self._placements.get(id(client))
+        if placements is None:
+            return
+        for i, (placed_vehicle, _) in enumerate(placements):
+            if placed_vehicle is vehicle:
+                del placements[i]
+                break
+        if not placements:
+            del self._placements[id(client)]
+    
+    def _on_client_changed(self, client: Client) -> None:
+        """Обновление записи и индекса клиента после его изменения"""
+        self._client_index.update(client)
+        with self._snapshot_lock:
+            slot = self._client_slots.get(id(client))
+            if slot is not None:
+                record = self._make_client_record(client)
+                self._totals = self._totals.with_client(self._client_records[slot], -1).with_client(record)
+                self._client_records = self._client_records.set(slot, record)
+                self._version += 1
+        if slot is not None:
+            self.events.publish(ClientChanged(client))
+    
+    def _on_vehicle_changed(self, vehicle: Vehicle, event: str,
+                            cargo: List[Tuple[Client, float]]) -> None:
+        """Обновление записи транспорта и распределения после загрузки, выгрузки
+        или изменения параметров транспорта"""
+        with self._snapshot_lock:
+            slot = self._vehicle_slots.get(id(vehicle))
+            if slot is None:
+                return
+            record = self._make_vehicle_record(vehicle)
+            self._totals = self._totals.with_vehicle(self._vehicle_records[slot], -1).with_vehicle(record)
+            self._vehicle_records = self._vehicle_records.set(slot, record)
+            if event == "change":
+                self._version += 1
+            for client, weight in cargo:
+                if event == "load":
+                    self._place(client, vehicle.vehicle_id, weight)
+                    self._locate_add(client, vehicle, weight)
+                else:
+                    self._unplace(client, vehicle.vehicle_id)
+                    self._locate_remove(client, vehicle)
+        if event == "change":
+            self.events.publish(VehicleChanged(vehicle))
+            return
+        event_type = CargoLoaded if event == "load" else CargoUnloaded
+        for client, weight in cargo:
+            self.events.publish(event_type(vehicle, client, weight))
+    
+    def _track_client(self, client: Client) -> None:
+        """Заведение записи о добавленном клиенте (под блокировкой записи)"""
+        with self._snapshot_lock:
+            self._version += 1
+            self._client_slots[id(client)] = len(self._client_records)
+            record = self._make_client_record(client)
+            self._totals = self._totals.with_client(record)
+            self._client_records = self._client_records.append(record)
+            self._assignment = self._assignment.append(())
+        self._client_index.add(client)
+        client.add_observer(self._on_client_changed)
+        self.events.publish(ClientAdded(client))
+    
+    def _untrack_client(self, client: Client) -> None:
+        """Удаление записи о клиенте (под блокировкой записи)"""
+        client.remove_observer(self._on_client_changed)
+        self._client_index.remove(client)
+        with self._snapshot_lock:
+            self._version += 1
+            slot = self._client_slots.pop(id(client))
+            self._placements.pop(id(client), None)
+            self._totals = self._totals.with_client(self._client_records[slot], -1)
+            self._client_records = self._client_records.set(slot, None)
+            self._assignment = self._assignment.set(slot, ())
+            
+            # Когда удаленных записей становится больше живых, пересобираем векторы
+            if len(self._client_records) > 2 * len(self._client_slots) + 32:
+                positions = sorted(self._client_slots.items(), key=lambda item: item[1])
+                self._client_records = PersistentVector.from_iterable(
+                    self._client_records[old_slot] for _, old_slot in positions)
+                self._assignment = PersistentVector.from_iterable(
+                    self._assignment[old_slot] for _, old_slot in positions)
+                self._client_slots = {key: slot for slot, (key, _) in enumerate(positions)}
+        self.events.publish(ClientRemoved(client))
+    
+    def _track_vehicle(self, vehicle: Vehicle) -> None:
+        """Заведение записи о добавленном транспорте (под блокировкой записи)"""
+        with self._snapshot_lock:
+            self._version += 1
+            self._vehicle_slots[id(vehicle)] = len(self._vehicle_records)
+            record = self._make_vehicle_record(vehicle)
+            self._totals = self._totals.with_vehicle(record)
+            self._vehicle_records = self._vehicle_records.append(record)
+            for client, weight in vehicle.get_loaded_cargo():
+                self._place(client, vehicle.vehicle_id, weight)
+                self._locate_add(client, vehicle, weight)
+        self._vehicles_by_id[vehicle.vehicle_id] = vehicle
+        vehicle.add_observer(self._on_vehicle_changed)
+        self.events.publish(VehicleAdded(vehicle))
+    
+    def _untrack_vehicle(self, vehicle: Vehicle) -> None:
+        """Удаление записи о транспорте (под блокировкой записи)"""
+        vehicle.remove_observer(self._on_vehicle_changed)
+        del self._vehicles_by_id[vehicle.vehicle_id]
+        with self._snapshot_lock:
+            self._version += 1
+            slot = self._vehicle_slots.pop(id(vehicle))
+            self._totals = self._totals.with_vehicle(self._vehicle_records[slot], -1)
+            self._vehicle_records = self._vehicle_records.set(slot, None)
+            for client in vehicle.clients_list:
+                self._unplace(client, vehicle.vehicle_id)
+                self._locate_remove(client, vehicle)
+            
+            if len(self._vehicle_records) > 2 * len(self._vehicle_slots) + 32:
+                positions = sorted(self._vehicle_slots.items(), key=lambda item: item[1])
+                self._vehicle_records = PersistentVector.from_iterable(
+                    self._vehicle_records[old_slot] for _, old_slot in positions)
+                self._vehicle_slots = {key: slot for slot, (key, _) in enumerate(positions)}
+        self.events.publish(VehicleRemoved(vehicle))
+    
     def add_vehicle(self, vehicle: Vehicle) -> bool:
         """
         Добавление транспортного средства в компанию
@@ -81,13 +321,23 @@ class TransportCompany:
         try:
             self._validate_vehicle(vehicle)
             
-            # Проверка на дубликат (по ID)
-            for existing_vehicle in self.vehicles:
-                if existing_vehicle.vehicle_id == vehicle.vehicle_id:
-                    print(f"Транспортное средство с ID {vehicle.vehicle_id} уже существует в компании")
-                    return False
+            if self.thread_safe:
+                vehicle.enable_thread_safety()
+            
+            with self.events.batch(), self._registry_lock.write_locked():
+                # Проверка на дубликат (по ID)
+                duplicate = vehicle.vehicle_id in self._vehicles_by_id
+                if not duplicate:
+                    self.vehicles.append(vehicle)
+                    self._track_vehicle(vehicle)
+                    # ID мог быть задан извне (например, загружен из файла) —
+                    # новые ID счетчика не должны с ним совпасть
+                    vehicle.id_allocator.reserve(vehicle.vehicle_id)
+            
+            if duplicate:
+                print(f"Транспортное средство с ID {vehicle.vehicle_id} уже существует в компании")
+                return False
             
-            self.vehicles.append(vehicle)
             print(f"Транспортное средство {vehicle.vehicle_id} успешно добавлено в компанию '{self.name}'")
             return True
             
@@ -108,13 +358,17 @@ class TransportCompany:
         try:
             self._validate_client(client)
             
-            # Проверка на дубликат (по имени)
-            for existing_client in self.clients:
-                if existing_client.name.lower() == client.name.lower():
-                    print(f"Клиент с именем '{client.name}' уже существует в компании")
-                    return False
+            with self.events.batch(), self._registry_lock.write_locked():
+                # Проверка на дубликат (по имени)
+                duplicate = bool(self._client_index.get(client.name))
+                if not duplicate:
+                    self.clients.append(client)
+                    self._track_client(client)
+            
+            if duplicate:
+                print(f"Клиент с именем '{client.name}' уже существует в компании")
+                return False
             
-            self.clients.append(client)
             print(f"Клиент '{client.name}' успешно добавлен в компанию '{self.name}'")
             return True
             
@@ -132,11 +386,15 @@ class TransportCompany:
         Returns:
             bool: True если успешно удалено, False если не найдено
         """
-        for i, vehicle in enumerate(self.vehicles):
-            if vehicle.vehicle_id == vehicle_id:
-                removed_vehicle = self.vehicles.pop(i)
-                print(f"Транспортное средство {removed_vehicle.vehicle_id} удалено из компании")
-                return True
+        with self.events.batch(), self._registry_lock.write_locked():
+            removed_vehicle = self._vehicles_by_id.get(vehicle_id)
+            if removed_vehicle is not None:
+                self.vehicles.remove(removed_vehicle)
+                self._untrack_vehicle(removed_vehicle)
+        
+        if removed_vehicle is not None:
+            print(f"Транспортное средство {removed_vehicle.vehicle_id} удалено из компании")
+            return True
         
         print(f"Транспортное средство с ID {vehicle_id} не найдено")
         return False
@@ -151,85 +409,242 @@ class TransportCompany:
         Returns:
             bool: True если успешно удален, False если не найден
         """
-        for i, client in enumerate(self.clients):
-            if client.name.lower() == client_name.lower():
-                removed_client = self.clients.pop(i)
-                print(f"Клиент '{removed_client.name}' удален из компании")
-                return True
+        removed_client = None
+        with self.events.batch(), self._registry_lock.write_locked():
+            found = self._client_index.get(client_name)
+            if found:
+                removed_client = found[0]
+                self.clients.remove(removed_client)
+                self._untrack_client(removed_client)
+        
+        if removed_client is not None:
+            print(f"Клиент '{removed_client.name}' удален из компании")
+            return True
         
         print(f"Клиент с именем '{client_name}' не найден")
         return False
     
-    def list_vehicles(self) -> str:
+    def rename_client(self, client_name: str, new_name: str) -> bool:
         """
-        Получение списка всех транспортных средств
+        Переименование клиента компании
         
+        Args:
+            client_name (str): Текущее имя клиента
+            new_name (str): Новое имя клиента
+            
         Returns:
-            str: Строка с информацией о транспортных средствах
+            bool: True если клиент переименован, False если он не найден,
+                имя занято другим клиентом или не прошло валидацию
+        """
+        try:
+            with self.events.batch(), self._registry_lock.write_locked():
+                found = self._client_index.get(client_name)
+                if not found:
+                    print(f"Клиент с именем '{client_name}' не найден")
+                    return False
+                client = found[0]
+                if any(other is not client for other in self._client_index.get(new_name)):
+                    print(f"Клиент с именем '{new_name.strip()}' уже существует в компании")
+                    return False
+                old_name = client.name
+                client.rename(new_name)
+            
+            print(f"Клиент '{old_name}' переименован в '{client.name}'")
+            return True
+            
+        except (TypeError, ValueError) as e:
+            print(f"Ошибка при переименовании клиента: {e}")
+            return False
+    
+    def find_client(self, client_name: str) -> Optional[Client]:
         """
-        if not self.vehicles:
-            return f"В компании '{self.name}' нет транспортных средств"
+        Поиск клиента по точному имени (без учета регистра)
         
-        result = [f"ТРАНСПОРТНЫЕ СРЕДСТВА КОМПАНИИ '{self.name}' ({len(self.vehicles)} шт.):"]
-        result.append("=" * 60)
+        Args:
+            client_name (str): Имя клиента
+            
+        Returns:
+            Client: Клиент или None, если не найден
+        """
+        with self._registry_lock.read_locked():
+            found = self._client_index.get(client_name)
+        return found[0] if found else None
+    
+    def search_clients(self, query: str, limit: int = 50) -> List[Client]:
+        """
+        Поиск клиентов по имени через индекс: сначала имена, начинающиеся с
+        запроса, затем содержащие его, а если таких нет — похожие (с опечатками)
         
-        for i, vehicle in enumerate(self.vehicles, 1):
-            vehicle_type = getattr(vehicle, 'vehicle_type', 'Транспорт')
-            result.append(f"{i}. {vehicle_type} (ID: {vehicle.vehicle_id})")
-            result.append(f"   Грузоподъемность: {vehicle.capacity:.3f} тонн")
-            result.append(f"   Текущая загрузка: {vehicle.current_load:.3f} тонн")
+        Args:
+            query (str): Запрос
+            limit (int, optional): Наибольшее число результатов. По умолчанию 50.
             
-            # Добавляем специфическую информацию для разных типов транспорта
-            if isinstance(vehicle, Van):
-                result.append(f"   Холодильник: {'Да' if vehicle.is_refrigerated else 'Нет'}")
-            elif isinstance(vehicle, Ship):
-                result.append(f"   Название: {vehicle.name}")
+        Returns:
+            List[Client]: Найденные клиенты
+        """
+        with self._registry_lock.read_locked():
+            return self._client_index.search(query, limit)
+    
+    def locate(self, client_name: str) -> List[Tuple[Vehicle, float]]:
+        """
+        Где находится груз клиента (без просмотра всего транспорта)
+        
+        Args:
+            client_name (str): Имя клиента
             
-            result.append("-" * 40)
+        Returns:
+            List[Tuple[Vehicle, float]]: Пары (транспорт, загруженный вес в кг);
+                при разделении груза — по одной на каждую часть. Пустой список,
+                если клиент не найден или его груз не загружен.
+        """
+        client = self.find_client(client_name)
+        if client is None:
+            return []
+        with self._snapshot_lock:
+            return list(self._placements.get(id(client), ()))
+    
+    def unload(self, client_name: str) -> bool:
+        """
+        Выгрузка груза клиента из всего транспорта, где он находится
         
-        total_capacity = sum(v.capacity for v in self.vehicles)
-        total_load = sum(v.current_load for v in self.vehicles)
-        result.append(f"\nИтого: {len(self.vehicles)} транспортных средств")
-        result.append(f"Общая грузоподъемность: {total_capacity:.3f} тонн")
-        result.append(f"Общая загрузка: {total_load:.3f} тонн ({total_load/total_capacity*100:.1f}%)" if total_capacity > 0 else "Общая загрузка: 0 тонн")
+        Args:
+            client_name (str): Имя клиента
+            
+        Returns:
+            bool: True если груз выгружен, False если клиент не найден
+                или его груз не загружен
+        """
+        client = self.find_client(client_name)
+        if client is None:
+            print(f"Клиент с именем '{client_name}' не найден")
+            return False
+        
+        placements = self.locate(client.name)
+        if not placements:
+            print(f"Груз клиента '{client.name}' не загружен")
+            return False
         
-        return "\n".join(result)
+        with self.events.batch():
+            for vehicle, _ in placements:
+                vehicle.unload_cargo(client.name)
+        return True
     
-    def list_clients(self) -> str:
+    def snapshot_registries(self) -> Tuple[List[Client], List[Vehicle]]:
         """
-        Получение списка всех клиентов
+        Согласованные копии списков клиентов и транспорта
+        
+        Блокировка на чтение удерживается только на время копирования списков,
+        форматирование и расчеты выполняются уже без нее.
         
         Returns:
-            str: Строка с информацией о клиентах
+            Tuple: (клиенты, транспортные средства)
         """
-        if not self.clients:
-            return f"В компании '{self.name}' нет клиентов"
+        with self._registry_lock.read_locked():
+            return list(self.clients), list(self.vehicles)
+    
+    def snapshot(self) -> CompanySnapshot:
+        """
+        Неизменяемый снимок компании за O(1)
+        
+        Снимок отражает клиентов, транспорт и распределение грузов на момент
+        вызова и не меняется при последующих изменениях компании.
         
-        result = [f"КЛИЕНТЫ КОМПАНИИ '{self.name}' ({len(self.clients)} чел.):"]
-        result.append("=" * 60)
+        Returns:
+            CompanySnapshot: Снимок компании
+        """
+        with self._snapshot_lock:
+            return CompanySnapshot(self.name, self._client_records, self._vehicle_records,
+                                   self._assignment, len(self._client_slots), len(self._vehicle_slots),
+                                   self._totals)
+    
+    def totals(self) -> CompanyTotals:
+        """
+        Сводные показатели компании за O(1)
         
-        vip_clients = [c for c in self.clients if c.is_vip]
-        regular_clients = [c for c in self.clients if not c.is_vip]
+        Returns:
+            CompanyTotals: Число клиентов и транспорта, суммарные веса,
+                грузоподъемность, загрузка и число транспорта по типам
+        """
+        with self._snapshot_lock:
+            return self._totals
+    
+    def clear(self) -> None:
+        """Удаление всех клиентов и транспортных средств компании"""
+        with self.events.batch(), self._registry_lock.write_locked():
+            if self.clients or self.vehicles:
+                self.events.publish(CompanyCleared(tuple(self.clients), tuple(self.vehicles)))
+            for vehicle in self.vehicles:
+                vehicle.remove_observer(self._on_vehicle_changed)
+            for client in self.clients:
+                client.remove_observer(self._on_client_changed)
+            self.vehicles.clear()
+            self.clients.clear()
+            self._client_index.clear()
+            self._vehicles_by_id.clear()
+            
+            with self._snapshot_lock:
+                self._version += 1
+                self._placements.clear()
+                self._client_slots.clear()
+                self._vehicle_slots.clear()
+                self._client_records = PersistentVector()
+                self._vehicle_records = PersistentVector()
+                self._assignment = PersistentVector()
+                self._totals = CompanyTotals()
+    
+    def iter_vehicles_report(self, offset: int = 0, limit: Optional[int] = None,
+                             sort_by: Optional[str] = None,
+                             descending: bool = False) -> Iterator[str]:
+        """
+        Отчет о транспорте по строкам (формируется лениво, по снимку компании)
         
-        if vip_clients:
-            result.append("\nVIP КЛИЕНТЫ:")
-            for i, client in enumerate(vip_clients, 1):
-                result.append(f"{i}. {client.name}")
-                result.append(f"   Вес груза: {client.cargo_weight:.2f} кг")
+        Args:
+            offset (int, optional): Сколько транспортных средств пропустить. По умолчанию 0.
+            limit (int, optional): Наибольшее число транспортных средств. По умолчанию все.
+            sort_by (str, optional): Ключ сортировки из reports.VEHICLE_SORT_KEYS
+                ('id', 'type', 'capacity', 'load', 'percent'). По умолчанию порядок добавления.
+            descending (bool, optional): Сортировка по убыванию. По умолчанию False.
+            
+        Returns:
+            Iterator[str]: Строки отчета
+        """
+        return reports.iter_vehicle_lines(self.snapshot(), offset, limit, sort_by, descending)
+    
+    def iter_clients_report(self, offset: int = 0, limit: Optional[int] = None,
+                            sort_by: Optional[str] = None,
+                            descending: bool = False) -> Iterator[str]:
+        """
+        Отчет о клиентах по строкам (формируется лениво, по снимку компании)
         
-        if regular_clients:
-            result.append("\nОБЫЧНЫЕ КЛИЕНТЫ:")
-            start_num = len(vip_clients) + 1 if vip_clients else 1
-            for i, client in enumerate(regular_clients, start_num):
-                result.append(f"{i}. {client.name}")
-                result.append(f"   Вес груза: {client.cargo_weight:.2f} кг")
+        Args:
+            offset (int, optional): Сколько клиентов пропустить. По умолчанию 0.
+            limit (int, optional): Наибольшее число клиентов. По умолчанию все.
+            sort_by (str, optional): Ключ сортировки из reports.CLIENT_SORT_KEYS
+                ('name', 'weight'). По умолчанию сначала VIP, затем обычные.
+            descending (bool, optional): Сортировка по убыванию. По умолчанию False.
+            
+        Returns:
+            Iterator[str]: Строки отчета
+        """
+        return reports.iter_client_lines(self.snapshot(), offset, limit, sort_by, descending)
+    
+    def list_vehicles(self) -> str:
+        """
+        Получение списка всех транспортных средств
         
-        total_weight = sum(c.cargo_weight for c in self.clients)
-        result.append(f"\nИтого: {len(self.clients)} клиентов")
-        result.append(f"VIP клиентов: {len(vip_clients)}")
-        result.append(f"Общий вес грузов: {total_weight:.2f} кг ({total_weight/1000:.3f} тонн)")
+        Returns:
+            str: Строка с информацией о транспортных средствах
+        """
+        return "\n".join(self.iter_vehicles_report())
+    
+    def list_clients(self) -> str:
+        """
+        Получение списка всех клиентов
         
-        return "\n".join(result)
+        Returns:
+            str: Строка с информацией о клиентах
+        """
+        return "\n".join(self.iter_clients_report())
     
     def get_available_vehicles(self) -> List[Vehicle]:
         """
@@ -238,57 +653,230 @@ class TransportCompany:
         Returns:
             List[Vehicle]: Список транспортных средств с доступной грузоподъемностью
         """
+        _, vehicles = self.snapshot_registries()
         available_vehicles = []
-        for vehicle in self.vehicles:
+        for vehicle in vehicles:
             if vehicle.get_available_capacity() > 0:
                 available_vehicles.append(vehicle)
         return available_vehicles
     
-    def optimize_cargo_distribution(self) -> Dict[str, List[Tuple[Client, float]]]:
+    def apply_plan(self, assignment: Sequence[int], clients: Optional[Sequence[Client]] = None,
+                   vehicles: Optional[Sequence[Vehicle]] = None) -> Dict[str, List[Tuple[Client, float]]]:
         """
-        Оптимальное распределение грузов клиентов по транспортным средствам
+        Применение готового плана распределения к транспортным средствам компании
         
+        План, построенный по снимку списков (snapshot_registries), применяется
+        вместе с этим снимком: индексы плана относятся к нему, а не к текущим
+        спискам, которые могли измениться за время планирования. Клиенты и
+        транспорт, удаленные после снимка, пропускаются; клиенты, добавленные
+        после снимка, остаются незагруженными.
+        
+        Args:
+            assignment (Sequence[int]): Индекс транспорта для каждого клиента
+                (в порядке clients, -1 если груз не загружен)
+            clients (Sequence[Client], optional): Клиенты, по которым построен
+                план. По умолчанию текущий self.clients.
+            vehicles (Sequence[Vehicle], optional): Транспорт, по которому
+                построен план. По умолчанию текущий self.vehicles.
+            
         Returns:
             Dict: Словарь с распределением {vehicle_id: [(client, weight), ...]}
         """
-        print("\n" + "="*60)
-        print(f"НАЧАЛО ОПТИМИЗАЦИИ РАСПРЕДЕЛЕНИЯ ГРУЗОВ")
-        print("="*60)
+        distribution = {}
+        unloaded = []
+        
+        # Списки не должны меняться, пока план раскладывается по транспорту
+        with self.events.batch(), self._registry_lock.write_locked():
+            if clients is None:
+                clients = self.clients
+            if vehicles is None:
+                vehicles = self.vehicles
+            
+            for vehicle in self.vehicles:
+                vehicle.reset_load()
+            
+            order = packing.sort_order([c.cargo_weight_g for c in clients],
+                                       [c.is_vip for c in clients])
+            
+            for client_index in order:
+                client = clients[client_index]
+                if id(client) not in self._client_slots:
+                    # Клиент удален после снимка
+                    continue
+                vehicle_index = assignment[client_index]
+                if vehicle_index < 0:
+                    unloaded.append(client)
+                    continue
+                
+                vehicle = vehicles[vehicle_index]
+                if self._vehicles_by_id.get(vehicle.vehicle_id) is not vehicle:
+                    # Транспорт удален после снимка
+                    unloaded.append(client)
+                elif vehicle.load_validated(client):
+                    distribution.setdefault(vehicle.vehicle_id, []).append((client, client.cargo_weight))
+                else:
+                    unloaded.append(client)
+            
+            self.events.publish(PlanCompleted("apply", distribution, tuple(unloaded), False))
         
-        # Сбрасываем текущую загрузку всех транспортных средств
-        for vehicle in self.vehicles:
-            vehicle.current_load = 0.0
-            vehicle.clients_list.clear()
+        return distribution
+    
+    def optimize_cargo_distribution(self, split: bool = False, balanced: bool = False,
+                                    minimize_cost: bool = False,
+                                    time_limit: float = 1.0) -> Dict[str, List[Tuple[Client, float]]]:
+        """
+        Оптимальное распределение грузов клиентов по транспортным средствам
         
-        # Сортируем клиентов: VIP в первую очередь, затем по убыванию веса
-        sorted_clients = sorted(self.clients, 
-                              key=lambda c: (not c.is_vip, -c.cargo_weight))
+        Планы хранятся в plan_cache: если те же грузы (с точностью до порядка
+        и имен клиентов) и тот же транспорт уже распределялись этой стратегией,
+        план берется из кэша без упаковки.
         
-        distribution = {}
-        unloaded_clients = []
-        total_cargo_weight = sum(c.cargo_weight for c in self.clients)
+        Args:
+            split (bool, optional): Разрешить делить груз, не помещающийся целиком
+                ни в один транспорт, на несколько частей. По умолчанию False.
+            balanced (bool, optional): Сбалансированная загрузка — минимизировать
+                наибольший процент загрузки транспорта (packing.balanced_fit).
+                Не сочетается с split. По умолчанию False.
+            minimize_cost (bool, optional): Минимизировать суммарную стоимость рейсов
+                (cost_packing.cost_fit); транспорт без заданной стоимости считается
+                по DEFAULT_DISPATCH_COST. Не сочетается с split. По умолчанию False.
+            time_limit (float, optional): Время на улучшение плана при minimize_cost
+                в секундах. По умолчанию 1.0.
         
-        print(f"Всего груза для распределения: {total_cargo_weight:.2f} кг")
-        print(f"Клиентов для распределения: {len(self.clients)}")
+        Returns:
+            Dict: Словарь с распределением {vehicle_id: [(client, weight), ...]},
+                где weight — загруженный вес (при разделении — вес части)
+        """
+        # Алгоритмы упаковки и кэш планов загружаются при первом планировании
+        from .cost_packing import DEFAULT_DISPATCH_COST, cost_fit
+        from .plan_cache import PlanCache, fingerprint, from_canonical, to_canonical
+        from .vector_packing import vector_first_fit
+        
+        print("\n" + "="*60)
+        print(f"НАЧАЛО ОПТИМИЗАЦИИ РАСПРЕДЕЛЕНИЯ ГРУЗОВ")
+        print("="*60)
         
-        for client in sorted_clients:
-            loaded = False
+        # Списки не должны меняться, пока идет сброс и загрузка транспорта
+        with self.events.batch(), self._registry_lock.write_locked():
+            clients = list(self.clients)
+            vehicles = list(self.vehicles)
             
-            # Пробуем загрузить в уже частично заполненный транспорт
-            for vehicle in self.vehicles:
-                if vehicle.can_load_cargo(client.cargo_weight):
-                    vehicle.load_cargo(client)
+            # Сбрасываем текущую загрузку всех транспортных средств
+            for vehicle in vehicles:
+                vehicle.reset_load()
+            
+            # Сортируем клиентов: VIP в первую очередь, затем по убыванию веса
+            weights = [c.cargo_weight_g for c in clients]
+            vip_flags = [c.is_vip for c in clients]
+            order = packing.sort_order(weights, vip_flags)
+            
+            distribution = {}
+            unloaded_clients = []
+            total_cargo_weight = grams_to_kg(sum(weights))
+            
+            print(f"Всего груза для распределения: {total_cargo_weight:.2f} кг")
+            print(f"Клиентов для распределения: {len(clients)}")
+            
+            # Грузы упаковываются по классам совместимости (холодильник, вид перевозки)
+            requirements = [c.requirements() for c in clients]
+            capacities = [v.capacity_g for v in vehicles]
+            capabilities = [v.capabilities() for v in vehicles]
+            costs = [DEFAULT_DISPATCH_COST if v.dispatch_cost is None else v.dispatch_cost
+                     for v in vehicles]
+            
+            use_vectors = (any(c.has_dimensions() for c in clients)
+                           and any(v.has_dimension_limits() for v in vehicles))
+            if split:
+                strategy = "split"
+            elif minimize_cost:
+                strategy = f"cost:{time_limit}"
+            elif balanced:
+                strategy = "balanced"
+            else:
+                strategy = "vector" if use_vectors else "first_fit"
+            
+            # Отпечаток данных и предварительный анализ (заведомо не помещающиеся
+            # грузы, нижние оценки) переиспользуются, пока версия данных та же
+            version = self._version
+            if self._plan_memo is not None and self._plan_memo[0] == version:
+                _, data_print, report = self._plan_memo
+            else:
+                data_print = fingerprint(
+                    [(*c.demand_vector(), c.is_vip, c.requirements()) for c in clients],
+                    [(*v.capacity_vector(), v.capabilities(), cost) for v, cost in zip(vehicles, costs)])
+                report = bounds.analyze(weights, vip_flags, requirements, capacities, capabilities)
+                self._plan_memo = (version, data_print, report)
+            if report.impossible and not split:
+                print(f"Не поместятся ни в один подходящий транспорт: {len(report.impossible)} клиент(ов)")
+            if report.shortfall:
+                print(f"Нехватка грузоподъемности: не менее {grams_to_kg(report.shortfall):.2f} кг")
+            
+            cache_key = PlanCache.make_key(strategy, data_print.digest)
+            cached = self.plan_cache.get(cache_key)
+            if cached is not None:
+                # Те же грузы и транспорт уже планировались — упаковка не запускается
+                print("План найден в кэше")
+                pieces = from_canonical(cached, data_print)
+            elif split:
+                # Разделение планируется по весу; части, не поместившиеся по объему
+                # или паллетоместам, не загружаются
+                pieces = compatibility.split_by_class(weights, vip_flags, requirements,
+                                                      capacities, capabilities)
+            elif len(report.impossible) == len(clients):
+                # Ни один груз не помещается целиком — упаковка не запускается
+                pieces = [[] for _ in clients]
+            else:
+                if minimize_cost:
+                    deadline = time.time() + time_limit
+                    assignment = compatibility.pack_by_class(
+                        weights, vip_flags, requirements, capacities, capabilities,
+                        lambda *arguments: cost_fit(*arguments, deadline=deadline),
+                        costs=costs)
+                elif balanced:
+                    assignment = compatibility.pack_by_class(weights, vip_flags, requirements,
+                                                             capacities, capabilities,
+                                                             packing.balanced_fit, vip_first=False,
+                                                             pass_loads=True)
+                elif use_vectors:
+                    # Учитываются объем и паллетоместа — векторная упаковка
+                    assignment = compatibility.pack_by_class([c.demand_vector() for c in clients],
+                                                             vip_flags, requirements,
+                                                             [v.capacity_vector() for v in vehicles],
+                                                             capabilities, vector_first_fit)
+                else:
+                    assignment = compatibility.pack_by_class(weights, vip_flags, requirements,
+                                                             capacities, capabilities)
+                pieces = [[(vehicle_index, weight)] if vehicle_index >= 0 else []
+                          for vehicle_index, weight in zip(assignment, weights)]
+            if cached is None:
+                self.plan_cache.put(cache_key, to_canonical(pieces, data_print))
+            
+            for client_index in order:
+                client = clients[client_index]
+                
+                loaded_any = False
+                for vehicle_index, part_g in pieces[client_index]:
+                    vehicle = vehicles[vehicle_index]
+                    if part_g == client.cargo_weight_g:
+                        if not vehicle.load_validated(client):
+                            continue
+                        print(f"✓ Груз клиента '{client.name}' ({client.cargo_weight} кг) "
+                              f"загружен в транспорт {vehicle.vehicle_id}")
+                    else:
+                        if not vehicle.load_validated(client, part_g):
+                            continue
+                        print(f"✓ Часть груза клиента '{client.name}' ({grams_to_kg(part_g)} "
+                              f"из {client.cargo_weight} кг) загружена в транспорт {vehicle.vehicle_id}")
+                    loaded_any = True
                     if vehicle.vehicle_id not in distribution:
                         distribution[vehicle.vehicle_id] = []
-                    distribution[vehicle.vehicle_id].append((client, client.cargo_weight))
-                    loaded = True
-                    print(f"✓ Груз клиента '{client.name}' ({client.cargo_weight} кг) "
-                          f"загружен в транспорт {vehicle.vehicle_id}")
-                    break
+                    distribution[vehicle.vehicle_id].append((client, grams_to_kg(part_g)))
+                
+                if not loaded_any:
+                    unloaded_clients.append(client)
             
-            # Если не удалось загрузить, оставляем для следующей итерации
-            if not loaded:
-                unloaded_clients.append(client)
+            self.events.publish(PlanCompleted(strategy, distribution, tuple(unloaded_clients),
+                                              cached is not None))
         
         # Вывод результатов распределения
         print("\n" + "="*60)
@@ -299,7 +887,7 @@ class TransportCompany:
         used_vehicles = 0
         
         for vehicle_id, clients_list in distribution.items():
-            vehicle = next(v for v in self.vehicles if v.vehicle_id == vehicle_id)
+            vehicle = next(v for v in vehicles if v.vehicle_id == vehicle_id)
             vehicle_weight = sum(weight for _, weight in clients_list)
             total_loaded_weight += vehicle_weight
             
@@ -325,15 +913,89 @@ class TransportCompany:
         print("="*60)
         print(f"Всего груза: {total_cargo_weight:.2f} кг")
         print(f"Распределено груза: {total_loaded_weight:.2f} кг ({total_loaded_weight/total_cargo_weight*100:.1f}%)")
-        print(f"Использовано транспорта: {used_vehicles} из {len(self.vehicles)}")
+        print(f"Использовано транспорта: {used_vehicles} из {len(vehicles)}")
+        if not split:
+            print(f"Нижняя оценка числа транспорта: {report.min_vehicles}")
         
         if unloaded_clients:
             unloaded_weight = sum(c.cargo_weight for c in unloaded_clients)
             print(f"Не распределено груза: {unloaded_weight:.2f} кг")
-            print("Причина: недостаточная грузоподъемность доступного транспорта")
+            if report.impossible and not split:
+                print("Причина: часть грузов не помещается ни в один подходящий транспорт")
+            else:
+                print("Причина: недостаточная грузоподъемность доступного транспорта")
+        
+        if minimize_cost:
+            total_cost = sum(cost for vehicle, cost in zip(vehicles, costs)
+                             if vehicle.vehicle_id in distribution)
+            print(f"Стоимость рейсов: {total_cost:.2f}")
+        
+        if balanced and distribution:
+            fills = [v.get_current_load_percentage() for v in vehicles if v.vehicle_id in distribution]
+            print(f"Наибольшая загрузка транспорта: {max(fills):.1f}%")
+            print(f"Разброс загрузки: {max(fills) - min(fills):.1f}%")
         
         return distribution
     
+    def schedule_day(self, trip_duration: float = 2.0,
+                     horizon: Optional[float] = 24.0) -> Dict[str, List[Tuple[int, float, float, List[Client]]]]:
+        """
+        Планирование нескольких рейсов транспорта за день (см. transport.scheduler)
+        
+        Учитывает время готовности и сроки доставки клиентов. Текущая
+        загрузка транспорта не меняется: результат — план рейсов.
+        
+        Args:
+            trip_duration (float, optional): Длительность рейса в часах. По умолчанию 2.0.
+            horizon (float, optional): Конец дня в часах; None — без ограничения.
+                По умолчанию 24.0.
+        
+        Returns:
+            Dict: Рейсы по транспорту {vehicle_id: [(номер рейса, начало, конец, клиенты), ...]}
+        
+        Raises:
+            ValueError: Если длительность рейса не положительная
+        """
+        if trip_duration <= 0:
+            raise ValueError(f"Длительность рейса должна быть положительной. Получено: {trip_duration}")
+        
+        from .scheduler import schedule_trips
+        
+        clients, vehicles = self.snapshot_registries()
+        schedule = schedule_trips(
+            [c.cargo_weight_g for c in clients],
+            [c.is_vip for c in clients],
+            [c.requirements() for c in clients],
+            [v.capacity_g for v in vehicles],
+            [v.capabilities() for v in vehicles],
+            [c.ready_time or 0.0 for c in clients],
+            [float("inf") if c.deadline is None else c.deadline for c in clients],
+            [trip_duration] * len(vehicles),
+            horizon)
+        
+        print("\n" + "="*60)
+        print("РАСПИСАНИЕ РЕЙСОВ")
+        print("="*60)
+        
+        trips_by_vehicle: Dict[str, List[Tuple[int, float, float, List[Client]]]] = {}
+        for trip in schedule.trips:
+            vehicle = vehicles[trip.vehicle_index]
+            trip_clients = [clients[i] for i in trip.clients]
+            trips_by_vehicle.setdefault(vehicle.vehicle_id, []).append(
+                (trip.number, trip.start, trip.end, trip_clients))
+            trip_weight = grams_to_kg(sum(c.cargo_weight_g for c in trip_clients))
+            print(f"Транспорт {vehicle.vehicle_id}, рейс {trip.number}: "
+                  f"{trip.start:g}-{trip.end:g} ч, клиентов {len(trip_clients)}, груз {trip_weight:.2f} кг")
+        
+        if schedule.unscheduled:
+            print(f"\nНЕ ЗАПЛАНИРОВАННЫЕ КЛИЕНТЫ ({len(schedule.unscheduled)}):")
+            for i in schedule.unscheduled:
+                print(f"  - {clients[i].name}: {clients[i].cargo_weight:.2f} кг")
+        
+        print(f"\nРейсов: {len(schedule.trips)}, задействовано транспорта: "
+              f"{len(trips_by_vehicle)} из {len(vehicles)}")
+        return trips_by_vehicle
+    
     def get_statistics(self) -> str:
         """
         Получение статистики компании
@@ -341,20 +1003,21 @@ class TransportCompany:
         Returns:
             str: Статистика в виде строки
         """
-        total_capacity = sum(v.capacity for v in self.vehicles) * 1000  # в кг
-        total_load = sum(v.current_load for v in self.vehicles) * 1000  # в кг
-        total_clients_weight = sum(c.cargo_weight for c in self.clients)
-        vip_clients_count = sum(1 for c in self.clients if c.is_vip)
+        # Сводные показатели поддерживаются при каждом изменении — без обхода списков
+        totals = self.totals()
+        total_capacity = grams_to_kg(totals.capacity_g)
+        total_load = grams_to_kg(totals.load_g)
         
         stats = [
             f"СТАТИСТИКА КОМПАНИИ '{self.name}'",
             "=" * 50,
-            f"Клиентов: {len(self.clients)}",
-            f"  - VIP: {vip_clients_count}",
-            f"  - Обычные: {len(self.clients) - vip_clients_count}",
-            f"Общий вес грузов клиентов: {total_clients_weight:.2f} кг",
+            f"Клиентов: {totals.clients_count}",
+            f"  - VIP: {totals.vip_count}",
+            f"  - Обычные: {totals.clients_count - totals.vip_count}",
+            f"Общий вес грузов клиентов: {grams_to_kg(totals.clients_weight_g):.2f} кг",
+            f"  - VIP: {grams_to_kg(totals.vip_weight_g):.2f} кг",
             "",
-            f"Транспортных средств: {len(self.vehicles)}",
+            f"Транспортных средств: {totals.vehicles_count}",
             f"Общая грузоподъемность: {total_capacity:.2f} кг",
             f"Текущая загрузка: {total_load:.2f} кг",
         ]
@@ -364,16 +1027,12 @@ class TransportCompany:
             stats.append(f"Использование грузоподъемности: {utilization:.1f}%")
         
         # Распределение по типам транспорта
-        van_count = sum(1 for v in self.vehicles if isinstance(v, Van))
-        ship_count = sum(1 for v in self.vehicles if isinstance(v, Ship))
-        other_count = len(self.vehicles) - van_count - ship_count
-        
         stats.extend([
             "",
             "РАСПРЕДЕЛЕНИЕ ТРАНСПОРТА:",
-            f"  Фургоны: {van_count}",
-            f"  Судна: {ship_count}",
-            f"  Другие: {other_count}"
+            f"  Фургоны: {totals.vans_count}",
+            f"  Судна: {totals.ships_count}",
+            f"  Другие: {totals.others_count}"
         ])
         
         return "\n".join(stats)
@@ -0,0 +1,91 @@
+"""
+Единицы измерения массы и объема.
+
+Внутренний учет грузов и грузоподъемности ведется в целых граммах:
+сравнения становятся точными (без накопления ошибок округления float),
+а данные можно хранить в компактных целочисленных массивах (int64).
+Публичные атрибуты по-прежнему возвращают килограммы и тонны в float.
+Объем аналогично хранится в целых кубических сантиметрах.
+"""
+
+GRAMS_PER_KG = 1000
+GRAMS_PER_TON = 1000 * GRAMS_PER_KG
+CM3_PER_M3 = 1000000
+
+
+def kg_to_grams(kilograms: float) -> int:
+    """
+    Перевод килограммов в целые граммы
+
+    Args:
+        kilograms (float): Масса в кг
+
+    Returns:
+        int: Масса в граммах (с округлением до грамма)
+    """
+    return round(kilograms * GRAMS_PER_KG)
+
+
+def tons_to_grams(tons: float) -> int:
+    """
+    Перевод тонн в целые граммы
+
+    Args:
+        tons (float): Масса в тоннах
+
+    Returns:
+        int: Масса в граммах (с округлением до грамма)
+    """
+    return round(tons * GRAMS_PER_TON)
+
+
+def grams_to_kg(grams: int) -> float:
+    """
+    Перевод граммов в килограммы
+
+    Args:
+        grams (int): Масса в граммах
+
+    Returns:
+        float: Масса в кг
+    """
+    return grams / GRAMS_PER_KG
+
+
+def grams_to_tons(grams: int) -> float:
+    """
+    Перевод граммов в тонны
+
+    Args:
+        grams (int): Масса в граммах
+
+    Returns:
+        float: Масса в тоннах
+    """
+    return grams / GRAMS_PER_TON
+
+
+def m3_to_cm3(cubic_meters: float) -> int:
+    """
+    Перевод кубических метров в целые кубические сантиметры
+
+    Args:
+        cubic_meters (float): Объем в м³
+
+    Returns:
+        int: Объем в см³ (с округлением)
+    """
+    return round(cubic_meters * CM3_PER_M3)
+
+
+def cm3_to_m3(cubic_cm: int) -> float:
+    """
+    Перевод кубических сантиметров в кубические метры
+
+    Args:
+        cubic_cm (int): Объем в см³
+
+    Returns:
+        float: Объем в м³
+    """
+    return cubic_cm / CM3_PER_M3
@@ -0,0 +1,295 @@
+"""
+Пакетная проверка данных клиентов и транспорта.
+
+Конструкторы Client и Vehicle проверяют каждое поле отдельным методом.
+Для наборов записей (загрузка файла, импорт) проверка идет по столбцам:
+правила полей составлены один раз при импорте модуля, каждое правило
+проходит по всем записям, а типичные корректные значения проверяются на
+месте без вызова методов. Значение, не прошедшее быструю проверку,
+передается методу _validate_* класса: он либо принимает его, либо
+формирует то же сообщение об ошибке, что и конструктор. Поэтому пакетная
+проверка принимает ровно те же данные, что и конструкторы.
+
+Все ошибки набора собираются за один проход, а объекты для корректных
+записей создаются через from_validated без повторной проверки.
+"""
+
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Sequence, Set, Tuple
+
+from .client import MAX_CARGO_WEIGHT_KG, Client
+from .compatibility import TRANSPORT_MODES
+from .ship import Ship
+from .units import GRAMS_PER_KG
+from .van import Van
+from .vehicle import MAX_CAPACITY_TONS, Vehicle
+
+_MISSING = object()   # поле отсутствует в записи
+_SLOW = object()      # быстрая проверка не пройдена — нужен метод класса
+_NUMBERS = (int, float)
+
+
+class Issue(NamedTuple):
+    """Ошибка в записи набора данных"""
+    row: int        # номер записи (с 0)
+    field: str      # поле записи
+    message: str    # сообщение (как у конструктора)
+
+
+class _Rule(NamedTuple):
+    """Правило поля: быстрая проверка столбца и метод класса для остальных значений"""
+    field: str
+    default: Any                                 # _MISSING — поле обязательное
+    fast: Callable[[List[Any]], List[Any]]       # столбец проверенных значений (или _SLOW)
+    validate: Callable[[Any], Any]               # метод _validate_* (исключение при ошибке)
+
+
+# Быстрые проверки получают весь столбец и проходят его одним списковым
+# включением; значения, требующие метода класса, заменяются на _SLOW.
+
+def _fast_names(column: List[Any]) -> List[Any]:
+    """Имена без пробелов по краям (не короче 2 символов)"""
+    return [stripped if type(value) is str and len(stripped := value.strip()) >= 2 else _SLOW
+            for value in column]
+
+
+def _fast_flags(column: List[Any]) -> List[Any]:
+    """Булевы значения"""
+    return [value if value is True or value is False else _SLOW for value in column]
+
+
+def _fast_positive(limit: float, smallest: float = 0.0) -> Callable[[List[Any]], List[Any]]:
+    """
+    Проверка положительных чисел не меньше smallest и не больше limit (с
+    приведением к float); меньшие положительные числа проверяет метод класса
+    """
+    def fast(column: List[Any]) -> List[Any]:
+        return [float(value)
+                if type(value) in _NUMBERS and 0 < value <= limit and value >= smallest else _SLOW
+                for value in column]
+    return fast
+
+
+def _fast_optional_positive(column: List[Any]) -> List[Any]:
+    """None или положительные числа (с приведением к float)"""
+    return [value if value is None
+            else float(value) if type(value) in _NUMBERS and value > 0 else _SLOW
+            for value in column]
+
+
+def _fast_optional_counts(column: List[Any]) -> List[Any]:
+    """None или положительные целые"""
+    return [value if value is None or (type(value) is int and value > 0) else _SLOW
+            for value in column]
+
+
+def _fast_optional_non_negative(column: List[Any]) -> List[Any]:
+    """None или неотрицательные числа (с приведением к float)"""
+    return [value if value is None
+            else float(value) if type(value) in _NUMBERS and value >= 0 else _SLOW
+            for value in column]
+
+
+def _fast_transport_modes(column: List[Any]) -> List[Any]:
+    """Известные виды перевозки"""
+    return [value if type(value) is str and value in TRANSPORT_MODES else _SLOW
+            for value in column]
+
+
+# Правила полей клиента в порядке аргументов Client.from_validated
+_CLIENT_RULES = (
+    _Rule("name", _MISSING, _fast_names, Client._validate_name),
+    _Rule("cargo_weight", _MISSING, _fast_positive(MAX_CARGO_WEIGHT_KG, 1 / GRAMS_PER_KG),
+          Client._validate_cargo_weight),
+    _Rule("is_vip", False, _fast_flags, Client._validate_is_vip),
+    _Rule("needs_refrigeration", False, _fast_flags, Client._validate_needs_refrigeration),
+    _Rule("transport_mode", "any", _fast_transport_modes, Client._validate_transport_mode),
+    _Rule("volume", None, _fast_optional_positive, Client._validate_volume),
+    _Rule("pallets", None, _fast_optional_counts, Client._validate_pallets),
+    _Rule("ready_time", None, _fast_optional_non_negative,
+          lambda value: Client._validate_time(value, "Время готовности")),
+    _Rule("deadline", None, _fast_optional_non_negative,
+          lambda value: Client._validate_time(value, "Срок доставки")),
+)
+
+# Общие правила транспорта в порядке аргументов Vehicle.from_validated
+_VEHICLE_RULES = (
+    _Rule("capacity", _MISSING, _fast_positive(MAX_CAPACITY_TONS), Vehicle._validate_capacity),
+    _Rule("volume_capacity", None, _fast_optional_positive, Vehicle._validate_volume_capacity),
+    _Rule("pallet_slots", None, _fast_optional_counts, Vehicle._validate_pallet_slots),
+    _Rule("dispatch_cost", None, _fast_optional_non_negative, Vehicle._validate_dispatch_cost),
+)
+
+# Тип транспорта (имя класса) -> класс и правила дополнительных полей
+_VEHICLE_TYPES: Dict[str, Tuple[type, Tuple[_Rule, ...]]] = {
+    "Vehicle": (Vehicle, ()),
+    "Van": (Van, (_Rule("is_refrigerated", False, _fast_flags, Van._validate_is_refrigerated),)),
+    "Ship": (Ship, (_Rule("name", _MISSING, _fast_names, Ship._validate_name),)),
+}
+
+
+def _check_column(rows: List[Mapping[str, Any]], indices: List[int], rule: _Rule,
+                  issues: List[Issue], present: Set[str]) -> List[Any]:
+    """
+    Проверка одного поля во всех записях
+
+    Args:
+        rows (List[Mapping[str, Any]]): Проверяемые записи
+        indices (List[int]): Номера этих записей в наборе
+        rule (_Rule): Правило поля
+        issues (List[Issue]): Найденные ошибки (дополняются)
+        present (Set[str]): Поля, встречающиеся хотя бы в одной записи
+
+    Returns:
+        List[Any]: Проверенные значения в порядке записей (для записей с
+            ошибкой — _SLOW)
+    """
+    field, default = rule.field, rule.default
+    if field not in present and default is not _MISSING:
+        # Поля нет ни в одной записи — значения по умолчанию заведомо корректны
+        return [default] * len(rows)
+    raw = [row.get(field, default) for row in rows]
+    column = rule.fast(raw)
+    if _SLOW not in column:
+        return column
+    for position in [position for position, value in enumerate(column) if value is _SLOW]:
+        value = raw[position]
+        if value is _MISSING:
+            issues.append(Issue(indices[position], rule.field,
+                                f"Отсутствует обязательное поле '{rule.field}'"))
+            continue
+        try:
+            column[position] = rule.validate(value)
+        except (TypeError, ValueError) as error:
+            issues.append(Issue(indices[position], rule.field, str(error)))
+    return column
+
+
+def _mapping_rows(rows: Sequence[Any], issues: List[Issue]) -> List[int]:
+    """Номера записей-словарей (для остальных записей добавляются ошибки)"""
+    indices = []
+    for index, row in enumerate(rows):
+        if type(row) is dict or isinstance(row, Mapping):
+            indices.append(index)
+        else:
+            issues.append(Issue(index, "", f"Запись должна быть словарем, получен тип: {type(row)}"))
+    return indices
+
+
+def build_clients(rows: Sequence[Mapping[str, Any]]) -> Tuple[List[Client], List[Issue]]:
+    """
+    Пакетная проверка записей клиентов и создание клиентов
+
+    Записи — словари с полями аргументов конструктора Client. Кроме
+    проверок конструктора, в наборе не должно быть повторяющихся имен
+    (без учета регистра).
+
+    Args:
+        rows (Sequence[Mapping[str, Any]]): Записи клиентов
+
+    Returns:
+        Tuple[List[Client], List[Issue]]: Клиенты для корректных записей (в
+            порядке записей) и ошибки, упорядоченные по номеру записи
+    """
+    issues: List[Issue] = []
+    indices = _mapping_rows(rows, issues)
+    selected = [rows[index] for index in indices]
+    present = set().union(*selected)
+    columns = [_check_column(selected, indices, rule, issues, present) for rule in _CLIENT_RULES]
+
+    clients: List[Client] = []
+    invalid = {issue.row for issue in issues}
+    seen: Dict[str, int] = {}
+    create = Client.from_validated
+    for index, values in zip(indices, zip(*columns)):
+        if invalid and index in invalid:
+            continue
+        if values[7] is not None and values[8] is not None:
+            try:
+                Client._validate_time_window(values[7], values[8])
+            except ValueError as error:
+                issues.append(Issue(index, "deadline", str(error)))
+                continue
+        key = values[0].lower()
+        if key in seen:
+            issues.append(Issue(index, "name", f"Клиент с именем '{values[0]}' уже есть "
+                                               f"в записи {seen[key]}"))
+            continue
+        try:
+            client = create(*values)
+        except (ValueError, OverflowError) as error:
+            # Бесконечные и неопределенные (nan) числа не переводятся в
+            # целые единицы — как и в конструкторе
+            issues.append(Issue(index, "", str(error)))
+            continue
+        seen[key] = index
+        clients.append(client)
+    issues.sort(key=lambda issue: issue.row)
+    return clients, issues
+
+
+def build_vehicles(rows: Sequence[Mapping[str, Any]]) -> Tuple[List[Vehicle], List[Issue]]:
+    """
+    Пакетная проверка записей транспорта и создание транспортных средств
+
+    Записи — словари с полем 'type' (имя класса: 'Vehicle', 'Van' или
+    'Ship'; по умолчанию 'Vehicle'), полями аргументов конструктора и
+    необязательным сохраненным 'vehicle_id', который не должен повторяться
+    в наборе.
+
+    Args:
+        rows (Sequence[Mapping[str, Any]]): Записи транспорта
+
+    Returns:
+        Tuple[List[Vehicle], List[Issue]]: Транспорт для корректных записей
+            (в порядке записей) и ошибки, упорядоченные по номеру записи
+    """
+    issues: List[Issue] = []
+    by_type: Dict[str, List[int]] = {}
+    for index in _mapping_rows(rows, issues):
+        vehicle_type = rows[index].get("type", "Vehicle")
+        if type(vehicle_type) is not str or vehicle_type not in _VEHICLE_TYPES:
+            issues.append(Issue(index, "type", f"Неизвестный тип транспорта: {vehicle_type}. "
+                                               f"Допустимые значения: {', '.join(_VEHICLE_TYPES)}"))
+            continue
+        by_type.setdefault(vehicle_type, []).append(index)
+
+    # Столбцы проверяются по типам: у каждого типа свой набор полей
+    checked: List[Tuple[int, type, tuple]] = []
+    for vehicle_type, indices in by_type.items():
+        cls, extra_rules = _VEHICLE_TYPES[vehicle_type]
+        selected = [rows[index] for index in indices]
+        present = set().union(*selected)
+        columns = [_check_column(selected, indices, rule, issues, present)
+                   for rule in _VEHICLE_RULES + extra_rules]
+        checked.extend((index, cls, values) for index, values in zip(indices, zip(*columns)))
+    checked.sort(key=lambda item: item[0])
+
+    vehicles: List[Vehicle] = []
+    invalid = {issue.row for issue in issues}
+    seen: Dict[str, int] = {}
+    for index, cls, values in checked:
+        if index in invalid:
+            continue
+        vehicle_id = rows[index].get("vehicle_id")
+        if vehicle_id is not None:
+            if type(vehicle_id) is not str or not vehicle_id:
+                issues.append(Issue(index, "vehicle_id", f"ID транспорта должен быть непустой "
+                                                         f"строкой. Получено: {vehicle_id!r}"))
+                continue
+            if vehicle_id in seen:
+                issues.append(Issue(index, "vehicle_id", f"Транспорт с ID {vehicle_id} уже есть "
+                                                         f"в записи {seen[vehicle_id]}"))
+                continue
+        capacity, volume_capacity, pallet_slots, dispatch_cost, *extra = values
+        try:
+            vehicle = cls.from_validated(capacity, *extra, volume_capacity=volume_capacity,
+                                         pallet_slots=pallet_slots, dispatch_cost=dispatch_cost,
+                                         vehicle_id=vehicle_id)
+        except (ValueError, OverflowError) as error:
+            issues.append(Issue(index, "", str(error)))
+            continue
+        if vehicle_id is not None:
+            seen[vehicle_id] = index
+        vehicles.append(vehicle)
+    issues.sort(key=lambda issue: issue.row)
+    return vehicles, issues
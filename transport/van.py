@@ -1,22 +1,68 @@
+from typing import Optional
+
+from .compatibility import REFRIGERATED, ROAD
 from .vehicle import Vehicle
 
 
 class Van(Vehicle):
     """Класс фургона, наследующий от Vehicle"""
     
-    def __init__(self, capacity: float, is_refrigerated: bool = False):
+    def __init__(self, capacity: float, is_refrigerated: bool = False,
+                 volume_capacity: Optional[float] = None, pallet_slots: Optional[int] = None,
+                 dispatch_cost: Optional[float] = None):
         """
         Инициализация фургона
         
         Args:
             capacity (float): Грузоподъемность в тоннах
             is_refrigerated (bool, optional): Наличие холодильника. По умолчанию False.
+            volume_capacity (float, optional): Вместимость по объему в м³.
+                По умолчанию не ограничена.
+            pallet_slots (int, optional): Число паллетомест. По умолчанию не ограничено.
+            dispatch_cost (float, optional): Стоимость одного рейса. По умолчанию не задана.
         """
-        super().__init__(capacity)
-        self.is_refrigerated = self._validate_is_refrigerated(is_refrigerated)
+        super().__init__(capacity, volume_capacity, pallet_slots, dispatch_cost)
+        self._is_refrigerated = self._validate_is_refrigerated(is_refrigerated)
         self.vehicle_type = "Фургон"
     
-    def _validate_is_refrigerated(self, is_refrigerated: bool) -> bool:
+    @classmethod
+    def from_validated(cls, capacity: float, is_refrigerated: bool = False,
+                       volume_capacity: Optional[float] = None, pallet_slots: Optional[int] = None,
+                       dispatch_cost: Optional[float] = None,
+                       vehicle_id: Optional[str] = None) -> "Van":
+        """
+        Создание фургона из заведомо корректных данных без проверок
+        (см. Vehicle.from_validated)
+        
+        Args:
+            capacity (float): Грузоподъемность в тоннах
+            is_refrigerated (bool, optional): Наличие холодильника. По умолчанию False.
+            volume_capacity (float, optional): Вместимость по объему в м³. По умолчанию не ограничена.
+            pallet_slots (int, optional): Число паллетомест. По умолчанию не ограничено.
+            dispatch_cost (float, optional): Стоимость одного рейса. По умолчанию не задана.
+            vehicle_id (str, optional): Сохраненный идентификатор. По умолчанию выдается новый.
+        
+        Returns:
+            Van: Новое транспортное средство
+        """
+        vehicle = super().from_validated(capacity, volume_capacity, pallet_slots,
+                                         dispatch_cost, vehicle_id)
+        vehicle._is_refrigerated = is_refrigerated
+        vehicle.vehicle_type = "Фургон"
+        return vehicle
+    
+    @property
+    def is_refrigerated(self) -> bool:
+        """Наличие холодильника"""
+        return self._is_refrigerated
+    
+    @is_refrigerated.setter
+    def is_refrigerated(self, is_refrigerated: bool) -> None:
+        self._is_refrigerated = self._validate_is_refrigerated(is_refrigerated)
+        self._notify_observers("change", [])
+    
+    @staticmethod
+    def _validate_is_refrigerated(is_refrigerated: bool) -> bool:
         """
         Валидация флага наличия холодильника
         
@@ -34,23 +80,14 @@ class Van(Vehicle):
                           f"получен тип: {type(is_refrigerated)}")
         return is_refrigerated
     
-    def can_transport(self, client) -> bool:
+    def capabilities(self) -> int:
         """
-        Проверка возможности транспортировки груза клиента
+        Маска возможностей фургона: наземная перевозка и, при наличии, холодильник
         
-        Args:
-            client: Объект клиента
-            
         Returns:
-            bool: True если можно транспортировать
+            int: Битовая маска возможностей
         """
-        # Базовая проверка грузоподъемности
-        if not self.can_load_cargo(client.cargo_weight):
-            return False
-        
-        # Дополнительные проверки для фургона
-        # Например, можно добавить проверки на температурные требования груза
-        return True
+        return (ROAD | REFRIGERATED) if self.is_refrigerated else ROAD
     
     def get_refrigerator_info(self) -> str:
         """
@@ -0,0 +1,152 @@
+"""
+Векторная упаковка грузов: вес, объем и паллетоместа одновременно.
+
+Груз описывается вектором потребностей (граммы, см³, паллеты), транспорт —
+вектором грузоподъемности. Если измерение у транспорта не задано, его
+емкость считается неограниченной (UNLIMITED), а незаданное измерение груза
+равно нулю. При одном только весе результат совпадает с packing.first_fit.
+"""
+
+from typing import List, Sequence, Tuple
+
+UNLIMITED = 1 << 62
+
+Vector = Tuple[int, ...]
+
+
+def _size_keys(demands: Sequence[Vector], vip_flags: Sequence[bool],
+               capacities: Sequence[Vector]) -> List[int]:
+    """
+    Порядок обработки: VIP в первую очередь, затем по убыванию «размера» груза
+
+    Размер — наибольшая доля груза от суммарной емкости транспорта среди
+    всех ограниченных измерений (норма L∞), поэтому первыми идут грузы,
+    дефицитные хотя бы по одному измерению.
+
+    Args:
+        demands (Sequence[Vector]): Векторы потребностей грузов
+        vip_flags (Sequence[bool]): VIP-статусы клиентов
+        capacities (Sequence[Vector]): Векторы грузоподъемности транспорта
+
+    Returns:
+        List[int]: Индексы клиентов в порядке загрузки
+    """
+    dimensions = len(demands[0]) if demands else 0
+    totals = []
+    for d in range(dimensions):
+        total = sum(min(c[d], UNLIMITED) for c in capacities)
+        # Измерение, неограниченное хотя бы у одного транспорта, в норме не участвует
+        totals.append(total if 0 < total < UNLIMITED else 0)
+
+    def size(i: int) -> float:
+        return max((demands[i][d] / totals[d] for d in range(dimensions) if totals[d]), default=0.0)
+
+    return sorted(range(len(demands)), key=lambda i: (not vip_flags[i], -size(i)))
+
+
+class _VectorTree:
+    """Дерево отрезков с максимумами остатков по каждому измерению"""
+
+    def __init__(self, values: Sequence[Vector]):
+        """
+        Инициализация дерева
+
+        Args:
+            values (Sequence[Vector]): Начальные остатки емкости транспорта
+        """
+        size = 1
+        while size < max(len(values), 1):
+            size *= 2
+        self.size = size
+        self.dimensions = len(values[0]) if values else 1
+        self.trees = []
+        for d in range(self.dimensions):
+            tree = [-1] * (2 * size)
+            tree[size:size + len(values)] = [v[d] for v in values]
+            for i in range(size - 1, 0, -1):
+                tree[i] = max(tree[2 * i], tree[2 * i + 1])
+            self.trees.append(tree)
+
+    def _covers(self, node: int, need: Vector) -> bool:
+        """Может ли в поддереве найтись лист с остатком не меньше need"""
+        return all(tree[node] >= amount for tree, amount in zip(self.trees, need))
+
+    def find_first(self, need: Vector) -> int:
+        """
+        Поиск самого левого листа, остаток которого не меньше need по всем измерениям
+
+        Поддеревья, где максимум хотя бы одного измерения меньше потребности,
+        отсекаются; обход возвращается назад, только если максимумы по
+        отдельности достаточны, а подходящего листа нет.
+
+        Args:
+            need (Vector): Вектор потребностей
+
+        Returns:
+            int: Индекс листа или -1, если подходящего нет
+        """
+        stack = [1]
+        while stack:
+            node = stack.pop()
+            if not self._covers(node, need):
+                continue
+            if node >= self.size:
+                return node - self.size
+            stack.append(2 * node + 1)
+            stack.append(2 * node)
+        return -1
+
+    def update(self, index: int, value: Vector) -> None:
+        """
+        Обновление остатка листа
+
+        Args:
+            index (int): Индекс листа
+            value (Vector): Новый вектор остатков
+        """
+        for tree, amount in zip(self.trees, value):
+            i = index + self.size
+            tree[i] = amount
+            i //= 2
+            while i:
+                tree[i] = max(tree[2 * i], tree[2 * i + 1])
+                i //= 2
+
+
+def vector_first_fit(demands: Sequence[Vector], vip_flags: Sequence[bool],
+                     capacities: Sequence[Vector]) -> List[int]:
+    """
+    Векторный «первый подходящий» по убыванию нормы (VIP первыми)
+
+    Args:
+        demands (Sequence[Vector]): Векторы потребностей грузов
+        vip_flags (Sequence[bool]): VIP-статусы клиентов
+        capacities (Sequence[Vector]): Векторы грузоподъемности транспорта
+
+    Returns:
+        List[int]: Индекс транспорта для каждого клиента (-1 если груз не загружен)
+    """
+    assignment = [-1] * len(demands)
+    if not demands:
+        return assignment
+    remaining = [tuple(c) for c in capacities]
+    tree = _VectorTree(remaining)
+    # Транспорт, в который по какому-то измерению не влезет даже самый малый
+    # груз, убирается из дерева, чтобы поиск не возвращался к нему впустую
+    smallest = tuple(map(min, zip(*demands)))
+    exhausted = (-1,) * len(smallest)
+
+    for i in _size_keys(demands, vip_flags, capacities):
+        need = demands[i]
+        vehicle_index = tree.find_first(need)
+        if vehicle_index < 0:
+            continue
+        left = tuple(r - n for r, n in zip(remaining[vehicle_index], need))
+        remaining[vehicle_index] = left
+        if any(r < m for r, m in zip(left, smallest)):
+            tree.update(vehicle_index, exhausted)
+        else:
+            tree.update(vehicle_index, left)
+        assignment[i] = vehicle_index
+
+    return assignment
@@ -1,22 +1,270 @@
-import uuid
-from typing import List
+import threading
+from collections import deque
+from contextlib import nullcontext
+from typing import List, Optional, Tuple
 from .client import Client
+from .compatibility import ROAD, is_compatible
+from .events import CargoLoaded, CargoUnloaded, EventBus
+from .id_allocator import IdAllocator, vehicle_ids
+from .manifest import LoadedCargo, Manifest
+from .units import GRAMS_PER_KG, GRAMS_PER_TON, cm3_to_m3, kg_to_grams, m3_to_cm3, tons_to_grams
+from .vector_packing import UNLIMITED
+
+# Ограничение на максимальную грузоподъемность (1000 тонн)
+MAX_CAPACITY_TONS = 1000
 
 
 class Vehicle:
     """Базовый класс для транспортного средства"""
     
-    def __init__(self, capacity: float):
+    # Счетчик идентификаторов (можно заменить, например, счетчиком с сегментом процесса)
+    id_allocator: IdAllocator = vehicle_ids
+    
+    def __init__(self, capacity: float, volume_capacity: Optional[float] = None,
+                 pallet_slots: Optional[int] = None, dispatch_cost: Optional[float] = None):
         """
         Инициализация транспортного средства
         
         Args:
             capacity (float): Грузоподъемность в тоннах
+            volume_capacity (float, optional): Вместимость по объему в м³.
+                По умолчанию не ограничена.
+            pallet_slots (int, optional): Число паллетомест. По умолчанию не ограничено.
+            dispatch_cost (float, optional): Стоимость одного рейса. По умолчанию не задана.
+        """
+        capacity = self._validate_capacity(capacity)
+        volume_capacity = self._validate_volume_capacity(volume_capacity)
+        pallet_slots = self._validate_pallet_slots(pallet_slots)
+        dispatch_cost = self._validate_dispatch_cost(dispatch_cost)
+        self._init_validated(capacity, volume_capacity, pallet_slots, dispatch_cost)
+    
+    def _init_validated(self, capacity: float, volume_capacity: Optional[float],
+                        pallet_slots: Optional[int], dispatch_cost: Optional[float],
+                        vehicle_id: Optional[str] = None) -> None:
+        """Заполнение атрибутов проверенными значениями (общая часть __init__ и from_validated)"""
+        self.vehicle_id = self._generate_vehicle_id() if vehicle_id is None else vehicle_id
+        self._capacity_g = tons_to_grams(capacity)
+        self._load_g = 0
+        self._volume_capacity_cm3 = None if volume_capacity is None else m3_to_cm3(volume_capacity)
+        self._pallet_slots = pallet_slots
+        self._dispatch_cost = dispatch_cost
+        self._volume_used_cm3 = 0
+        self._pallets_used = 0
+        self._manifest = Manifest()  # грузы с весом, объемом и паллетами, по имени клиента за O(1)
+        self._lock = nullcontext()
+        self._observers = []
+        self._events: Optional[EventBus] = None
+        # Оповещения, ожидающие доставки, и признак того, что какой-то поток их доставляет
+        self._pending = deque()
+        self._delivering = False
+    
+    @classmethod
+    def from_validated(cls, capacity: float, volume_capacity: Optional[float] = None,
+                       pallet_slots: Optional[int] = None, dispatch_cost: Optional[float] = None,
+                       vehicle_id: Optional[str] = None) -> "Vehicle":
+        """
+        Создание транспортного средства из заведомо корректных данных без проверок
+        
+        Только для данных, уже прошедших проверку (transport.validation) или
+        взятых из объектов и снимков самого пакета. Внешний ввод передается
+        в конструктор.
+        
+        Args:
+            capacity (float): Грузоподъемность в тоннах
+            volume_capacity (float, optional): Вместимость по объему в м³. По умолчанию не ограничена.
+            pallet_slots (int, optional): Число паллетомест. По умолчанию не ограничено.
+            dispatch_cost (float, optional): Стоимость одного рейса. По умолчанию не задана.
+            vehicle_id (str, optional): Сохраненный идентификатор. По умолчанию выдается новый.
+        
+        Returns:
+            Vehicle: Новое транспортное средство
+        """
+        vehicle = cls.__new__(cls)
+        vehicle._init_validated(capacity, volume_capacity, pallet_slots, dispatch_cost, vehicle_id)
+        return vehicle
+    
+    @property
+    def capacity(self) -> float:
+        """Грузоподъемность в тоннах"""
+        return self._capacity_g / GRAMS_PER_TON
+    
+    @capacity.setter
+    def capacity(self, tons: float) -> None:
+        self._capacity_g = tons_to_grams(self._validate_capacity(tons))
+        self._notify_observers("change", [])
+    
+    @property
+    def capacity_g(self) -> int:
+        """Грузоподъемность в граммах"""
+        return self._capacity_g
+    
+    @property
+    def current_load(self) -> float:
+        """Текущая загрузка в тоннах"""
+        return self._load_g / GRAMS_PER_TON
+    
+    @current_load.setter
+    def current_load(self, tons: float) -> None:
+        self._load_g = tons_to_grams(tons)
+        self._notify_observers("change", [])
+    
+    @property
+    def clients_list(self) -> Manifest:
+        """Загруженные клиенты в порядке загрузки (последовательность только для чтения)"""
+        return self._manifest
+    
+    @property
+    def current_load_g(self) -> int:
+        """Текущая загрузка в граммах"""
+        return self._load_g
+    
+    @property
+    def volume_capacity(self) -> Optional[float]:
+        """Вместимость по объему в м³ (None, если не ограничена)"""
+        return None if self._volume_capacity_cm3 is None else cm3_to_m3(self._volume_capacity_cm3)
+    
+    @property
+    def pallet_slots(self) -> Optional[int]:
+        """Число паллетомест (None, если не ограничено)"""
+        return self._pallet_slots
+    
+    @pallet_slots.setter
+    def pallet_slots(self, pallet_slots: Optional[int]) -> None:
+        self._pallet_slots = self._validate_pallet_slots(pallet_slots)
+        self._notify_observers("change", [])
+    
+    @property
+    def dispatch_cost(self) -> Optional[float]:
+        """Стоимость одного рейса (None, если не задана)"""
+        return self._dispatch_cost
+    
+    @dispatch_cost.setter
+    def dispatch_cost(self, dispatch_cost: Optional[float]) -> None:
+        self._dispatch_cost = self._validate_dispatch_cost(dispatch_cost)
+        self._notify_observers("change", [])
+    
+    @property
+    def volume_used(self) -> float:
+        """Занятый объем в м³"""
+        return cm3_to_m3(self._volume_used_cm3)
+    
+    @property
+    def pallets_used(self) -> int:
+        """Занятые паллетоместа"""
+        return self._pallets_used
+    
+    def has_dimension_limits(self) -> bool:
+        """
+        Проверка, ограничены ли объем или паллетоместа
+        
+        Returns:
+            bool: True если задано хотя бы одно ограничение кроме грузоподъемности
+        """
+        return self._volume_capacity_cm3 is not None or self._pallet_slots is not None
+    
+    def capacity_vector(self) -> Tuple[int, int, int]:
+        """
+        Вектор полной грузоподъемности для векторной упаковки
+        
+        Returns:
+            Tuple[int, int, int]: (граммы, см³, паллетоместа); неограниченные
+                измерения равны vector_packing.UNLIMITED
+        """
+        return (self._capacity_g,
+                UNLIMITED if self._volume_capacity_cm3 is None else self._volume_capacity_cm3,
+                UNLIMITED if self.pallet_slots is None else self.pallet_slots)
+    
+    def enable_thread_safety(self) -> None:
+        """
+        Включение потокобезопасного режима: загрузка и выгрузка
+        выполняются под собственной блокировкой транспортного средства
+        """
+        if isinstance(self._lock, nullcontext):
+            self._lock = threading.RLock()
+    
+    @property
+    def events(self) -> EventBus:
+        """
+        Шина событий транспорта: CargoLoaded и CargoUnloaded (при полной
+        выгрузке — одним пакетом). Создается при первом обращении; события
+        доставляются после снятия блокировки транспорта, в порядке изменений
+        (см. add_observer).
         """
-        self.vehicle_id = self._generate_vehicle_id()
-        self.capacity = self._validate_capacity(capacity)
-        self.current_load = 0.0
-        self.clients_list: List[Client] = []
+        if self._events is None:
+            self._events = EventBus()
+        return self._events
+    
+    def add_observer(self, callback) -> None:
+        """
+        Подписка на изменения загрузки транспортного средства
+        
+        Изменения ставятся в очередь под блокировкой транспорта, а подписчики
+        вызываются после ее снятия, строго в порядке изменений. Поэтому
+        подписчик может захватывать другие блокировки (например, читать
+        компанию). Если очередь уже доставляет другой поток, оповещение
+        доставит он, и изменивший транспорт поток не ждет подписчиков.
+        
+        Args:
+            callback: Функция callback(vehicle, event, cargo), где event —
+                'load', 'unload', 'reset' или 'change' (изменены параметры
+                транспорта: грузоподъемность, загрузка, паллетоместа,
+                стоимость рейса, холодильник), а cargo — список пар
+                (клиент, вес в кг) затронутых грузов (пустой для 'change')
+        """
+        self._observers.append(callback)
+    
+    def remove_observer(self, callback) -> None:
+        """
+        Отписка от изменений загрузки
+        
+        Args:
+            callback: Ранее подписанная функция
+        """
+        if callback in self._observers:
+            self._observers.remove(callback)
+    
+    def _notify_observers(self, event: str, cargo: List[Tuple[Client, float]]) -> None:
+        """
+        Оповещение подписчиков об изменении (вызывается без блокировки транспорта)
+        
+        Args:
+            event (str): Тип изменения
+            cargo (List[Tuple[Client, float]]): Затронутые грузы (клиент, вес в кг)
+        """
+        with self._lock:
+            self._pending.append((event, cargo))
+        self._deliver_notifications()
+    
+    def _deliver_notifications(self) -> None:
+        """
+        Доставка оповещений из очереди (вызывается после снятия блокировки транспорта)
+        
+        Очередь разбирает один поток за раз, поэтому подписчики видят
+        изменения в том же порядке, в каком они произошли.
+        """
+        with self._lock:
+            if self._delivering:
+                return
+            self._delivering = True
+        try:
+            while True:
+                with self._lock:
+                    if not self._pending:
+                        self._delivering = False
+                        return
+                    event, cargo = self._pending.popleft()
+                for callback in list(self._observers):
+                    callback(self, event, cargo)
+                if self._events is not None and cargo:
+                    event_type = CargoLoaded if event == "load" else CargoUnloaded
+                    with self._events.batch():
+                        for client, weight in cargo:
+                            self._events.publish(event_type(self, client, weight))
+        except BaseException:
+            # Оставшиеся оповещения доставит следующее изменение
+            with self._lock:
+                self._delivering = False
+            raise
     
     def _generate_vehicle_id(self) -> str:
         """
@@ -25,9 +273,10 @@ class Vehicle:
         Returns:
             str: Уникальный идентификатор
         """
-        return str(uuid.uuid4())[:8]  # Берем первые 8 символов UUID
+        return self.id_allocator.allocate()
     
-    def _validate_capacity(self, capacity: float) -> float:
+    @staticmethod
+    def _validate_capacity(capacity: float) -> float:
         """
         Валидация грузоподъемности
         
@@ -47,12 +296,108 @@ class Vehicle:
         if capacity <= 0:
             raise ValueError(f"Грузоподъемность должна быть положительным числом. Получено: {capacity}")
         
-        if capacity > 1000:  # Ограничение на максимальную грузоподъемность (1000 тонн)
+        if capacity > MAX_CAPACITY_TONS:
             raise ValueError(f"Грузоподъемность слишком большая. Максимально допустимая грузоподъемность: 1000 тонн. Получено: {capacity}")
         
         return float(capacity)
     
-    def _validate_client(self, client) -> None:
+    @staticmethod
+    def _validate_volume_capacity(volume_capacity: Optional[float]) -> Optional[float]:
+        """
+        Валидация вместимости по объему
+        
+        Args:
+            volume_capacity (float, optional): Объем в м³ для проверки
+            
+        Returns:
+            float: Проверенный объем или None
+            
+        Raises:
+            TypeError: Если объем не является числом
+            ValueError: Если объем не положительный
+        """
+        if volume_capacity is None:
+            return None
+        
+        if isinstance(volume_capacity, bool) or not isinstance(volume_capacity, (int, float)):
+            raise TypeError(f"Объем должен быть числом, получен тип: {type(volume_capacity)}")
+        
+        if volume_capacity <= 0:
+            raise ValueError(f"Вместимость по объему должна быть положительным числом. Получено: {volume_capacity}")
+        
+        return float(volume_capacity)
+    
+    @staticmethod
+    def _validate_pallet_slots(pallet_slots: Optional[int]) -> Optional[int]:
+        """
+        Валидация числа паллетомест
+        
+        Args:
+            pallet_slots (int, optional): Число паллетомест для проверки
+            
+        Returns:
+            int: Проверенное число или None
+            
+        Raises:
+            TypeError: Если значение не является целым числом
+            ValueError: Если число паллетомест не положительное
+        """
+        if pallet_slots is None:
+            return None
+        
+        if isinstance(pallet_slots, bool) or not isinstance(pallet_slots, int):
+            raise TypeError(f"Число паллетомест должно быть целым числом, получен тип: {type(pallet_slots)}")
+        
+        if pallet_slots <= 0:
+            raise ValueError(f"Число паллетомест должно быть положительным. Получено: {pallet_slots}")
+        
+        return pallet_slots
+    
+    @staticmethod
+    def _validate_dispatch_cost(dispatch_cost: Optional[float]) -> Optional[float]:
+        """
+        Валидация стоимости рейса
+        
+        Args:
+            dispatch_cost (float, optional): Стоимость для проверки
+            
+        Returns:
+            float: Проверенная стоимость или None
+            
+        Raises:
+            TypeError: Если стоимость не является числом
+            ValueError: Если стоимость отрицательная
+        """
+        if dispatch_cost is None:
+            return None
+        
+        if isinstance(dispatch_cost, bool) or not isinstance(dispatch_cost, (int, float)):
+            raise TypeError(f"Стоимость рейса должна быть числом, получен тип: {type(dispatch_cost)}")
+        
+        if dispatch_cost < 0:
+            raise ValueError(f"Стоимость рейса не может быть отрицательной. Получено: {dispatch_cost}")
+        
+        return float(dispatch_cost)
+    
+    def _fits_dimensions(self, volume_cm3: int, pallets: int) -> bool:
+        """
+        Проверка свободного объема и паллетомест
+        
+        Args:
+            volume_cm3 (int): Объем груза в см³
+            pallets (int): Число паллет
+            
+        Returns:
+            bool: True если груз помещается по объему и паллетоместам
+        """
+        if self._volume_capacity_cm3 is not None and self._volume_used_cm3 + volume_cm3 > self._volume_capacity_cm3:
+            return False
+        if self.pallet_slots is not None and self._pallets_used + pallets > self.pallet_slots:
+            return False
+        return True
+    
+    @staticmethod
+    def _validate_client(client) -> None:
         """
         Валидация объекта клиента
         
@@ -65,7 +410,8 @@ class Vehicle:
         if not isinstance(client, Client):
             raise TypeError(f"Ожидается объект класса Client, получен тип: {type(client)}")
     
-    def _validate_cargo_weight(self, weight: float) -> None:
+    @staticmethod
+    def _validate_cargo_weight(weight: float) -> None:
         """
         Валидация веса груза для загрузки
         
@@ -78,6 +424,30 @@ class Vehicle:
         if weight <= 0:
             raise ValueError(f"Вес груза должен быть положительным числом. Получено: {weight}")
     
+    def capabilities(self) -> int:
+        """
+        Маска возможностей транспорта (см. transport.compatibility)
+        
+        Returns:
+            int: Битовая маска возможностей
+        """
+        return ROAD
+    
+    def can_transport(self, client: Client) -> bool:
+        """
+        Проверка возможности транспортировки груза клиента
+        
+        Args:
+            client (Client): Объект клиента
+            
+        Returns:
+            bool: True если транспорт подходит по требованиям и грузоподъемности
+        """
+        if not is_compatible(client.requirements(), self.capabilities()):
+            return False
+        _, volume_cm3, pallets = client.demand_vector()
+        return self.can_load_cargo(client.cargo_weight) and self._fits_dimensions(volume_cm3, pallets)
+    
     def can_load_cargo(self, cargo_weight: float) -> bool:
         """
         Проверка возможности загрузки груза
@@ -88,48 +458,118 @@ class Vehicle:
         Returns:
             bool: True если груз можно загрузить, иначе False
         """
-        weight_in_tons = cargo_weight / 1000  # Конвертируем кг в тонны
-        return (self.current_load + weight_in_tons) <= self.capacity
+        return self._load_g + kg_to_grams(cargo_weight) <= self._capacity_g
     
-    def load_cargo(self, client: Client) -> bool:
+    def load_cargo(self, client: Client, weight: Optional[float] = None) -> bool:
         """
         Загрузка груза клиента в транспортное средство
         
         Args:
             client (Client): Объект клиента
+            weight (float, optional): Вес загружаемой части груза в кг
+                (при разделении груза между несколькими транспортными средствами).
+                По умолчанию загружается весь груз.
             
         Returns:
             bool: True если груз успешно загружен, False если превышена грузоподъемность
             
         Raises:
             TypeError: Если передан не объект класса Client
-            ValueError: Если вес груза клиента некорректный
+            ValueError: Если вес груза клиента или его части некорректный
         """
         # Валидация входных данных
         self._validate_client(client)
         self._validate_cargo_weight(client.cargo_weight)
         
-        # Конвертируем вес из кг в тонны
-        cargo_weight_tons = client.cargo_weight / 1000
+        if weight is None:
+            cargo_weight_g = client.cargo_weight_g
+        else:
+            self._validate_cargo_weight(weight)
+            cargo_weight_g = kg_to_grams(weight)
+            if cargo_weight_g > client.cargo_weight_g:
+                raise ValueError(f"Часть груза ({weight:.2f} кг) больше всего груза клиента "
+                                 f"({client.cargo_weight:.2f} кг)")
+        cargo_weight_kg = cargo_weight_g / GRAMS_PER_KG
+        
+        fits_weight, fits_dimensions, load_g = self._place(client, cargo_weight_g)
+        current_load = load_g / GRAMS_PER_TON
         
         # Проверка на превышение грузоподъемности
-        if not self.can_load_cargo(client.cargo_weight):
-            available_capacity = (self.capacity - self.current_load) * 1000  # Конвертируем обратно в кг
-            print(f"Нельзя загрузить груз весом {client.cargo_weight:.2f} кг. "
+        if not fits_weight:
+            available_capacity = (self._capacity_g - load_g) / GRAMS_PER_KG
+            print(f"Нельзя загрузить груз весом {cargo_weight_kg:.2f} кг. "
                   f"Доступная грузоподъемность: {available_capacity:.2f} кг")
             return False
         
-        # Загрузка груза
-        self.current_load += cargo_weight_tons
-        self.clients_list.append(client)
+        if not fits_dimensions:
+            print(f"Нельзя загрузить груз клиента '{client.name}': "
+                  f"недостаточно свободного объема или паллетомест")
+            return False
         
-        print(f"Груз клиента '{client.name}' успешно загружен. "
-              f"Вес: {client.cargo_weight:.2f} кг")
-        print(f"Текущая загрузка: {self.current_load:.3f} тонн "
-              f"({self.get_current_load_percentage():.1f}% от грузоподъемности)")
+        if cargo_weight_g < client.cargo_weight_g:
+            print(f"Часть груза клиента '{client.name}' успешно загружена. "
+                  f"Вес: {cargo_weight_kg:.2f} из {client.cargo_weight:.2f} кг")
+        else:
+            print(f"Груз клиента '{client.name}' успешно загружен. "
+                  f"Вес: {cargo_weight_kg:.2f} кг")
+        print(f"Текущая загрузка: {current_load:.3f} тонн "
+              f"({current_load / self.capacity * 100:.1f}% от грузоподъемности)")
         
         return True
     
+    def load_validated(self, client: Client, cargo_weight_g: Optional[int] = None) -> bool:
+        """
+        Загрузка груза без проверок и сообщений (для планировщика компании)
+        
+        Клиент и вес заведомо корректны: они взяты из проверенных объектов, а
+        вес части не больше всего груза. Подписчики оповещаются, как и при
+        load_cargo. Для внешнего ввода используется load_cargo.
+        
+        Args:
+            client (Client): Объект клиента
+            cargo_weight_g (int, optional): Вес загружаемой части в граммах.
+                По умолчанию весь груз.
+        
+        Returns:
+            bool: True если груз загружен, False если не поместился
+        """
+        if cargo_weight_g is None:
+            cargo_weight_g = client.cargo_weight_g
+        fits_weight, fits_dimensions, _ = self._place(client, cargo_weight_g)
+        return fits_weight and fits_dimensions
+    
+    def _place(self, client: Client, cargo_weight_g: int) -> Tuple[bool, bool, int]:
+        """
+        Размещение груза (общая часть load_cargo и load_validated)
+        
+        Args:
+            client (Client): Клиент
+            cargo_weight_g (int): Вес загружаемой части в граммах
+        
+        Returns:
+            Tuple[bool, bool, int]: (помещается по весу, помещается по объему и
+                паллетам, загрузка в граммах после попытки)
+        """
+        # Часть груза занимает пропорциональную долю объема и паллет (с округлением вверх)
+        _, volume_cm3, pallets = client.demand_vector()
+        if cargo_weight_g < client.cargo_weight_g:
+            volume_cm3 = -(-volume_cm3 * cargo_weight_g // client.cargo_weight_g)
+            pallets = -(-pallets * cargo_weight_g // client.cargo_weight_g)
+        
+        # Проверка и загрузка выполняются атомарно относительно других потоков
+        with self._lock:
+            fits_weight = self._load_g + cargo_weight_g <= self._capacity_g
+            fits_dimensions = self._fits_dimensions(volume_cm3, pallets)
+            if fits_weight and fits_dimensions:
+                self._load_g += cargo_weight_g
+                self._volume_used_cm3 += volume_cm3
+                self._pallets_used += pallets
+                self._manifest.add(LoadedCargo(client, cargo_weight_g, volume_cm3, pallets))
+                self._pending.append(("load", [(client, cargo_weight_g / GRAMS_PER_KG)]))
+            load_g = self._load_g
+        self._deliver_notifications()
+        return fits_weight, fits_dimensions, load_g
+    
     def unload_cargo(self, client_name: str) -> bool:
         """
         Выгрузка груза клиента из транспортного средства
@@ -140,21 +580,45 @@ class Vehicle:
         Returns:
             bool: True если груз успешно выгружен, False если клиент не найден
         """
-        for i, client in enumerate(self.clients_list):
-            if client.name.lower() == client_name.lower():
-                cargo_weight_tons = client.cargo_weight / 1000
-                self.current_load -= cargo_weight_tons
-                if self.current_load < 0:
-                    self.current_load = 0
-                
-                removed_client = self.clients_list.pop(i)
-                print(f"Груз клиента '{removed_client.name}' успешно выгружен. "
-                      f"Вес: {removed_client.cargo_weight:.2f} кг")
-                return True
+        with self._lock:
+            removed = self._manifest.remove(client_name)
+            if removed is not None:
+                # Вычитаем ровно тот вес, который был загружен
+                self._load_g -= removed.weight_g
+                self._volume_used_cm3 -= removed.volume_cm3
+                self._pallets_used -= removed.pallets
+                self._pending.append(("unload", [(removed.client, removed.weight_g / GRAMS_PER_KG)]))
+        
+        if removed is not None:
+            self._deliver_notifications()
+            print(f"Груз клиента '{removed.client.name}' успешно выгружен. "
+                  f"Вес: {removed.weight_g / GRAMS_PER_KG:.2f} кг")
+            return True
         
         print(f"Клиент с именем '{client_name}' не найден в списке загруженных клиентов")
         return False
     
+    def reset_load(self) -> None:
+        """Полная выгрузка транспортного средства"""
+        with self._lock:
+            removed_cargo = self.get_loaded_cargo()
+            self._load_g = 0
+            self._volume_used_cm3 = 0
+            self._pallets_used = 0
+            self._manifest.clear()
+            self._pending.append(("reset", removed_cargo))
+        self._deliver_notifications()
+    
+    def get_loaded_cargo(self) -> List[Tuple[Client, float]]:
+        """
+        Получение загруженных грузов с фактическим весом
+        
+        Returns:
+            List[Tuple[Client, float]]: Пары (клиент, загруженный вес в кг) в порядке загрузки
+        """
+        with self._lock:
+            return [(cargo.client, cargo.weight_g / GRAMS_PER_KG) for cargo in self._manifest.entries()]
+    
     def get_current_load_percentage(self) -> float:
         """
         Получение процента текущей загрузки
@@ -162,9 +626,9 @@ class Vehicle:
         Returns:
             float: Процент загрузки (0-100)
         """
-        if self.capacity == 0:
+        if self._capacity_g == 0:
             return 0.0
-        return (self.current_load / self.capacity) * 100
+        return (self._load_g / self._capacity_g) * 100
     
     def get_available_capacity(self) -> float:
         """
@@ -173,7 +637,7 @@ class Vehicle:
         Returns:
             float: Доступная грузоподъемность в тоннах
         """
-        return self.capacity - self.current_load
+        return (self._capacity_g - self._load_g) / GRAMS_PER_TON
     
     def get_clients_info(self) -> str:
         """
@@ -188,10 +652,10 @@ class Vehicle:
         info_lines = [f"Загруженные клиенты ({len(self.clients_list)}):"]
         total_weight_kg = 0
         
-        for i, client in enumerate(self.clients_list, 1):
-            info_lines.append(f"{i}. {client.name}: {client.cargo_weight:.2f} кг "
+        for i, (client, weight) in enumerate(self.get_loaded_cargo(), 1):
+            info_lines.append(f"{i}. {client.name}: {weight:.2f} кг "
                              f"{'(VIP)' if client.is_vip else ''}")
-            total_weight_kg += client.cargo_weight
+            total_weight_kg += weight
         
         info_lines.append(f"\nОбщий вес груза: {total_weight_kg:.2f} кг "
                          f"({total_weight_kg / 1000:.3f} тонн)")
@@ -210,4 +674,10 @@ class Vehicle:
                 f"Грузоподъемность: {self.capacity:.3f} тонн\n"
                 f"Текущая загрузка: {self.current_load:.3f} тонн ({load_percentage:.1f}%)\n"
                 f"Доступно: {self.get_available_capacity():.3f} тонн\n"
-                f"Клиентов загружено: {len(self.clients_list)}")
\ No newline at end of file
+                + (f"Объем: {self.volume_used:.3f}/{self.volume_capacity:.3f} м³\n"
+                   if self.volume_capacity is not None else "")
+                + (f"Паллетоместа: {self.pallets_used}/{self.pallet_slots}\n"
+                   if self.pallet_slots is not None else "")
+                + (f"Стоимость рейса: {self.dispatch_cost:.2f}\n"
+                   if self.dispatch_cost is not None else "")
+                + f"Клиентов загружено: {len(self.clients_list)}")
\ No newline at end of file